@@ -1,3 +1,4 @@
-from .library import Library
-
-__all__ = ['Library']
\ No newline at end of file
+from .library import Library
+from .library_snapshot import LibrarySnapshot
+
+__all__ = ['Library', 'LibrarySnapshot']
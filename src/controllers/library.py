@@ -1,317 +1,897 @@
-from datetime import datetime
-from models.person import Admin, Librarian, Member
-from models.book import Book
-from models.transaction import BorrowTransaction, ReturnTransaction
-from utils.database import Database
-from utils.validator import Validator
-from utils.search_engine import SearchEngine
-from utils.report_generator import ReportGenerator
-
-
-class Library:
-    def __init__(self):
-        self._books = []
-        self._users = []
-        self._transactions = []
-        self._database = Database()
-        self._next_book_id = 1
-        self._next_user_id = 1
-        self._next_transaction_id = 1
-        self.load_all_data()
-    
-    def load_all_data(self): #load data from (folder librry_data) in the attributes and increment the id by 1
-        self._books = self._database.load_books() #Load books from database(books.json) in the list (self._books = [])
-        self._users = self._database.load_users() 
-        self._transactions = self._database.load_transactions()
-        if self._books:
-            self._next_book_id = max([b.get_book_id() for b in self._books]) + 1
-        if self._users:
-            self._next_user_id = max([u.get_person_id() for u in self._users]) + 1
-        if self._transactions:
-            self._next_transaction_id = max([t.get_transaction_id() for t in self._transactions]) + 1
-
-    #method 2
-    def save_all_data(self):   #It tells the database to save everything (books, users, and transactions) at (library-data)folder.
-        self._database.save_books(self._books)
-        self._database.save_users(self._users)
-        self._database.save_transactions(self._transactions)
-    
-    def add_book(self, title, author, isbn, category, publication_year):          #adds a new book to the library, but only after validating the input data.
-        if not Validator.validate_non_empty(title):    #it's a static method from (validator.py) 
-            return False, "Title cannot be empty"
-        if not Validator.validate_non_empty(author):
-            return False, "Author cannot be empty"
-        if not Validator.validate_isbn(isbn):
-            return False, "Invalid ISBN format"
-        if not Validator.validate_year(publication_year):
-            return False, "Invalid publication year"
-        
-        book = Book(self._next_book_id, title, author, isbn, category, publication_year) #Instantiates a new book 
-        self._books.append(book) #add the new book in the list
-        self._next_book_id += 1
-        self.save_all_data() #call method 2 to save the new book in library data (books.json)
-        return True, f"Book added successfully with ID: {book.get_book_id()}"
-    
-    def remove_book(self, book_id):   #Removes a book only if it exists and only if it is not currently borrowed
-        for book in self._books:
-            if book.get_book_id() == book_id:
-                if not book.get_is_available():
-                    return False, "Cannot remove borrowed book"   #if not exist
-                self._books.remove(book)  #if exist remove the book
-                self.save_all_data() 
-                return True, "Book removed successfully"
-        return False, "Book not found"
-    
-    def update_book(self, book_id, title=None, author=None, category=None):             #to update the book informations
-        for book in self._books:
-            if book.get_book_id() == book_id:
-                if title:
-                    book.set_title(title)
-                if author:
-                    book.set_author(author)
-                if category:
-                    book.set_category(category)
-                self.save_all_data()
-                return True, "Book updated successfully"
-        return False, "Book not found"                          #if no matching book ID exists
-    
-    def get_all_books(self):              #Returns all books in the library.
-        return self._books
-    
-    def get_book_by_id(self, book_id):         #Finds and returns one specific book by its ID.
-        for book in self._books:
-            if book.get_book_id() == book_id:
-                return book
-        return None
-    
-    def add_admin(self, name, email, phone, admin_level):      #adds a new admin but only after validating the input data.
-        if not Validator.validate_email(email):
-            return False, "Invalid email format"
-        if not Validator.validate_phone(phone):
-            return False, "Invalid phone format"
-
-     #Admin is a subclass from person  
-        admin = Admin(self._next_user_id, name, email, phone, admin_level)
-        self._users.append(admin)         #Adds admin to the users list
-        self._next_user_id += 1
-        self.save_all_data()         #Calls Database.save_users() and writes changes to (users.json)
-        return True, f"Admin added successfully with ID: {admin.get_person_id()}"
-    
-    def add_librarian(self, name, email, phone, employee_id, shift):
-        if not Validator.validate_email(email):
-            return False, "Invalid email format"
-        if not Validator.validate_phone(phone):
-            return False, "Invalid phone format"
-            
-    #Librarian is a subclass from person 
-        librarian = Librarian(self._next_user_id, name, email, phone, employee_id, shift)
-        self._users.append(librarian)
-        self._next_user_id += 1
-        self.save_all_data()
-        return True, f"Librarian added successfully with ID: {librarian.get_person_id()}"
-    
-    def add_member(self, name, email, phone):
-        if not Validator.validate_email(email):
-            return False, "Invalid email format"
-        if not Validator.validate_phone(phone):
-            return False, "Invalid phone format"
-            
-    #Member is a subclass from person 
-        membership_date = datetime.now().strftime("%Y-%m-%d")                    #Generate membership date (year-month-day)
-        member = Member(self._next_user_id, name, email, phone, membership_date)
-        self._users.append(member)
-        self._next_user_id += 1
-        self.save_all_data()
-        return True, f"Member added successfully with ID: {member.get_person_id()}"
-    
-    def remove_user(self, user_id):
-        for user in self._users:
-            if user.get_person_id() == user_id:
-                if isinstance(user, Member) and user.get_borrowed_books_count() > 0:  #Checks:if the user a Member? and Do they currently have borrowed books?
-                    return False, "Cannot remove member with borrowed books"
-                self._users.remove(user)
-                self.save_all_data()
-                return True, "User removed successfully"
-        return False, "User not found"
-    
-    def get_all_users(self):        #Returns all users in the library.
-        return self._users
-    
-    def get_user_by_id(self, user_id):   #Finds one user by ID.
-        for user in self._users:              #search about the id in the list
-            if user.get_person_id() == user_id:
-                return user
-        return None
-    
-    def get_all_members(self):            #Returns only Member users.
-        return [user for user in self._users if isinstance(user, Member)]
-    
-    def borrow_book(self, book_id, member_id, borrow_period=14):
-        book = self.get_book_by_id(book_id)      #Returns a Book by using the method that call(get_book_by_id)
-        if not book:
-            return False, "Book not found"
-        
-        member = self.get_user_by_id(member_id)        #Returns a member by using the method that call(get_user_by_id)
-        if not member or not isinstance(member, Member):   #cheak if exist and if actually a Member
-            return False, "Member not found"
-        
-        if not member.get_is_active():                #Check if member is active
-            return False, "Member account is inactive"
-        
-        if not member.can_borrow_more():            #Check borrow limit (5books)
-            return False, f"Member has reached maximum borrow limit ({member.get_max_books()} books)"
-        
-        if member.get_fine_amount() > 0:        #Check unpaid fines
-            return False, f"Member has unpaid fines: ${member.get_fine_amount():.2f}"
-        
-        if not book.get_is_available()
-            return False, "Book is already borrowed"
-        
-        transaction_date = datetime.now().strftime("%Y-%m-%d")       #write the transaction date
-      #BorrowTransaction is a subclass from Transaction  
-        transaction = BorrowTransaction(
-            self._next_transaction_id,
-            book_id,
-            member_id,
-            transaction_date,
-            borrow_period
-        )
-        
-        book.borrow_book(member_id)        #Marks book unavailable & Stores borrower ID
-        member.add_borrowed_book(book_id)     #Tracks borrowed books per member
-        self._transactions.append(transaction) #add in the list 
-        self._next_transaction_id += 1
-        self.save_all_data() #save this transaction in the (transaction.json)
-        return True, f"Book borrowed successfully. Due date: {transaction.get_due_date()}"
-    
-    def return_book(self, book_id, member_id):
-        book = self.get_book_by_id(book_id)    #Returns a Book by using the method that call(get_book_by_id)
-        if not book:
-            return False, "Book not found"
-        
-        member = self.get_user_by_id(member_id)
-        if not member or not isinstance(member, Member):          #cheack if a member only Member type can return books
-            return False, "Member not found"
-        
-        if book.get_is_available():                           #if is available, it is not currently borrowed
-            return False, "Book is not currently borrowed"
-        
-        if book.get_borrower_id() != member_id:              #Ensures correct member returns the book
-            return False, "This book was not borrowed by this member"
-        
-        borrow_transaction = None
-        for trans in self._transactions:
-            if (trans.get_book_id() == book_id and 
-                trans.get_member_id() == member_id and 
-                trans.get_transaction_type() == "borrow" and 
-                trans.get_return_date() is None):
-                borrow_transaction = trans
-                break
-        
-        if not borrow_transaction:
-            return False, "Borrow transaction not found"
-        
-        return_date = datetime.now().strftime("%Y-%m-%d")
-       #ReturnTransaction is a subclass from Transaction
-        return_transaction = ReturnTransaction(
-            self._next_transaction_id,
-            book_id,
-            member_id,
-            return_date,
-            borrow_transaction
-        )
-        
-        fine_amount = return_transaction.get_fine_amount()
-        if fine_amount > 0:
-            member.add_fine(fine_amount)
-        
-        borrow_transaction.set_return_date(return_date)
-        book.return_book()
-        member.remove_borrowed_book(book_id)
-        self._transactions.append(return_transaction)
-        self._next_transaction_id += 1
-        self.save_all_data()
-        
-        if fine_amount > 0:
-            return True, f"Book returned. Fine: ${fine_amount:.2f}"
-        return True, "Book returned successfully"
-    
-    def pay_member_fine(self, member_id, amount):
-        member = self.get_user_by_id(member_id)
-        if not member or not isinstance(member, Member):
-            return False, "Member not found"
-        
-        if amount <= 0:
-            return False, "Invalid payment amount"
-        
-        if amount > member.get_fine_amount():
-            return False, f"Payment amount exceeds fine amount (${member.get_fine_amount():.2f})"
-        
-        member.pay_fine(amount)       #Ensures member cannot overpay.
-        self.save_all_data()       
-        remaining = member.get_fine_amount()
-        return True, f"Payment successful. Remaining fine: ${remaining:.2f}"
-    
-    def get_member_borrowed_books(self, member_id):              #Returns a list of Book objects currently borrowed by a member.
-        member = self.get_user_by_id(member_id)
-        if not member or not isinstance(member, Member):     #if not member
-            return []                                            #return an empty list
-        
-        borrowed_book_ids = member.get_borrowed_books()
-        borrowed_books = []
-        for book_id in borrowed_book_ids:
-            book = self.get_book_by_id(book_id)
-            if book:
-                borrowed_books.append(book)
-        return borrowed_books
-
-  #These delegate search functionality to SearchEngine, which is a utility class.
-    def search_books_by_title(self, title):                                    #Returns books by titles
-        return SearchEngine.search_books_by_title(self._books, title)           
-    
-    def search_books_by_author(self, author) :                                #Returns books by author
-        return SearchEngine.search_books_by_author(self._books, author)
-    
-    def search_books_by_isbn(self, isbn):                                        #Returns books by isbn
-        return SearchEngine.search_books_by_isbn(self._books, isbn)
-    
-    def search_books_by_category(self, category):                                #Returns books by category   
-        return SearchEngine.search_books_by_category(self._books, category)
-    
-    def get_available_books(self):                                                #Returns books currently available
-        return SearchEngine.search_available_books(self._books)
-    
-    def get_borrowed_books(self):                                                 #Returns books currently borrowed
-        return SearchEngine.search_borrowed_books(self._books)
-    
-    def search_users_by_name(self, name):                                         #Returns users with matching names
-        return SearchEngine.search_user_by_name(self._users, name)
-    
-    def get_members_with_fines(self):                                             #Returns members who owe fines
-        return SearchEngine.search_members_with_fines(self._users)
-    
-    def generate_most_borrowed_report(self, top_n=10):                             #Returns the top N most borrowed books
-        return ReportGenerator.generate_most_borrowed_books(self._books, top_n)
-    
-    def generate_active_members_report(self):                                    #Returns members who borrow the most
-        return ReportGenerator.generate_active_members_report(self._users)
-    
-    def generate_overdue_report(self):                                         #Returns books past due date
-        return ReportGenerator.generate_overdue_books_report(self._transactions, self._books, self._users)
-    
-    def generate_fine_revenue_report(self):                                      #Returns total fines collected
-        return ReportGenerator.generate_fine_revenue_report(self._users)
-    
-    def generate_category_report(self):                                            #Returns count of books by category
-        return ReportGenerator.generate_books_by_category_report(self._books)
-    
-    def get_all_transactions(self):                       #Returns all transactions, borrow and return.
-        return self._transactions
-    
-    def get_member_transactions(self, member_id):     #Returns only transactions for a specific member.
-        member_transactions = []
-        for trans in self._transactions:
-            if trans.get_member_id() == member_id:
-                member_transactions.append(trans)
-        return member_transactions
-
+import bisect
+import copy
+import heapq
+import threading
+import weakref
+from datetime import datetime
+from models.person import Admin, Librarian, Member
+from models.book import Book
+from models.transaction import BorrowTransaction, ReturnTransaction
+from controllers.library_snapshot import LibrarySnapshot
+from utils.database import Database
+from utils.events import EventBus, BookAdded, BookUpdated, BookRemoved, UserAdded, UserRemoved, Borrowed, Returned, FinePaid
+from utils.background_writer import BackgroundWriter
+from utils.bulk_io import batched, write_records
+from utils.rwlock import ReadWriteLock, reads, writes
+from utils.search_index import CompletionIndex, TokenIndex, tokenize
+from utils.validator import Validator
+from utils.search_engine import SearchEngine
+from utils.report_generator import ReportGenerator
+
+
+class Library:
+    #Public methods run under self._lock: @writes methods change several objects and indexes at once,
+    #so readers never see half a borrow or return. Single dict lookups (get_book_by_id...) need no lock.
+    #Searches, reports and exports read a LibrarySnapshot instead and never wait for writers: while a
+    #snapshot is alive, a writer changes a copy of a record (see _writable) and leaves the original alone.
+    def __init__(self, database=None):
+        self._books_by_id = {}          #id -> object; these dicts are the stores and keep load/insertion order
+        self._users_by_id = {}
+        self._transactions_by_id = {}
+        self._books_by_isbn = {}        #normalized ISBN-13 -> book, so scanned ISBNs are found in O(1)
+        self._title_index = TokenIndex(lambda book_id: self._books_by_id[book_id].get_title())   #word -> ids of books with it in the title
+        self._author_index = TokenIndex(lambda book_id: self._books_by_id[book_id].get_author())
+        self._category_index = TokenIndex(lambda book_id: self._books_by_id[book_id].get_category())   #for ranking only
+        self._name_index = TokenIndex(lambda user_id: self._users_by_id[user_id].get_name())
+        self._title_completions = CompletionIndex()     #sorted distinct titles, for search-as-you-type
+        self._author_completions = CompletionIndex()
+        self._open_loans = {}           #(book_id, member_id) -> borrow transaction that has not been returned
+        self._open_loans_by_book = {}   #book_id -> that same transaction; a book has at most one open loan
+        self._transaction_ids_by_member = {}   #member_id -> ascending ids of that member's in-memory transactions
+        self._transaction_ids_by_book = {}     #book_id -> ascending ids of that book's in-memory transactions
+        self._database = database if database else Database()   #a custom Database can point at another data folder
+        self._sequences = self._database.get_sequences()   #persistent id counters; ids are never reused
+        self._dirty = {'books': {}, 'users': {}, 'transactions': {}}   #collection -> {record id: record, or None when deleted}
+        self._persist_lock = threading.RLock()    #guards the dirty map against the background writer; always taken after _lock
+        self._lock = ReadWriteLock()              #many concurrent readers, one writer at a time
+        self._events = EventBus()                 #change feed: every committed mutation is published here
+        self._versions = {'books': 0, 'users': 0, 'transactions': 0}   #bumped by every commit that touches the collection
+        self._snapshot_cache = {}                 #name -> (version, tuple) shared by snapshots of the same version
+        self._snapshots = weakref.WeakSet()       #snapshots still in use; while any is alive, writers copy before changing
+        self._owned = {'books': set(), 'users': set(), 'transactions': set()}   #ids copied since the newest snapshot
+        self._snapshot_lock = threading.Lock()    #snapshot() runs under the shared read lock, so readers take turns on the three above
+        self.load_all_data()
+        self._writer = self._create_writer()
+
+    def _create_writer(self):   #Starts a background writer unless the durability policy is 'immediate'
+        policy = self._database.get_setting('durability', 'immediate')
+        if policy == 'immediate':
+            return None
+        return BackgroundWriter(
+            lambda: self.flush_changes("background_flush"),     #takes the read lock, then _persist_lock, like every other path
+            policy,
+            self._database.get_setting('flush_interval_ms', 200),
+            self._database.get_setting('flush_every_ops', 50)
+        )
+    
+    @writes
+    def load_all_data(self): #load data from (folder librry_data) in the attributes and increment the id by 1
+        self._database.verify_snapshots()   #pick one consistent, checksum-verified generation of the data files
+        with self._database.loading():      #the journal is parsed once and replayed into each collection
+            self._books = self._database.load_books() #Load books from database(books.json) in the list (self._books = [])
+            self._users = self._database.load_users() 
+            self._lazy_history = self._database.is_lazy_history()
+            if self._lazy_history:          #only open loans are needed by returns, overdue reports and member dashboards
+                self._transactions = self._database.query_transactions(open_only=True)
+            else:
+                self._transactions = self._database.load_transactions()
+        self._rebuild_indexes()
+        if self._database.is_partitioned():
+            self._repair_loans()
+        self._check_sequences()
+        self._bump_versions(self._versions)
+
+    def _check_sequences(self):      #Seeds the id sequences on the first run and moves them past any stored id
+        indexes = {'books': self._books_by_id, 'users': self._users_by_id, 'transactions': self._transactions_by_id}
+        for collection, index in indexes.items():
+            if collection == 'transactions' and self._lazy_history:     #closed loans are not in memory
+                last_id = self._database.get_last_transaction_id()
+            else:
+                last_id = max(index, default=0)
+            if self._sequences.has(collection):          #the data may be newer than the stored sequence (e.g. restored files)
+                self._sequences.skip_past(collection, last_id)
+            else:
+                self._sequences.seed(collection, last_id)
+
+    def _repair_loans(self):        #Partitions are written before the books and users (see Database.save_changes), so after a crash in between the stored loans win
+        changed = {}
+        for book in self._books:
+            loan = self._open_loans_by_book.get(book.get_book_id())
+            holder = loan.get_member_id() if loan else None
+            if book.get_is_available() == (loan is None) and book.get_borrower_id() == holder:
+                continue
+            book.return_book()
+            if loan:
+                book.borrow_book(holder)
+            changed[('books', book.get_book_id())] = book
+        lent = {}
+        for (book_id, member_id) in self._open_loans:
+            lent.setdefault(member_id, set()).add(book_id)
+        for member in self._users:
+            if not isinstance(member, Member):
+                continue
+            expected = lent.get(member.get_person_id(), set())
+            listed = set(member.get_borrowed_books())
+            if listed == expected:
+                continue
+            for book_id in listed - expected:       #the return was stored, the member's record was not: apply its fine too
+                member.remove_borrowed_book(book_id)
+                returns = self._database.query_transactions(member_id=member.get_person_id(), book_id=book_id,
+                                                            transaction_type="return")
+                if returns and returns[-1].get_fine_amount() > 0:
+                    member.add_fine(returns[-1].get_fine_amount())
+            for book_id in sorted(expected - listed):
+                member.add_borrowed_book(book_id)
+            changed[('users', member.get_person_id())] = member
+        if not changed:
+            return
+        for (collection, record_id), record in changed.items():
+            self._mark_dirty(collection, record_id, record)
+        self.flush_changes("repair_loans")
+        print(f"Repaired {len(changed)} books and members to match the stored loans")
+
+    def _rebuild_indexes(self):      #Builds the id stores and indexes from the loaded lists
+        self._books_by_id = {book.get_book_id(): book for book in self._books}
+        self._books_by_isbn = {}
+        self._title_index.clear()
+        self._author_index.clear()
+        self._category_index.clear()
+        self._title_completions.clear()
+        self._author_completions.clear()
+        for book in self._books:            #if stored data already holds a duplicate ISBN, the oldest book keeps the key
+            self._books_by_isbn.setdefault(Validator.normalize_isbn(book.get_isbn()), book)
+        self._index_book_texts(self._books)
+        self._users_by_id = {user.get_person_id(): user for user in self._users}
+        self._name_index.clear()
+        for user in self._users:
+            self._name_index.add(user.get_person_id(), user.get_name())
+        self._transactions_by_id = {}
+        self._open_loans = {}
+        self._open_loans_by_book = {}
+        self._transaction_ids_by_member = {}
+        self._transaction_ids_by_book = {}
+        for trans in sorted(self._transactions, key=lambda t: t.get_transaction_id()):
+            self._index_transaction(trans)
+            if trans.get_transaction_type() == "borrow" and trans.get_return_date() is None:
+                self._add_open_loan(trans)
+        self._books = self._books_by_id.values()        #live, ordered views of the stores
+        self._users = self._users_by_id.values()
+        self._transactions = self._transactions_by_id.values()
+
+    def _index_book_texts(self, books):     #Indexes the words of the books' titles, authors and categories and adds them to the completions
+        for book in books:
+            self._title_index.add(book.get_book_id(), book.get_title())
+            self._author_index.add(book.get_book_id(), book.get_author())
+            self._category_index.add(book.get_book_id(), book.get_category())
+        self._title_completions.add_all(book.get_title() for book in books)     #one sort for a whole batch
+        self._author_completions.add_all(book.get_author() for book in books)
+
+    def _unindex_book_text(self, book):     #Must run before the title, author or category changes
+        self._title_index.remove(book.get_book_id(), book.get_title())
+        self._author_index.remove(book.get_book_id(), book.get_author())
+        self._category_index.remove(book.get_book_id(), book.get_category())
+        self._title_completions.remove(book.get_title())
+        self._author_completions.remove(book.get_author())
+
+    def _index_transaction(self, trans):    #Ids only ever grow, so appending keeps the per-member/per-book lists sorted
+        self._transactions_by_id[trans.get_transaction_id()] = trans
+        self._transaction_ids_by_member.setdefault(trans.get_member_id(), []).append(trans.get_transaction_id())
+        self._transaction_ids_by_book.setdefault(trans.get_book_id(), []).append(trans.get_transaction_id())
+
+    def _unindex_transaction(self, trans):
+        del self._transactions_by_id[trans.get_transaction_id()]
+        self._transaction_ids_by_member[trans.get_member_id()].remove(trans.get_transaction_id())
+        self._transaction_ids_by_book[trans.get_book_id()].remove(trans.get_transaction_id())
+
+    def _add_open_loan(self, trans):
+        self._open_loans[(trans.get_book_id(), trans.get_member_id())] = trans
+        self._open_loans_by_book[trans.get_book_id()] = trans
+
+    def _remove_open_loan(self, trans):
+        self._open_loans.pop((trans.get_book_id(), trans.get_member_id()), None)
+        self._open_loans_by_book.pop(trans.get_book_id(), None)
+
+    def _find_duplicate_isbn(self, isbn):        #Returns an error message if a stored book already has this ISBN
+        existing = self._books_by_isbn.get(Validator.normalize_isbn(isbn))
+        if existing:
+            return f"A book with this ISBN already exists (ID: {existing.get_book_id()})"
+        return None
+
+    @reads
+    def get_open_loan(self, book_id, member_id=None):     #Returns the open borrow transaction of a book (optionally for one member), or None
+        if member_id is None:
+            return self._open_loans_by_book.get(book_id)
+        return self._open_loans.get((book_id, member_id))
+
+    @reads
+    def get_open_loans(self):            #Returns every borrow transaction that has not been returned, oldest first
+        return list(self._open_loans.values())
+
+    @reads
+    def snapshot(self):      #Returns a LibrarySnapshot of the current state; O(1) when nothing changed since the last one
+        with self._snapshot_lock:
+            books = self._cached_tuple('books', self._versions['books'], self._books)
+            users = self._cached_tuple('users', self._versions['users'], self._users)
+            transactions = self._cached_tuple('transactions', self._versions['transactions'], self._transactions)
+            open_loans = self._cached_tuple('open_loans', self._versions['transactions'], self._open_loans.values())
+            snapshot = LibrarySnapshot(sum(self._versions.values()), books, users, transactions, open_loans)
+            for ids in self._owned.values():        #every current record is now visible to a snapshot
+                ids.clear()
+            self._snapshots.add(snapshot)
+        return snapshot
+
+    def _cached_tuple(self, name, version, records):     #Called with _snapshot_lock held
+        cached = self._snapshot_cache.get(name)
+        if cached is None or cached[0] != version:
+            cached = (version, tuple(records))
+            self._snapshot_cache[name] = cached
+        return cached[1]
+
+    def _bump_versions(self, collections):
+        for collection in collections:
+            self._versions[collection] += 1
+
+    def _writable(self, collection, record):     #Returns the record to change in place, copying it first if a live snapshot can see it
+        index = {'books': self._books_by_id, 'users': self._users_by_id, 'transactions': self._transactions_by_id}[collection]
+        record_id = self._record_id(collection, record)
+        live = index[record_id]
+        if not self._snapshots or record_id in self._owned[collection]:
+            return live
+        copied = copy.deepcopy(live)
+        index[record_id] = copied               #replacing a key keeps its place in the store
+        self._owned[collection].add(record_id)
+        if collection == 'books':
+            isbn = Validator.normalize_isbn(copied.get_isbn())
+            if self._books_by_isbn.get(isbn) is live:
+                self._books_by_isbn[isbn] = copied
+        elif collection == 'transactions' and self._open_loans_by_book.get(copied.get_book_id()) is live:
+            self._add_open_loan(copied)
+        return copied
+
+    @reads
+    def check_invariants(self):      #Returns a list of inconsistencies between books, members and open loans (empty when all agree)
+        problems = []
+        for book in self._books:
+            book_id = book.get_book_id()
+            loan = self._open_loans_by_book.get(book_id)
+            if book.get_is_available():
+                if book.get_borrower_id() is not None or loan:
+                    problems.append(f"Book {book_id} is available but has a borrower or an open loan")
+                continue
+            borrower = self._users_by_id.get(book.get_borrower_id())
+            if not isinstance(borrower, Member) or book_id not in borrower.get_borrowed_books():
+                problems.append(f"Book {book_id} is borrowed by {book.get_borrower_id()}, who does not list it")
+            if not loan or loan.get_member_id() != book.get_borrower_id():
+                problems.append(f"Book {book_id} has no open loan for borrower {book.get_borrower_id()}")
+        for member in self._users:
+            if not isinstance(member, Member):
+                continue
+            for book_id in member.get_borrowed_books():
+                book = self._books_by_id.get(book_id)
+                if not book or book.get_borrower_id() != member.get_person_id():
+                    problems.append(f"Member {member.get_person_id()} lists book {book_id}, which is not lent to them")
+            if member.get_borrowed_books_count() > member.get_max_books():
+                problems.append(f"Member {member.get_person_id()} is over the borrow limit")
+        if len(self._open_loans) != len(self._open_loans_by_book):
+            problems.append("Open loan indexes disagree")
+        for loan in self._open_loans.values():
+            if loan.get_return_date() is not None or self._transactions_by_id.get(loan.get_transaction_id()) is not loan:
+                problems.append(f"Open loan {loan.get_transaction_id()} is returned or missing from the history")
+        return problems
+
+    #method 2
+    @reads
+    def save_all_data(self):   #It tells the database to save everything (books, users, and transactions) at (library-data)folder.
+        with self._persist_lock:
+            if self._lazy_history:
+                self.flush_changes()          #history is not in memory, so pending transactions must reach storage first
+            self._database.checkpoint(*self._stored_collections())   #in journal mode this also truncates the journal
+            self._clear_dirty()
+
+    def _stored_collections(self):      #tuple() copies a dict view in one step, so a flush never iterates a store that is changing
+        return tuple(self._books), tuple(self._users), tuple(self._transactions)
+
+    def _record_id(self, collection, record):
+        if collection == 'books':
+            return record.get_book_id()
+        if collection == 'users':
+            return record.get_person_id()
+        return record.get_transaction_id()
+
+    def _mark_dirty(self, collection, record_id, record=None):   #record=None marks the record as deleted
+        with self._persist_lock:
+            self._dirty[collection][record_id] = record
+
+    def _clear_dirty(self):
+        for records in self._dirty.values():
+            records.clear()
+
+    def get_dirty_collections(self):            #Returns the names of collections with unsaved changes
+        return [name for name, records in self._dirty.items() if records]
+
+    def _commit(self, operation, puts=(), deletes=()):   #Marks the mutated records dirty and flushes them (now or in the background)
+        self._bump_versions({collection for collection, _ in puts} | {collection for collection, _ in deletes})
+        for collection, record in puts:
+            self._mark_dirty(collection, self._record_id(collection, record), record)
+        for collection, record_id in deletes:
+            self._mark_dirty(collection, record_id)
+        if self._writer:
+            self._writer.notify()
+        else:
+            self.flush_changes(operation)
+
+    def _publish(self, events):        #Called after _commit while the write lock is held, so sequence order is commit order
+        for event in events:
+            self._events.publish(event)
+
+    def get_event_bus(self):            #Subscribe here to hear about BookAdded, Borrowed, Returned... as they happen
+        return self._events
+
+    def subscribe(self, handler, event_types=None):     #Shortcut for get_event_bus().subscribe; returns a token for unsubscribe
+        return self._events.subscribe(handler, event_types)
+
+    def unsubscribe(self, token):
+        self._events.unsubscribe(token)
+
+    @reads
+    def flush_changes(self, operation="flush"):   #Writes only the dirty records/collections, then forgets them
+        with self._persist_lock:
+            if not self.get_dirty_collections():
+                return
+            self._database.save_changes(operation, self._dirty, self._stored_collections)
+            self._clear_dirty()
+            if self._database.needs_checkpoint():          #Fold the journal into fresh snapshots once it grows long enough
+                self.save_all_data()
+
+    def flush(self):            #Writes every pending change before returning
+        if self._writer:
+            self._writer.flush()
+        else:
+            self.flush_changes()
+
+    def shutdown(self):         #Flushes pending changes, stops the background writer and closes storage
+        if self._writer:
+            self._writer.shutdown()
+            self._writer = None
+        else:
+            self.flush_changes()
+        self._database.close()
+
+    def get_write_stats(self):          #Bytes written by the last operation and in total
+        return self._database.get_write_stats()
+    
+    @writes
+    def add_book(self, title, author, isbn, category, publication_year):          #adds a new book to the library, but only after validating the input data.
+        error = Validator.get_book_error(title, author, isbn, publication_year)    #it's a static method from (validator.py)
+        if not error:
+            error = self._find_duplicate_isbn(isbn)          #the same ISBN in another format (hyphens, ISBN-10) is a duplicate too
+        if error:
+            return False, error
+        
+        book = Book(self._sequences.next_id('books'), title, author, isbn, category, publication_year) #Instantiates a new book 
+        self._books_by_id[book.get_book_id()] = book #add the new book in the store
+        self._books_by_isbn[Validator.normalize_isbn(isbn)] = book
+        self._index_book_texts([book])
+        self._commit("add_book", puts=[("books", book)]) #save the new book in library data (books.json or the journal)
+        self._publish([BookAdded(book_id=book.get_book_id())])
+        return True, f"Book added successfully with ID: {book.get_book_id()}"
+
+    @writes
+    def import_books(self, rows, batch_size=1000):      #Streams book rows (dicts) in batches; returns (imported count, [(row number, error)])
+        imported = 0
+        errors = []
+        for batch in batched(enumerate(rows, 1), batch_size):
+            valid, batch_errors = Validator.validate_book_rows(batch)
+            accepted = []
+            batch_isbns = {}                #normalized ISBN -> row number, for duplicates inside this batch
+            for row_number, row in valid:
+                isbn = Validator.normalize_isbn(row['isbn'])
+                duplicate = self._find_duplicate_isbn(row['isbn'])     #checks stored books and earlier batches
+                if not duplicate and isbn in batch_isbns:
+                    duplicate = f"Duplicate ISBN of row {batch_isbns[isbn]}"
+                if duplicate:
+                    batch_errors.append((row_number, duplicate))
+                    continue
+                batch_isbns[isbn] = row_number
+                accepted.append(row)
+            first_id = self._sequences.allocate('books', len(accepted))     #one block of ids for the whole batch
+            books = [Book(first_id + offset, row['title'], row['author'], row['isbn'], row['category'], row['publication_year'])
+                     for offset, row in enumerate(accepted)]
+            self._books_by_isbn.update((Validator.normalize_isbn(book.get_isbn()), book) for book in books)
+            self._index_book_texts(books)
+            errors.extend(sorted(batch_errors))          #keep the errors in row order
+            self._books_by_id.update((book.get_book_id(), book) for book in books)
+            imported += len(books)
+            self._stage_import([("books", book) for book in books])
+            self._publish(BookAdded(book_id=book.get_book_id()) for book in books)
+        self._finish_import("import_books")
+        return imported, errors
+    
+    @writes
+    def remove_book(self, book_id):   #Removes a book only if it exists and only if it is not currently borrowed
+        book = self._books_by_id.get(book_id)
+        if not book:
+            return False, "Book not found"
+        if not book.get_is_available():
+            return False, "Cannot remove borrowed book"
+        del self._books_by_id[book_id]  #if exist remove the book
+        isbn = Validator.normalize_isbn(book.get_isbn())
+        if self._books_by_isbn.get(isbn) is book:
+            del self._books_by_isbn[isbn]
+        self._unindex_book_text(book)
+        self._commit("remove_book", deletes=[("books", book_id)])
+        self._publish([BookRemoved(book_id=book_id)])
+        return True, "Book removed successfully"
+    
+    @writes
+    def update_book(self, book_id, title=None, author=None, category=None):             #to update the book informations
+        book = self._books_by_id.get(book_id)
+        if not book:
+            return False, "Book not found"                          #if no matching book ID exists
+        book = self._writable("books", book)
+        self._unindex_book_text(book)
+        if title:
+            book.set_title(title)
+        if author:
+            book.set_author(author)
+        if category:
+            book.set_category(category)
+        self._index_book_texts([book])
+        self._commit("update_book", puts=[("books", book)])
+        self._publish([BookUpdated(book_id=book_id)])
+        return True, "Book updated successfully"
+    
+    def get_all_books(self):              #Returns all books in the library (a tuple that later changes do not affect).
+        return self.snapshot().get_all_books()
+    
+    def get_book_by_id(self, book_id):         #Finds and returns one specific book by its ID.
+        return self._books_by_id.get(book_id)
+    
+    @writes
+    def add_admin(self, name, email, phone, admin_level):      #adds a new admin but only after validating the input data.
+        error = Validator.get_contact_error(email, phone)
+        if error:
+            return False, error
+
+     #Admin is a subclass from person  
+        admin = Admin(self._sequences.next_id('users'), name, email, phone, admin_level)
+        self._users_by_id[admin.get_person_id()] = admin         #Adds admin to the users store
+        self._name_index.add(admin.get_person_id(), name)
+        self._commit("add_admin", puts=[("users", admin)])         #writes changes to (users.json) or the journal
+        self._publish([UserAdded(user_id=admin.get_person_id())])
+        return True, f"Admin added successfully with ID: {admin.get_person_id()}"
+    
+    @writes
+    def add_librarian(self, name, email, phone, employee_id, shift):
+        error = Validator.get_contact_error(email, phone)
+        if error:
+            return False, error
+            
+    #Librarian is a subclass from person 
+        librarian = Librarian(self._sequences.next_id('users'), name, email, phone, employee_id, shift)
+        self._users_by_id[librarian.get_person_id()] = librarian
+        self._name_index.add(librarian.get_person_id(), name)
+        self._commit("add_librarian", puts=[("users", librarian)])
+        self._publish([UserAdded(user_id=librarian.get_person_id())])
+        return True, f"Librarian added successfully with ID: {librarian.get_person_id()}"
+    
+    @writes
+    def add_member(self, name, email, phone):
+        error = Validator.get_contact_error(email, phone)
+        if error:
+            return False, error
+            
+    #Member is a subclass from person 
+        membership_date = datetime.now().strftime("%Y-%m-%d")                    #Generate membership date (year-month-day)
+        member = Member(self._sequences.next_id('users'), name, email, phone, membership_date)
+        self._users_by_id[member.get_person_id()] = member
+        self._name_index.add(member.get_person_id(), name)
+        self._commit("add_member", puts=[("users", member)])
+        self._publish([UserAdded(user_id=member.get_person_id())])
+        return True, f"Member added successfully with ID: {member.get_person_id()}"
+
+    @writes
+    def import_members(self, rows, batch_size=1000):    #Streams member rows (dicts) in batches; returns (imported count, [(row number, error)])
+        imported = 0
+        errors = []
+        today = datetime.now().strftime("%Y-%m-%d")
+        for batch in batched(enumerate(rows, 1), batch_size):
+            valid, batch_errors = Validator.validate_member_rows(batch)
+            errors.extend(batch_errors)
+            first_id = self._sequences.allocate('users', len(valid))
+            members = [Member(first_id + offset, row['name'], row['email'], row['phone'], row['membership_date'] or today)
+                       for offset, (_, row) in enumerate(valid)]
+            self._users_by_id.update((member.get_person_id(), member) for member in members)
+            for member in members:
+                self._name_index.add(member.get_person_id(), member.get_name())
+            imported += len(members)
+            self._stage_import([("users", member) for member in members])
+            self._publish(UserAdded(user_id=member.get_person_id()) for member in members)
+        self._finish_import("import_members")
+        return imported, errors
+
+    def _stage_import(self, puts):      #Marks one imported batch dirty; incremental storage writes it right away
+        self._bump_versions({collection for collection, _ in puts})
+        for collection, record in puts:
+            self._mark_dirty(collection, self._record_id(collection, record), record)
+        if puts and self._database.has_incremental_writes():
+            self.flush_changes("import_batch")
+
+    def _finish_import(self, operation):     #Snapshot storage rewrites whole files, so it is written once at the end
+        if self._writer:
+            self._writer.notify()
+        else:
+            self.flush_changes(operation)
+    
+    @writes
+    def remove_user(self, user_id):
+        user = self._users_by_id.get(user_id)
+        if not user:
+            return False, "User not found"
+        if isinstance(user, Member) and user.get_borrowed_books_count() > 0:  #Checks:if the user a Member? and Do they currently have borrowed books?
+            return False, "Cannot remove member with borrowed books"
+        del self._users_by_id[user_id]
+        self._name_index.remove(user_id, user.get_name())
+        self._commit("remove_user", deletes=[("users", user_id)])
+        self._publish([UserRemoved(user_id=user_id)])
+        return True, "User removed successfully"
+    
+    def get_all_users(self):        #Returns all users in the library (a tuple that later changes do not affect).
+        return self.snapshot().get_all_users()
+    
+    def get_user_by_id(self, user_id):   #Finds one user by ID.
+        return self._users_by_id.get(user_id)
+    
+    def get_all_members(self):            #Returns only Member users.
+        return self.snapshot().get_all_members()
+    
+    def borrow_book(self, book_id, member_id, borrow_period=14):
+        return self.borrow_books(member_id, [book_id], borrow_period)
+
+    @writes
+    def borrow_books(self, member_id, book_ids, borrow_period=14):   #Checks out a stack of books: validates once, applies all or nothing and persists once
+        member = self.get_user_by_id(member_id)        #Returns a member by using the method that call(get_user_by_id)
+        if not member or not isinstance(member, Member):   #cheak if exist and if actually a Member
+            return False, "Member not found"
+        
+        if not member.get_is_active():                #Check if member is active
+            return False, "Member account is inactive"
+        
+        error = self._check_book_ids(book_ids)
+        if error:
+            return False, error
+        
+        if member.get_borrowed_books_count() + len(book_ids) > member.get_max_books():     #Check borrow limit (5books)
+            if len(book_ids) == 1:
+                return False, f"Member has reached maximum borrow limit ({member.get_max_books()} books)"
+            remaining = member.get_max_books() - member.get_borrowed_books_count()
+            return False, f"Member can borrow only {remaining} more books (limit {member.get_max_books()} books)"
+        
+        if member.get_fine_amount() > 0:        #Check unpaid fines
+            return False, f"Member has unpaid fines: ${member.get_fine_amount():.2f}"
+        
+        books = []
+        for book_id in book_ids:           #every book is checked before anything changes
+            book = self.get_book_by_id(book_id)
+            if not book:
+                return False, self._book_error(book_ids, book_id, "Book not found")
+            if not book.get_is_available():
+                return False, self._book_error(book_ids, book_id, "Book is already borrowed")
+            books.append(book)
+        
+        transaction_date = datetime.now().strftime("%Y-%m-%d")       #write the transaction date
+        member = self._writable("users", member)
+        books = [self._writable("books", book) for book in books]
+        puts = [("users", member)]
+        events = []
+        first_id = self._sequences.allocate('transactions', len(books))      #one block of ids for the whole stack
+        for offset, book in enumerate(books):
+          #BorrowTransaction is a subclass from Transaction  
+            transaction = BorrowTransaction(
+                first_id + offset,
+                book.get_book_id(),
+                member_id,
+                transaction_date,
+                borrow_period
+            )
+            book.borrow_book(member_id)        #Marks book unavailable & Stores borrower ID
+            member.add_borrowed_book(book.get_book_id())     #Tracks borrowed books per member
+            self._index_transaction(transaction) #add in the store
+            self._add_open_loan(transaction)
+            puts += [("books", book), ("transactions", transaction)]
+            events.append(Borrowed(transaction_id=transaction.get_transaction_id(), book_id=book.get_book_id(),
+                                   member_id=member_id, due_date=transaction.get_due_date()))
+        self._commit("borrow_book" if len(books) == 1 else "borrow_books", puts=puts) #one write for the whole stack
+        self._publish(events)
+        if len(books) == 1:
+            return True, f"Book borrowed successfully. Due date: {transaction.get_due_date()}"
+        return True, f"{len(books)} books borrowed successfully. Due date: {transaction.get_due_date()}"
+    
+    def return_book(self, book_id, member_id):
+        return self.return_books([book_id], member_id)
+
+    @writes
+    def return_books(self, book_ids, member_id=None):   #Returns a stack of books all or nothing; without member_id each book goes back from its borrower
+        error = self._check_book_ids(book_ids)
+        if error:
+            return False, error
+        
+        if member_id is not None:
+            member = self.get_user_by_id(member_id)
+            if not member or not isinstance(member, Member):          #cheack if a member only Member type can return books
+                return False, "Member not found"
+        
+        returns = []
+        for book_id in book_ids:           #every book is checked before anything changes
+            book = self.get_book_by_id(book_id)    #Returns a Book by using the method that call(get_book_by_id)
+            if not book:
+                return False, self._book_error(book_ids, book_id, "Book not found")
+            if book.get_is_available():                           #if is available, it is not currently borrowed
+                return False, self._book_error(book_ids, book_id, "Book is not currently borrowed")
+            if member_id is not None and book.get_borrower_id() != member_id:   #Ensures correct member returns the book
+                return False, self._book_error(book_ids, book_id, "This book was not borrowed by this member")
+            borrower = self.get_user_by_id(book.get_borrower_id())
+            if not borrower or not isinstance(borrower, Member):
+                return False, self._book_error(book_ids, book_id, "Member not found")
+            borrow_transaction = self._open_loans.get((book_id, borrower.get_person_id()))   #index lookup instead of scanning the history
+            if not borrow_transaction:
+                return False, self._book_error(book_ids, book_id, "Borrow transaction not found")
+            returns.append((book, borrower, borrow_transaction))
+        
+        return_date = datetime.now().strftime("%Y-%m-%d")
+        puts = []
+        events = []
+        total_fine = 0
+        first_id = self._sequences.allocate('transactions', len(returns))
+        for offset, (book, borrower, borrow_transaction) in enumerate(returns):
+            book = self._writable("books", book)
+            borrower = self._writable("users", borrower)      #a stack from one member copies them only once
+            borrow_transaction = self._writable("transactions", borrow_transaction)
+           #ReturnTransaction is a subclass from Transaction
+            return_transaction = ReturnTransaction(
+                first_id + offset,
+                book.get_book_id(),
+                borrower.get_person_id(),
+                return_date,
+                borrow_transaction
+            )
+            
+            fine_amount = return_transaction.get_fine_amount()
+            if fine_amount > 0:
+                borrower.add_fine(fine_amount)
+                total_fine += fine_amount
+            
+            borrow_transaction.set_return_date(return_date)
+            self._remove_open_loan(borrow_transaction)
+            book.return_book()
+            borrower.remove_borrowed_book(book.get_book_id())
+            if self._lazy_history:                 #closed loans live in storage only
+                self._unindex_transaction(borrow_transaction)
+            else:
+                self._index_transaction(return_transaction)
+            puts += [
+                ("books", book),
+                ("users", borrower),
+                ("transactions", borrow_transaction),
+                ("transactions", return_transaction)
+            ]
+            events.append(Returned(transaction_id=return_transaction.get_transaction_id(),
+                                   borrow_transaction_id=borrow_transaction.get_transaction_id(),
+                                   book_id=book.get_book_id(), member_id=borrower.get_person_id(),
+                                   fine_amount=fine_amount))
+        self._commit("return_book" if len(returns) == 1 else "return_books", puts=puts) #one write for the whole stack
+        self._publish(events)
+        
+        if len(returns) == 1:
+            if total_fine > 0:
+                return True, f"Book returned. Fine: ${total_fine:.2f}"
+            return True, "Book returned successfully"
+        if total_fine > 0:
+            return True, f"{len(returns)} books returned. Fine: ${total_fine:.2f}"
+        return True, f"{len(returns)} books returned successfully"
+
+    def _check_book_ids(self, book_ids):        #Rejects an empty stack or one that lists a book twice
+        if not book_ids:
+            return "No book IDs given"
+        if len(set(book_ids)) != len(book_ids):
+            return "The same book ID was given more than once"
+        return None
+
+    def _book_error(self, book_ids, book_id, message):      #Names the offending book when a stack has several
+        if len(book_ids) == 1:
+            return message
+        return f"Book {book_id}: {message}"
+    
+    @writes
+    def pay_member_fine(self, member_id, amount):
+        member = self.get_user_by_id(member_id)
+        if not member or not isinstance(member, Member):
+            return False, "Member not found"
+        
+        if amount <= 0:
+            return False, "Invalid payment amount"
+        
+        if amount > member.get_fine_amount():
+            return False, f"Payment amount exceeds fine amount (${member.get_fine_amount():.2f})"
+        
+        member = self._writable("users", member)
+        member.pay_fine(amount)       #Ensures member cannot overpay.
+        self._commit("pay_fine", puts=[("users", member)])
+        remaining = member.get_fine_amount()
+        self._publish([FinePaid(member_id=member_id, amount=amount, remaining=remaining)])
+        return True, f"Payment successful. Remaining fine: ${remaining:.2f}"
+    
+    @reads
+    def get_member_borrowed_books(self, member_id):              #Returns a list of Book objects currently borrowed by a member.
+        member = self.get_user_by_id(member_id)
+        if not member or not isinstance(member, Member):     #if not member
+            return []                                            #return an empty list
+        
+        return [self._books_by_id[book_id] for book_id in member.get_borrowed_books() if book_id in self._books_by_id]
+
+  #Title, author and name searches use the word indexes; the rest delegate to SearchEngine through a snapshot,
+  #so they never wait for a borrow or return.
+    @reads
+    def search_books_by_title(self, title):                                    #Returns books whose title contains the text, in catalog (id) order
+        return [self._books_by_id[book_id] for book_id in self._title_index.search(title)]
+    
+    @reads
+    def search_books_by_author(self, author) :                                #Returns books whose author contains the text, in catalog (id) order
+        return [self._books_by_id[book_id] for book_id in self._author_index.search(author)]
+    
+    @reads
+    def search_books_ranked(self, text, field="title", limit=None):             #Returns (the best `limit` matches, best first; how many books matched)
+        #field "title"/"author": the books search_books_by_<field> finds; None: books with a whole word of text
+        #in their title, author or category. Each is scored with BM25 on all three, title and author weighing more.
+        terms = set(tokenize(text))
+        if field is None:
+            candidates, scores = None, {}
+        else:
+            index = {"title": self._title_index, "author": self._author_index}.get(field)
+            if index is None:
+                raise ValueError(f"Cannot rank field: {field}")
+            matches = index.search(text)
+            candidates, scores = set(matches), dict.fromkeys(matches, 0.0)
+        for index, weight in ((self._title_index, 1.0), (self._author_index, 1.0), (self._category_index, 0.5)):
+            index.bm25(terms, candidates, weight, scores)
+        if candidates is None:
+            matches = sorted(scores)
+        #matches are in id order and both selections are stable, so ties keep catalog order
+        if limit:
+            best = heapq.nlargest(limit, matches, key=scores.__getitem__)
+        else:
+            best = sorted(matches, key=scores.__getitem__, reverse=True)
+        return [self._books_by_id[book_id] for book_id in best], len(matches)
+    
+    @reads
+    def search_books_best(self, query, field="title", limit=None):              #Returns (best matches first, how many matched, whether they match exactly)
+        #The views' title/author search: ranked matches, or the closest typo-tolerant ones when nothing matches
+        books, total = self.search_books_ranked(query, field, limit)
+        if books or not query.strip():
+            return books, total, True
+        books = self.fuzzy_search_books(query, field)
+        return (books[:limit] if limit else books), len(books), False
+    
+    @reads
+    def fuzzy_search_books(self, text, field="title", max_distance=2):           #Returns books whose title (or author) words are each within a few typos of the text's words, closest first
+        index = {"title": self._title_index, "author": self._author_index}.get(field)
+        if index is None:
+            raise ValueError(f"Cannot search field: {field}")
+        return [self._books_by_id[book_id] for book_id, distance in index.fuzzy_search(text, max_distance)]
+    
+    @reads
+    def autocomplete(self, prefix, field="title", limit=10):                    #Returns up to limit distinct titles (or authors) starting with prefix, alphabetically
+        completions = {"title": self._title_completions, "author": self._author_completions}.get(field)
+        if completions is None:
+            raise ValueError(f"Cannot complete field: {field}")
+        return completions.complete(prefix, limit)
+    
+    def search_books_by_isbn(self, isbn):                                        #Returns the book with this isbn (any format: hyphens, spaces, ISBN-10) or None
+        return self._books_by_isbn.get(Validator.normalize_isbn(isbn))
+    
+    def search_books_by_category(self, category):                                #Returns books by category   
+        return self.snapshot().search_books_by_category(category)
+    
+    def get_available_books(self):                                                #Returns books currently available
+        return self.snapshot().get_available_books()
+    
+    def get_borrowed_books(self):                                                 #Returns books currently borrowed
+        return self.snapshot().get_borrowed_books()
+    
+    @reads
+    def search_users_by_name(self, name):                                         #Returns users whose name contains the text, in id order
+        return [self._users_by_id[user_id] for user_id in self._name_index.search(name)]
+    
+    def get_members_with_fines(self):                                             #Returns members who owe fines
+        return self.snapshot().get_members_with_fines()
+    
+    def generate_most_borrowed_report(self, top_n=10):                             #Returns the top N most borrowed books
+        return self.snapshot().generate_most_borrowed_report(top_n)
+    
+    def generate_active_members_report(self):                                    #Returns members who borrow the most
+        return self.snapshot().generate_active_members_report()
+    
+    def generate_overdue_report(self):                                         #Returns books past due date
+        return self.snapshot().generate_overdue_report()
+    
+    def generate_fine_revenue_report(self):                                      #Returns total fines collected
+        return self.snapshot().generate_fine_revenue_report()
+    
+    def generate_category_report(self):                                            #Returns count of books by category
+        return self.snapshot().generate_category_report()
+    
+    @reads
+    def query_transactions(self, member_id=None, book_id=None, open_only=False, start_date=None,
+                           end_date=None, transaction_type=None, offset=0, limit=None):   #Returns a filtered page of transactions
+        if open_only or not self._lazy_history:      #open loans are always fully in memory
+            if open_only:
+                source = self.get_open_loans()
+            elif member_id is not None:
+                source = self._transactions_for(self._transaction_ids_by_member.get(member_id, []))
+            elif book_id is not None:
+                source = self._transactions_for(self._transaction_ids_by_book.get(book_id, []))
+            else:
+                source = self._transactions
+            matches = SearchEngine.search_transactions(
+                source, member_id, book_id, open_only, start_date, end_date, transaction_type
+            )
+            return matches[offset:offset + limit] if limit is not None else matches[offset:]
+        self.flush_changes()          #closed history is read from storage, so make sure it is current
+        return self._database.query_transactions(
+            member_id, book_id, open_only, start_date, end_date, transaction_type, offset, limit
+        )
+
+    def _transactions_for(self, transaction_ids):
+        return [self._transactions_by_id[transaction_id] for transaction_id in transaction_ids]
+
+    @reads
+    def get_transaction_page(self, member_id=None, book_id=None, cursor=None, limit=20):   #Returns (page newest first, cursor for the next page or None)
+        if self._lazy_history:          #closed history lives in storage
+            self.flush_changes()
+            return self._database.query_transaction_page(member_id, book_id, cursor, limit)
+        if member_id is not None:
+            ids = self._transaction_ids_by_member.get(member_id, [])
+            if book_id is not None:
+                ids = [i for i in ids if self._transactions_by_id[i].get_book_id() == book_id]
+        elif book_id is not None:
+            ids = self._transaction_ids_by_book.get(book_id, [])
+        else:
+            ids = [trans.get_transaction_id() for trans in self._transactions]
+        end = bisect.bisect_left(ids, cursor) if cursor is not None else len(ids)   #cursor = last id already shown
+        start = max(end - limit, 0)
+        page = self._transactions_for(reversed(ids[start:end]))
+        next_cursor = page[-1].get_transaction_id() if page and start > 0 else None
+        return page, next_cursor
+
+    def export_records(self, collection, start_date=None, end_date=None, category=None, open_only=False):   #Yields one dict per record; nothing is collected into a list
+        if collection == 'transactions' and self._lazy_history and not open_only:
+            self.flush_changes()          #history lives in storage, so stream it from there
+            yield from self._database.export_records(collection, start_date, end_date, category, open_only)
+            return
+        yield from self.snapshot().export_records(collection, start_date, end_date, category, open_only)
+
+    def export_to_file(self, collection, file_path, file_format=None, **filters):   #Streams a collection to CSV/JSONL; returns (success, message)
+        if collection == 'transactions' and self._lazy_history and not filters.get('open_only'):
+            with self._lock.read_locked():        #stored history is read from the files writers append to
+                return self._write_export(collection, file_path, file_format, filters)
+        return self._write_export(collection, file_path, file_format, filters)    #in-memory data is read from a snapshot
+
+    def _write_export(self, collection, file_path, file_format, filters):
+        try:
+            count = write_records(self.export_records(collection, **filters), file_path, file_format,
+                                  Database.FIELDS[collection])
+        except (IOError, ValueError) as e:
+            return False, f"Export failed: {e}"
+        return True, f"Exported {count} {collection} to {file_path}"
+
+    def get_transaction_by_id(self, transaction_id):      #Finds one in-memory transaction by ID (only open loans in lazy mode)
+        return self._transactions_by_id.get(transaction_id)
+
+    def get_all_transactions(self, offset=0, limit=None):                       #Returns all transactions, borrow and return.
+        if offset == 0 and limit is None and not self._lazy_history:
+            return self.snapshot().get_all_transactions()
+        return self.query_transactions(offset=offset, limit=limit)
+    
+    def get_member_transactions(self, member_id, open_only=False, offset=0, limit=None):     #Returns only transactions for a specific member.
+        return self.query_transactions(member_id=member_id, open_only=open_only, offset=offset, limit=limit)
+
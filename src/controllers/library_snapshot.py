@@ -0,0 +1,100 @@
+from models.person import Member
+from utils.search_engine import SearchEngine
+from utils.report_generator import ReportGenerator
+from utils.database import Database
+
+
+class LibrarySnapshot:
+    #A frozen, consistent view of the Library at one version, taken with Library.snapshot().
+    #The Library never changes an object while a snapshot can see it (it changes a copy instead),
+    #so searches, reports and exports run here without locks while desks keep borrowing and returning.
+    def __init__(self, version, books, users, transactions, open_loans):
+        self._version = version
+        self._books = books                    #tuples shared with other snapshots of the same collection version
+        self._users = users
+        self._transactions = transactions      #in-memory transactions (only open loans in lazy mode)
+        self._open_loans = open_loans
+        self._books_by_id = None               #built on first lookup
+        self._users_by_id = None
+
+    def get_version(self):                     #Library change counter at the time the snapshot was taken
+        return self._version
+
+    def get_all_books(self):
+        return self._books
+
+    def get_all_users(self):
+        return self._users
+
+    def get_all_transactions(self):
+        return self._transactions
+
+    def get_open_loans(self):
+        return self._open_loans
+
+    def get_book_by_id(self, book_id):
+        if self._books_by_id is None:
+            self._books_by_id = {book.get_book_id(): book for book in self._books}
+        return self._books_by_id.get(book_id)
+
+    def get_user_by_id(self, user_id):
+        if self._users_by_id is None:
+            self._users_by_id = {user.get_person_id(): user for user in self._users}
+        return self._users_by_id.get(user_id)
+
+    def get_all_members(self):
+        return [user for user in self._users if isinstance(user, Member)]
+
+    def search_books_by_title(self, title):
+        return SearchEngine.search_books_by_title(self._books, title)
+
+    def search_books_by_author(self, author):
+        return SearchEngine.search_books_by_author(self._books, author)
+
+    def search_books_by_category(self, category):
+        return SearchEngine.search_books_by_category(self._books, category)
+
+    def get_available_books(self):
+        return SearchEngine.search_available_books(self._books)
+
+    def get_borrowed_books(self):
+        return SearchEngine.search_borrowed_books(self._books)
+
+    def search_users_by_name(self, name):
+        return SearchEngine.search_user_by_name(self._users, name)
+
+    def get_members_with_fines(self):
+        return SearchEngine.search_members_with_fines(self._users)
+
+    def generate_most_borrowed_report(self, top_n=10):
+        return ReportGenerator.generate_most_borrowed_books(self._books, top_n)
+
+    def generate_active_members_report(self):
+        return ReportGenerator.generate_active_members_report(self._users)
+
+    def generate_overdue_report(self):
+        return ReportGenerator.generate_overdue_books_report(self._open_loans, self._books, self._users)
+
+    def generate_fine_revenue_report(self):
+        return ReportGenerator.generate_fine_revenue_report(self._users)
+
+    def generate_category_report(self):
+        return ReportGenerator.generate_books_by_category_report(self._books)
+
+    def export_records(self, collection, start_date=None, end_date=None, category=None, open_only=False):   #Yields one dict per record of the snapshot
+        category = category.lower() if category else None
+        end_date = Database.inclusive_end_date(end_date)
+        if collection == 'books':
+            for book in self._books:
+                if not category or book.get_category().lower() == category:
+                    yield book.to_dict()
+        elif collection == 'users':
+            for user in self._users:
+                yield user.to_dict()
+        else:
+            book_ids = {book.get_book_id() for book in self._books if book.get_category().lower() == category} if category else None
+            source = self._open_loans if open_only else self._transactions
+            for trans in SearchEngine.search_transactions(source, open_only=open_only,
+                                                          start_date=start_date, end_date=end_date):
+                if book_ids is None or trans.get_book_id() in book_ids:
+                    yield trans.to_dict()
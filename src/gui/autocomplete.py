@@ -0,0 +1,92 @@
+import tkinter as tk
+
+
+class SearchSuggestions:
+    """
+    Search-as-you-type for an Entry: once typing pauses for delay_ms,
+    get_suggestions(text) is asked for completions and they are listed
+    under the entry. Picking one (click, or Down then Return) fills the
+    entry and calls on_choose().
+    """
+
+    NAVIGATION_KEYS = {"Return", "KP_Enter", "Escape", "Up", "Down", "Left", "Right",
+                       "Tab", "Home", "End", "Shift_L", "Shift_R", "Control_L", "Control_R"}
+
+    def __init__(self, entry, get_suggestions, on_choose, delay_ms=250, limit=8):
+        self.entry = entry
+        self.get_suggestions = get_suggestions
+        self.on_choose = on_choose
+        self.delay_ms = delay_ms
+        self.limit = limit
+        self._pending = None        # after() id of the lookup waiting for typing to pause
+        self.listbox = tk.Listbox(entry.winfo_toplevel(), height=limit, activestyle="none")
+
+        entry.bind("<KeyRelease>", self.on_key_release, add="+")
+        entry.bind("<Down>", self.focus_suggestions, add="+")
+        entry.bind("<Escape>", lambda e: self.hide(), add="+")
+        entry.bind("<Return>", lambda e: self.cancel(), add="+")
+        entry.bind("<FocusOut>", self.on_focus_out, add="+")
+        entry.bind("<Destroy>", lambda e: self.cancel(), add="+")
+        self.listbox.bind("<ButtonRelease-1>", self.choose)
+        self.listbox.bind("<Return>", self.choose)
+        self.listbox.bind("<Escape>", lambda e: (self.hide(), self.entry.focus_set()))
+        self.listbox.bind("<FocusOut>", self.on_focus_out)
+
+    def on_key_release(self, event):
+        if event.keysym in self.NAVIGATION_KEYS:
+            return
+        if self._pending:
+            self.entry.after_cancel(self._pending)
+        self._pending = self.entry.after(self.delay_ms, self.refresh)
+
+    def cancel(self):
+        if self._pending:
+            self.entry.after_cancel(self._pending)
+            self._pending = None
+        self.hide()
+
+    def refresh(self):
+        self._pending = None
+        text = self.entry.get().strip()
+        suggestions = self.get_suggestions(text) if text else []
+        if not suggestions:
+            self.hide()
+            return
+        self.listbox.delete(0, tk.END)
+        for suggestion in suggestions[:self.limit]:
+            self.listbox.insert(tk.END, suggestion)
+        self.listbox.config(height=min(len(suggestions), self.limit))
+        self.listbox.place(in_=self.entry, x=0, rely=1.0, relwidth=1.0)
+        self.listbox.lift()
+
+    def hide(self):
+        self.listbox.place_forget()
+
+    def focus_suggestions(self, event=None):
+        if self.listbox.winfo_ismapped():
+            self.listbox.focus_set()
+            self.listbox.selection_clear(0, tk.END)
+            self.listbox.selection_set(0)
+            self.listbox.activate(0)
+        return "break"
+
+    def on_focus_out(self, event):
+        # Focus moves from the entry to the list while picking, so decide once it has settled
+        self.entry.after(100, self.hide_unless_focused)
+
+    def hide_unless_focused(self):
+        if not self.entry.winfo_exists():
+            return
+        focus = self.entry.focus_get()
+        if focus not in (self.entry, self.listbox):
+            self.hide()
+
+    def choose(self, event=None):
+        selection = self.listbox.curselection()
+        if not selection:
+            return
+        self.entry.delete(0, tk.END)
+        self.entry.insert(0, self.listbox.get(selection[0]))
+        self.hide()
+        self.entry.focus_set()
+        self.on_choose()
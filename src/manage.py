@@ -0,0 +1,151 @@
+# ==========================================
+# Project: Library Management System
+# Module: manage.py (Maintenance Commands)
+# ==========================================
+
+import argparse
+import os
+import sys
+
+# Ensuring the 'src' directory is in the system path for seamless imports
+sys.path.insert(0, os.path.join(os.path.dirname(__file__)))
+
+from controllers.library import Library
+from utils.bulk_io import read_records, write_records
+from utils.database import Database
+from utils.sqlite_backend import SQLiteBackend
+
+
+def migrate_sqlite(args):
+    """Bulk-imports the current JSON storage (snapshots, journal and partitions) into a SQLite database"""
+    db_file = args.db or os.path.join(args.data_folder, "library.db")
+    source = Database(args.data_folder, storage="json")
+    backend = SQLiteBackend(db_file)
+    counts = {collection: backend.import_records(collection, source.iter_records(collection))
+              for collection in ("books", "users", "transactions")}
+    backend.close()
+    print(f"Imported {counts['books']} books, {counts['users']} users and "
+          f"{counts['transactions']} transactions into {db_file}")
+    print('Set "storage": "sqlite" in settings.json to start using it.')
+
+
+def compact_transactions(args):
+    """Archives old closed loans into compressed monthly partitions"""
+    database = Database(args.data_folder)
+    database.compact_transactions(args.max_age_days)
+
+
+def import_records(args):
+    """Streams books or members from a CSV/JSONL file into the library"""
+    library = Library(Database(args.data_folder))
+    try:
+        rows = read_records(args.file, args.format)
+        if args.command == "import-books":
+            imported, errors = library.import_books(rows, args.batch_size)
+        else:
+            imported, errors = library.import_members(rows, args.batch_size)
+    finally:
+        library.shutdown()
+    for row_number, error in errors:
+        print(f"Row {row_number}: {error}")
+    print(f"Imported {imported} records, rejected {len(errors)}")
+
+
+def export_records(args):
+    """Streams one collection from storage to a CSV/JSONL file without loading the library"""
+    database = Database(args.data_folder)
+    records = database.export_records(args.collection, args.start_date, args.end_date,
+                                      args.category, args.open_only)
+    count = write_records(records, args.file, args.format, Database.FIELDS[args.collection])
+    database.close()
+    if args.file != "-":
+        print(f"Exported {count} {args.collection} to {args.file}")
+
+
+def serve(args):
+    """Runs one Library as a JSON-RPC service that desks connect to with --connect"""
+    from utils.rpc import LibraryServer
+    LibraryServer(Library(Database(args.data_folder)), args.address, args.workers).run()
+
+
+def run_benchmark(args):
+    """Runs a performance benchmark on a generated data set"""
+    from utils import benchmark
+    if args.suite == "startup":
+        benchmark.benchmark_startup(args.books, args.members, args.transactions, args.rounds)
+    elif args.suite == "checkout":
+        sizes = [int(size) for size in args.sizes.split(",")]
+        benchmark.benchmark_checkout(sizes, args.members, args.operations, args.history)
+    elif args.suite == "stress":
+        problems = benchmark.stress_circulation(args.books, args.members, args.threads, args.operations)
+        if problems:
+            sys.exit(1)
+    elif args.suite == "search":
+        sizes = [int(size) for size in args.sizes.split(",")]
+        benchmark.benchmark_search(sizes, args.members, args.rounds)
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(description="Library Management System maintenance commands")
+    parser.add_argument("--data-folder", default="library_data", help="folder holding the library data")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    migrate = commands.add_parser("migrate-sqlite", help="import the JSON data files into SQLite")
+    migrate.add_argument("--db", help="target database file (default: <data-folder>/library.db)")
+    migrate.set_defaults(handler=migrate_sqlite)
+
+    compact = commands.add_parser("compact-transactions",
+                                  help="move old closed loans into compressed archive partitions")
+    compact.add_argument("--max-age-days", type=int,
+                         help="archive closed loans older than this (default: archive_after_days setting)")
+    compact.set_defaults(handler=compact_transactions)
+
+    for name, kind in (("import-books", "books"), ("import-members", "members")):
+        importer = commands.add_parser(name, help=f"import {kind} from a CSV or JSON-lines file")
+        importer.add_argument("file", help="input file (.csv with a header row, or .jsonl)")
+        importer.add_argument("--format", choices=["csv", "jsonl"], help="override the format implied by the extension")
+        importer.add_argument("--batch-size", type=int, default=1000, help="rows validated and stored per batch")
+        importer.set_defaults(handler=import_records)
+
+    export = commands.add_parser("export", help="stream books, users or transactions to CSV or JSON-lines")
+    export.add_argument("collection", choices=["books", "users", "transactions"])
+    export.add_argument("file", help="output file (.csv or .jsonl), or - for standard output")
+    export.add_argument("--format", choices=["csv", "jsonl"], help="override the format implied by the extension")
+    export.add_argument("--start-date", help="transactions on or after this date (YYYY-MM-DD)")
+    export.add_argument("--end-date", help="transactions on or before this date (YYYY-MM-DD)")
+    export.add_argument("--category", help="books in this category, or transactions of those books")
+    export.add_argument("--open-only", action="store_true", help="only loans that have not been returned")
+    export.set_defaults(handler=export_records)
+
+    server = commands.add_parser("serve", help="serve one shared library to CLI/GUI desks over a local socket")
+    server.add_argument("--address", default="127.0.0.1:8765", help="host:port, or a Unix socket path")
+    server.add_argument("--workers", type=int, default=8, help="threads running library calls")
+    server.set_defaults(handler=serve)
+
+    bench = commands.add_parser("benchmark", help="run a performance benchmark on generated data")
+    bench.add_argument("suite", choices=["startup", "checkout", "stress", "search"],
+                       help="startup: JSON vs binary snapshot load time and peak memory; "
+                            "checkout: borrow/return latency as the catalog grows; "
+                            "stress: concurrent borrows/returns from many threads, then an invariant check; "
+                            "search: indexed title/author/name search and title/author completion against a full scan")
+    bench.add_argument("--books", type=int, default=100000)
+    bench.add_argument("--members", type=int, default=10000)
+    bench.add_argument("--transactions", type=int, default=200000)
+    bench.add_argument("--rounds", type=int, default=3)
+    bench.add_argument("--sizes", default="1000,10000,100000,1000000", help="checkout/search: comma-separated catalog sizes")
+    bench.add_argument("--operations", type=int, default=2000,
+                       help="checkout: borrow/return pairs per size; stress: stack operations per thread")
+    bench.add_argument("--threads", type=int, default=8, help="stress: concurrent worker threads")
+    bench.add_argument("--history", type=int, default=0, help="checkout: closed transactions stored before timing")
+    bench.set_defaults(handler=run_benchmark)
+
+    return parser
+
+
+def main():
+    args = build_parser().parse_args()
+    args.handler(args)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,6 +1,7 @@
-from .database import Database
-from .validator import Validator
-from .search_engine import SearchEngine
-from .report_generator import ReportGenerator
-from .auth import AuthSystem
-__all__ = ['Database', 'Validator', 'SearchEngine', 'ReportGenerator', 'AuthSystem']
+from .database import Database
+from .validator import Validator
+from .search_engine import SearchEngine
+from .report_generator import ReportGenerator
+from .auth import AuthSystem
+from .sqlite_backend import SQLiteBackend
+__all__ = ['Database', 'Validator', 'SearchEngine', 'ReportGenerator', 'AuthSystem', 'SQLiteBackend']
@@ -0,0 +1,88 @@
+# ==========================================
+# Project: Library Management System
+# Module: utils/background_writer.py
+# Purpose: Coalescing Background Persistence Thread
+# ==========================================
+
+import threading
+import time
+
+
+class BackgroundWriter:
+    """
+    Runs a flush callback on a daemon thread so mutations return without
+    waiting for disk I/O. Dirty notifications are coalesced according to
+    the durability policy:
+
+    - 'interval': flush at most once every interval_ms after a change
+    - 'ops': flush once max_ops changes are pending
+    Pending changes are always written by flush() and shutdown().
+    """
+
+    POLICIES = ('interval', 'ops')
+
+    def __init__(self, flush_callback, policy='interval', interval_ms=200, max_ops=50):
+        if policy not in self.POLICIES:
+            raise ValueError(f"Unknown durability policy: {policy}")
+        self._flush_callback = flush_callback
+        self._policy = policy
+        self._interval = max(interval_ms, 0) / 1000.0
+        self._max_ops = max(max_ops, 1)
+        self._condition = threading.Condition()
+        self._pending_ops = 0
+        self._stopping = False
+        self._flushes = 0
+        self._thread = threading.Thread(target=self._run, name="library-writer", daemon=True)
+        self._thread.start()
+
+    def get_policy(self):
+        return self._policy
+
+    def get_flush_count(self):
+        return self._flushes
+
+    def notify(self):
+        """Records one mutation waiting to be written."""
+        with self._condition:
+            self._pending_ops += 1
+            self._condition.notify()
+
+    def _ready(self):
+        if self._stopping:
+            return True
+        if self._policy == 'ops':
+            return self._pending_ops >= self._max_ops
+        return self._pending_ops > 0
+
+    def _run(self):
+        while True:
+            with self._condition:
+                self._condition.wait_for(self._ready)
+                if self._stopping:
+                    return
+            if self._policy == 'interval':
+                time.sleep(self._interval)          # let a burst of changes pile up
+            with self._condition:
+                self._pending_ops = 0
+            self._write()
+
+    def _write(self):
+        try:
+            self._flush_callback()
+            self._flushes += 1
+        except Exception as e:
+            print(f"Error in background writer: {e}")
+
+    def flush(self):
+        """Writes pending changes now, on the calling thread."""
+        with self._condition:
+            self._pending_ops = 0
+        self._write()
+
+    def shutdown(self):
+        """Stops the thread and writes whatever is still pending."""
+        with self._condition:
+            self._stopping = True
+            self._condition.notify()
+        self._thread.join()
+        self.flush()
@@ -0,0 +1,448 @@
+# ==========================================
+# Project: Library Management System
+# Module: utils/benchmark.py
+# Purpose: Performance Benchmarks on Synthetic Data Sets
+# ==========================================
+
+import contextlib
+import functools
+import gc
+import io
+import json
+import os
+import random
+import shutil
+import tempfile
+import threading
+import time
+import tracemalloc
+from datetime import datetime, timedelta
+
+from controllers.library import Library
+from utils.database import Database
+from utils.search_engine import SearchEngine
+from utils.search_index import edit_distance, tokenize, typo_budget
+
+CATEGORIES = ["Fiction", "Science", "History", "Technology", "Philosophy", "Biography", "Poetry", "Children"]
+WORDS = ["river", "night", "garden", "empire", "silent", "machine", "ocean", "winter", "glass", "stone",
+         "shadow", "light", "journey", "secret", "kingdom", "memory", "storm", "city", "forest", "letter"]
+
+
+def generate_records(book_count, member_count, transaction_count, seed=42):
+    """Builds reproducible book, user and transaction dictionaries in the stored format."""
+    rng = random.Random(seed)
+    authors = [f"{rng.choice(WORDS).title()} {rng.choice(WORDS).title()}son" for _ in range(max(book_count // 20, 1))]
+    books = []
+    for book_id in range(1, book_count + 1):
+        books.append({
+            'book_id': book_id,
+            'title': " ".join(rng.choice(WORDS) for _ in range(3)).title(),
+            'author': rng.choice(authors),
+            'isbn': f"978{book_id:010d}",
+            'category': rng.choice(CATEGORIES),
+            'publication_year': rng.randint(1900, 2025),
+            'is_available': True,
+            'borrower_id': None,
+            'total_borrows': 0
+        })
+    users = []
+    for person_id in range(1, member_count + 1):
+        users.append({
+            'person_id': person_id,
+            'name': f"Member {person_id}",
+            'email': f"member{person_id}@library.com",
+            'phone': f"555{person_id:07d}",
+            'role': 'member',
+            'is_active': True,
+            'membership_date': "2024-01-01",
+            'borrowed_books': [],
+            'fine_amount': 0.0,
+            'max_books': 5
+        })
+    transactions = []
+    start = datetime(2020, 1, 1)
+    for transaction_id in range(1, transaction_count + 1):
+        borrowed = start + timedelta(minutes=transaction_id)
+        transactions.append({
+            'transaction_id': transaction_id,
+            'book_id': rng.randint(1, max(book_count, 1)),
+            'member_id': rng.randint(1, max(member_count, 1)),
+            'transaction_type': 'borrow',
+            'transaction_date': borrowed.strftime("%Y-%m-%d %H:%M:%S"),
+            'due_date': (borrowed + timedelta(days=14)).strftime("%Y-%m-%d"),
+            'return_date': (borrowed + timedelta(days=7)).strftime("%Y-%m-%d %H:%M:%S")
+        })
+    return books, users, transactions
+
+
+def write_dataset(data_folder, snapshot_format, books, users, transactions):
+    """Writes the records through Database so the files match what the application produces."""
+    with contextlib.redirect_stdout(io.StringIO()):
+        database = Database(data_folder, snapshot_format=snapshot_format)
+        database.save_books([Database.book_from_dict(record) for record in books])
+        database.save_users([Database.user_from_dict(record) for record in users])
+        database.save_transactions([Database.transaction_from_dict(record) for record in transactions])
+        database.close()
+    return sum(os.path.getsize(os.path.join(data_folder, name)) for name in os.listdir(data_folder)
+               if name.startswith(('books.', 'users.', 'transactions.')) and not name.endswith('.prev'))
+
+
+def measure_startup(data_folder, snapshot_format, trace_memory=False):
+    """Loads every collection the way Library.load_all_data does.
+
+    Returns (seconds, peak traced bytes, records loaded). tracemalloc slows
+    allocation down considerably, so timings are only meaningful untraced.
+    """
+    gc.collect()
+    if trace_memory:
+        tracemalloc.start()
+    started = time.perf_counter()
+    with contextlib.redirect_stdout(io.StringIO()):
+        database = Database(data_folder, snapshot_format=snapshot_format)
+        database.verify_snapshots()
+        books = database.load_books()
+        users = database.load_users()
+        transactions = database.load_transactions()
+        database.close()
+    elapsed = time.perf_counter() - started
+    peak = 0
+    if trace_memory:
+        peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+    loaded = len(books) + len(users) + len(transactions)
+    del books, users, transactions
+    return elapsed, peak, loaded
+
+
+def benchmark_startup(book_count=100000, member_count=10000, transaction_count=200000, rounds=3):
+    """Compares startup time and peak memory of the JSON and binary snapshot formats on one data set."""
+    books, users, transactions = generate_records(book_count, member_count, transaction_count)
+    results = {}
+    root = tempfile.mkdtemp(prefix="library-benchmark-")
+    try:
+        for snapshot_format in Database.SNAPSHOT_FORMATS:
+            folder = os.path.join(root, snapshot_format)
+            size = write_dataset(folder, snapshot_format, books, users, transactions)
+            timings = [measure_startup(folder, snapshot_format)[0] for _ in range(rounds)]
+            _, peak, loaded = measure_startup(folder, snapshot_format, trace_memory=True)
+            results[snapshot_format] = {
+                'file_bytes': size,
+                'best_seconds': min(timings),
+                'peak_bytes': peak,
+                'records': loaded
+            }
+    finally:
+        shutil.rmtree(root, ignore_errors=True)
+
+    print(f"Startup: {book_count} books, {member_count} members, {transaction_count} transactions "
+          f"(best of {rounds})")
+    print(f"{'Format':<8} {'Files (MB)':>11} {'Load (s)':>9} {'Peak (MB)':>10}")
+    for snapshot_format, result in results.items():
+        print(f"{snapshot_format:<8} {result['file_bytes'] / 1e6:>11.1f} {result['best_seconds']:>9.3f} "
+              f"{result['peak_bytes'] / 1e6:>10.1f}")
+    return results
+
+
+def _percentile(timings, fraction):
+    ordered = sorted(timings)
+    return ordered[min(int(len(ordered) * fraction), len(ordered) - 1)]
+
+
+def benchmark_checkout(sizes=(1000, 10000, 100000, 1000000), member_count=1000, operations=2000, history=0):
+    """Times a borrow_book + return_book pair against catalogs of growing size.
+
+    history closed loans are stored up front, to show that returns do not
+    depend on how much transaction history exists. Storage runs in journal mode with checkpoints disabled, so every
+    operation appends one journal line and the timings show the cost of
+    Library's own lookups rather than snapshot rewrites.
+    """
+    results = {}
+    rng = random.Random(7)
+    for book_count in sizes:
+        books, users, transactions = generate_records(book_count, member_count, history)
+        root = tempfile.mkdtemp(prefix="library-benchmark-")
+        try:
+            write_dataset(root, 'binary', books, users, transactions)
+            del books, users, transactions
+            timings = []
+            with contextlib.redirect_stdout(io.StringIO()):
+                database = Database(root, journal_mode=True, checkpoint_interval=float('inf'), snapshot_format='binary')
+                library = Library(database)
+                for _ in range(operations):
+                    book_id = rng.randint(1, book_count)
+                    member_id = rng.randint(1, member_count)
+                    started = time.perf_counter()
+                    library.borrow_book(book_id, member_id)
+                    library.return_book(book_id, member_id)
+                    timings.append(time.perf_counter() - started)
+                library.shutdown()
+            del library, database
+        finally:
+            shutil.rmtree(root, ignore_errors=True)
+        results[book_count] = {
+            'median_us': _percentile(timings, 0.5) * 1e6,
+            'p99_us': _percentile(timings, 0.99) * 1e6
+        }
+        gc.collect()
+
+    print(f"Checkout: borrow + return with {member_count} members, {history} stored transactions, "
+          f"{operations} operations per size")
+    print(f"{'Books':>9} {'Median (us)':>12} {'p99 (us)':>10}")
+    for book_count, result in results.items():
+        print(f"{book_count:>9} {result['median_us']:>12.1f} {result['p99_us']:>10.1f}")
+    return results
+
+
+def wait_for_background_writes(library, settle_seconds=0.1, timeout=30):
+    """Waits until no changes are pending and the write counters stop moving (a checkpoint may still be running)."""
+    deadline = time.perf_counter() + timeout
+    written = None
+    while time.perf_counter() < deadline:
+        if not library.get_dirty_collections():
+            if library.get_write_stats()['total_bytes'] == written:
+                return True
+            written = library.get_write_stats()['total_bytes']
+        else:
+            written = None
+        time.sleep(settle_seconds)
+    return False
+
+
+def stress_circulation(book_count=2000, member_count=200, threads=8, operations=500, seed=11):
+    """Hammers one Library with concurrent stack borrows and returns, then checks its invariants.
+
+    Each worker thread borrows and returns random stacks of books while a
+    reader thread keeps searching, checking invariants and checking that
+    snapshots stay frozen and self-consistent mid-run. Writes go
+    through the background writer in journal mode. Once the workers stop,
+    a copy of what the background writer alone persisted is loaded and
+    checked, and the data is reloaded again after shutdown. Returns a
+    list of invariant violations, which should be empty.
+    """
+    books, users, transactions = generate_records(book_count, member_count, 0)
+    root = tempfile.mkdtemp(prefix="library-stress-")
+    counts = {'borrowed': 0, 'returned': 0, 'rejected': 0, 'checks': 0}
+    problems = []
+    counts_lock = threading.Lock()
+    done = threading.Event()
+    try:
+        write_dataset(root, 'json', books, users, transactions)
+        del books, users, transactions
+        with open(os.path.join(root, "settings.json"), 'w') as f:
+            json.dump({'journal_mode': True, 'checkpoint_interval': 200,
+                       'durability': 'interval', 'flush_interval_ms': 10}, f)
+        with contextlib.redirect_stdout(io.StringIO()):
+            library = Library(Database(root))
+
+            def circulate(worker):
+                rng = random.Random(seed * 1000 + worker)
+                for _ in range(operations):
+                    member_id = rng.randint(1, member_count)
+                    if rng.random() < 0.5:
+                        stack = rng.sample(range(1, book_count + 1), rng.randint(1, 3))
+                        success, _ = library.borrow_books(member_id, stack)
+                        key = 'borrowed'
+                    else:
+                        stack = [book.get_book_id() for book in library.get_member_borrowed_books(member_id)]
+                        success, _ = library.return_books(stack[:rng.randint(1, 3)] or [rng.randint(1, book_count)])
+                        key = 'returned'
+                    with counts_lock:
+                        counts[key if success else 'rejected'] += 1
+
+            def inspect():
+                while not done.is_set():
+                    found = library.check_invariants()
+                    library.search_books_by_title("river")
+                    library.generate_overdue_report()
+                    found.extend(check_snapshot(library.snapshot()))
+                    with counts_lock:
+                        counts['checks'] += 1
+                        problems.extend(found)
+
+            def check_snapshot(snapshot):       #a snapshot must not change while writers carry on, and must agree with itself
+                before = [(book.get_book_id(), book.get_is_available(), book.get_borrower_id())
+                          for book in snapshot.get_all_books()]
+                time.sleep(0.005)
+                after = [(book.get_book_id(), book.get_is_available(), book.get_borrower_id())
+                         for book in snapshot.get_all_books()]
+                found = [] if before == after else [f"Snapshot {snapshot.get_version()} changed while it was read"]
+                lent = sum(1 for _, available, _ in after if not available)
+                if lent != len(snapshot.get_open_loans()):
+                    found.append(f"Snapshot {snapshot.get_version()} has {lent} lent books but "
+                                 f"{len(snapshot.get_open_loans())} open loans")
+                return found
+
+            workers = [threading.Thread(target=circulate, args=(worker,)) for worker in range(threads)]
+            inspector = threading.Thread(target=inspect)
+            started = time.perf_counter()
+            inspector.start()
+            for worker in workers:
+                worker.start()
+            for worker in workers:
+                worker.join()
+            elapsed = time.perf_counter() - started
+            done.set()
+            inspector.join()
+            problems.extend(library.check_invariants())
+            wait_for_background_writes(library)
+            persisted = root + "-persisted"          #copied while the writer is idle, before shutdown flushes anything
+            shutil.copytree(root, persisted)
+            try:
+                midrun = Library(Database(persisted))
+                problems.extend(f"Persisted mid-run: {problem}" for problem in midrun.check_invariants())
+                lent = {book.get_book_id(): book.get_borrower_id() for book in library.get_borrowed_books()}
+                stored = {book.get_book_id(): book.get_borrower_id() for book in midrun.get_borrowed_books()}
+                if lent != stored:
+                    problems.append(f"Persisted mid-run: {len(set(lent.items()) ^ set(stored.items()))} "
+                                    f"loans differ from memory")
+                midrun.shutdown()
+            finally:
+                shutil.rmtree(persisted, ignore_errors=True)
+            library.shutdown()
+            reloaded = Library(Database(root))
+            problems.extend(f"After reload: {problem}" for problem in reloaded.check_invariants())
+            reloaded.shutdown()
+    finally:
+        shutil.rmtree(root, ignore_errors=True)
+
+    print(f"Stress: {threads} threads x {operations} stack operations on {book_count} books, "
+          f"{member_count} members in {elapsed:.2f}s")
+    print(f"Borrowed {counts['borrowed']}, returned {counts['returned']}, rejected {counts['rejected']}, "
+          f"{counts['checks']} invariant checks while running")
+    print(f"Invariant violations: {len(problems)}")
+    for problem in problems[:20]:
+        print(f"  {problem}")
+    return problems
+
+
+SEARCH_QUERIES = [('title', "river"), ('title', "river night"), ('title', "silent machine ocean"),
+                  ('title', "ver nig"), ('title', "iver"), ('title', "zebra"), ('author', "stoneson"),
+                  ('author', "light sh"), ('name', "member 4711"), ('name', "ber 99"), ('name', "4711"),
+                  ('tprefix', "r"), ('tprefix', "river n"), ('tprefix', "silent machine o"), ('aprefix', "sto"),
+                  ('tfuzzy', "rivr nigth"), ('tfuzzy', "silnt machne ocaen"), ('afuzzy', "stonesen")]
+
+
+def _scan_completions(get_text, limit=10):
+    """The search-as-you-type lookup done the old way: every record's text checked against the prefix."""
+    def scan(records, prefix):
+        prefix = prefix.lower()
+        matches = {}
+        for record in records:
+            text = get_text(record)
+            if text.lower().startswith(prefix):
+                matches.setdefault(text.lower(), text)
+        return [matches[key] for key in sorted(matches)[:limit]]
+    return scan
+
+
+def _scan_fuzzy(get_text, max_distance=2):
+    """Typo-tolerant search done by checking every record (distances memoized per word), closest first."""
+    def scan(records, query):
+        words = set(tokenize(query))
+        distances = {}
+        matches = []
+        for record in records:
+            tokens = set(tokenize(get_text(record)))
+            total = 0
+            for word in words:
+                closest = min((distances.setdefault((word, token), edit_distance(word, token))
+                               for token in tokens), default=None)
+                if closest is None or closest > typo_budget(word, max_distance):
+                    break
+                total += closest
+            else:
+                matches.append((total, record))
+        return [record for total, record in sorted(matches, key=lambda match: match[0])]    # stable: ties stay in id order
+    return scan
+
+
+RANKED_QUERIES = [('title', "river"), ('title', "river night"), ('author', "stoneson"), (None, "silent ocean")]
+
+
+SEARCH_FIELDS = {               # field -> (SearchEngine scan, Library lookup, collection scanned)
+    'title': (SearchEngine.search_books_by_title, 'search_books_by_title', 'get_all_books'),
+    'author': (SearchEngine.search_books_by_author, 'search_books_by_author', 'get_all_books'),
+    'name': (SearchEngine.search_user_by_name, 'search_users_by_name', 'get_all_users'),
+    'tprefix': (_scan_completions(lambda book: book.get_title()),
+                lambda library, prefix: library.autocomplete(prefix, "title"), 'get_all_books'),
+    'aprefix': (_scan_completions(lambda book: book.get_author()),
+                lambda library, prefix: library.autocomplete(prefix, "author"), 'get_all_books'),
+    'tfuzzy': (_scan_fuzzy(lambda book: book.get_title()),
+               lambda library, text: library.fuzzy_search_books(text, "title"), 'get_all_books'),
+    'afuzzy': (_scan_fuzzy(lambda book: book.get_author()),
+               lambda library, text: library.fuzzy_search_books(text, "author"), 'get_all_books')
+}
+
+
+def benchmark_search(sizes=(10000, 100000, 1000000), member_count=10000, rounds=20):
+    """Times title, author and user name searches with the word indexes, title/author
+    completion with the sorted completion arrays and typo-tolerant search with
+    the BK-trees, against a full scan; then BM25-ranked search, taking the
+    best 20 with a heap against ranking every match.
+
+    Both must return the same records; a mismatch raises AssertionError.
+    Generated titles use a small vocabulary, so common words match many
+    books and the index mostly pays off on multi-word and rare queries;
+    member names are numbered, so their vocabulary grows with the members.
+    """
+    results, ranked = {}, {}
+    for book_count in sizes:
+        books, users, transactions = generate_records(book_count, member_count, 0)
+        root = tempfile.mkdtemp(prefix="library-benchmark-")
+        try:
+            write_dataset(root, 'binary', books, users, transactions)
+            del books, users, transactions
+            with contextlib.redirect_stdout(io.StringIO()):
+                library = Library(Database(root, snapshot_format='binary'))
+            for field, query in SEARCH_QUERIES:
+                scan, method, collection = SEARCH_FIELDS[field]
+                catalog = getattr(library, collection)()
+                indexed = getattr(library, method) if isinstance(method, str) else functools.partial(method, library)
+                assert scan(catalog, query) == indexed(query), f"results differ for {query!r}"
+                scan_timings, index_timings = [], []
+                for _ in range(rounds):
+                    started = time.perf_counter()
+                    found = scan(catalog, query)
+                    scan_timings.append(time.perf_counter() - started)
+                    started = time.perf_counter()
+                    indexed(query)
+                    index_timings.append(time.perf_counter() - started)
+                results[(book_count, field, query)] = {
+                    'matches': len(found),
+                    'scan_ms': _percentile(scan_timings, 0.5) * 1e3,
+                    'index_ms': _percentile(index_timings, 0.5) * 1e3
+                }
+            for field, query in RANKED_QUERIES:
+                best, total = library.search_books_ranked(query, field, limit=20)
+                assert best == library.search_books_ranked(query, field)[0][:20], f"top 20 differ for {query!r}"
+                sort_timings, heap_timings = [], []
+                for _ in range(rounds):
+                    started = time.perf_counter()
+                    library.search_books_ranked(query, field)
+                    sort_timings.append(time.perf_counter() - started)
+                    started = time.perf_counter()
+                    library.search_books_ranked(query, field, limit=20)
+                    heap_timings.append(time.perf_counter() - started)
+                ranked[(book_count, field or "any", query)] = {
+                    'matches': total,
+                    'sort_ms': _percentile(sort_timings, 0.5) * 1e3,
+                    'heap_ms': _percentile(heap_timings, 0.5) * 1e3
+                }
+            with contextlib.redirect_stdout(io.StringIO()):
+                library.shutdown()
+            del library, catalog, indexed
+        finally:
+            shutil.rmtree(root, ignore_errors=True)
+        gc.collect()
+
+    print(f"Search: median of {rounds} runs per query")
+    print(f"{'Books':>9} {'Field':<7} {'Query':<22} {'Matches':>8} {'Scan (ms)':>10} {'Index (ms)':>11}")
+    for (book_count, field, query), result in results.items():
+        print(f"{book_count:>9} {field:<7} {query!r:<22} {result['matches']:>8} "
+              f"{result['scan_ms']:>10.2f} {result['index_ms']:>11.2f}")
+    print(f"\nRanked search (BM25): median of {rounds} runs per query")
+    print(f"{'Books':>9} {'Field':<7} {'Query':<22} {'Matches':>8} {'All (ms)':>10} {'Top 20 (ms)':>12}")
+    for (book_count, field, query), result in ranked.items():
+        print(f"{book_count:>9} {field:<7} {query!r:<22} {result['matches']:>8} "
+              f"{result['sort_ms']:>10.2f} {result['heap_ms']:>12.2f}")
+    return results, ranked
@@ -0,0 +1,229 @@
+# ==========================================
+# Project: Library Management System
+# Module: utils/binary_snapshot.py
+# Purpose: Compact Binary Snapshot Format with Lazy mmap Decoding
+# ==========================================
+
+import json
+import mmap
+import struct
+
+# File layout (all integers little-endian):
+#   header   : magic "LMSB", version u16, record/string/shape counts u32,
+#              offsets u64 of the record index, string index and shape table
+#   records  : per record u32 length, u16 shape id, then the field values
+#              packed as the shape describes (strings are string table ids)
+#   strings  : all strings as one UTF-8 blob
+#   shapes   : per shape u16 field count, then u32 key string id + u8 tag
+#              per field; records sharing keys and value types share a shape
+#   indexes  : u64 offset of every record, then u64 offset of every string
+#              plus one for the end of the blob
+MAGIC = b"LMSB"
+VERSION = 1
+HEADER = struct.Struct("<4sHIIIQQQ")
+RECORD_PREFIX = struct.Struct("<IH")
+OFFSET = struct.Struct("<Q")
+
+TAG_NONE = 0
+TAG_INT = 1
+TAG_FLOAT = 2
+TAG_STRING = 3
+TAG_TRUE = 4
+TAG_FALSE = 5
+TAG_JSON = 6          # lists and dicts, stored as JSON text in the string table
+
+# Packed format of each tag; tags without one are constants stored only in the shape
+TAG_FORMATS = {TAG_INT: 'q', TAG_FLOAT: 'd', TAG_STRING: 'I', TAG_JSON: 'I'}
+CONSTANTS = {TAG_NONE: None, TAG_TRUE: True, TAG_FALSE: False}
+
+
+def _tag_of(value):
+    if value is None:
+        return TAG_NONE
+    if value is True:
+        return TAG_TRUE
+    if value is False:
+        return TAG_FALSE
+    if isinstance(value, int):
+        return TAG_INT
+    if isinstance(value, float):
+        return TAG_FLOAT
+    if isinstance(value, str):
+        return TAG_STRING
+    return TAG_JSON
+
+
+def encode_records(records):
+    """Encodes a sequence of record dictionaries into the binary snapshot format."""
+    strings = {}
+    string_list = []
+
+    def string_id(text):
+        if text not in strings:
+            strings[text] = len(string_list)
+            string_list.append(text)
+        return strings[text]
+
+    shapes = {}
+    layouts = []
+    body = bytearray()
+    record_offsets = []
+    for record in records:
+        fields = tuple((string_id(key), _tag_of(value)) for key, value in record.items())
+        if fields not in shapes:
+            shapes[fields] = len(layouts)
+            layouts.append(struct.Struct("<" + "".join(TAG_FORMATS.get(tag, "") for _, tag in fields)))
+        shape_id = shapes[fields]
+        values = []
+        for (_, tag), value in zip(fields, record.values()):
+            if tag == TAG_STRING:
+                values.append(string_id(value))
+            elif tag == TAG_JSON:
+                values.append(string_id(json.dumps(value, separators=(',', ':'))))
+            elif tag in TAG_FORMATS:
+                values.append(value)
+        payload = layouts[shape_id].pack(*values)
+        record_offsets.append(HEADER.size + len(body))
+        body += RECORD_PREFIX.pack(len(payload) + 2, shape_id) + payload
+
+    string_offsets = []
+    for text in string_list:
+        string_offsets.append(HEADER.size + len(body))
+        body += text.encode('utf-8')
+    string_offsets.append(HEADER.size + len(body))
+
+    shape_offset = HEADER.size + len(body)
+    for fields in shapes:
+        body += struct.pack("<H", len(fields))
+        for key_id, tag in fields:
+            body += struct.pack("<IB", key_id, tag)
+
+    record_index_offset = HEADER.size + len(body)
+    body += struct.pack(f"<{len(record_offsets)}Q", *record_offsets)
+    string_index_offset = HEADER.size + len(body)
+    body += struct.pack(f"<{len(string_offsets)}Q", *string_offsets)
+
+    header = HEADER.pack(MAGIC, VERSION, len(record_offsets), len(string_list), len(shapes),
+                         record_index_offset, string_index_offset, shape_offset)
+    return bytes(header) + bytes(body)
+
+
+class BinarySnapshotReader:
+    """
+    Memory-maps a binary snapshot and decodes records only when they are
+    accessed. Each record is unpacked with its shape's precompiled struct,
+    and strings are decoded once and shared by every record that uses
+    them, so repeated authors, categories and dates cost one object.
+    """
+
+    def __init__(self, file_path):
+        self._file = open(file_path, 'rb')
+        self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        (magic, version, self._record_count, string_count, shape_count,
+         self._record_index, self._string_index, shape_offset) = HEADER.unpack_from(self._map, 0)
+        if magic != MAGIC or version != VERSION:
+            self.close()
+            raise ValueError(f"{file_path} is not a binary snapshot")
+        self._strings = [None] * string_count
+        self._shapes = []
+        position = shape_offset
+        for _ in range(shape_count):
+            field_count, = struct.unpack_from("<H", self._map, position)
+            position += 2
+            fields = []
+            for _ in range(field_count):
+                fields.append(struct.unpack_from("<IB", self._map, position))
+                position += 5
+            self._shapes.append(self._compile_shape(fields))
+
+    def _compile_shape(self, fields):
+        """Turns a shape's (key id, tag) list into what __getitem__ needs to build a record."""
+        keys = []
+        string_positions = []
+        json_positions = []
+        constants = []          # (field position, value), inserted after unpacking to keep the key order
+        layout = "<"
+        for position, (key_id, tag) in enumerate(fields):
+            keys.append(self._string(key_id))
+            if tag in CONSTANTS:
+                constants.append((position, CONSTANTS[tag]))
+                continue
+            packed_position = position - len(constants)
+            if tag in (TAG_STRING, TAG_JSON):
+                string_positions.append(packed_position)
+            if tag == TAG_JSON:
+                json_positions.append(packed_position)
+            layout += TAG_FORMATS[tag]
+        return struct.Struct(layout), keys, string_positions, json_positions, constants
+
+    def __len__(self):
+        return self._record_count
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def close(self):
+        if self._map is not None:
+            self._map.close()
+            self._file.close()
+            self._map = None
+
+    def _string(self, string_id):
+        text = self._strings[string_id]
+        if text is None:
+            start, end = struct.unpack_from("<QQ", self._map, self._string_index + 8 * string_id)
+            text = self._map[start:end].decode('utf-8')
+            self._strings[string_id] = text
+        return text
+
+    def _load_strings(self):
+        """Decodes the whole string table at once, which is much cheaper than string by string."""
+        count = len(self._strings)
+        offsets = struct.unpack_from(f"<{count + 1}Q", self._map, self._string_index)
+        blob = self._map[offsets[0]:offsets[-1]]
+        if blob.isascii():          # byte offsets are character offsets, so slice the decoded text
+            text = blob.decode('ascii')
+            base = offsets[0]
+            self._strings = [text[start - base:end - base] for start, end in zip(offsets, offsets[1:])]
+        else:
+            self._strings = [self._map[start:end].decode('utf-8') for start, end in zip(offsets, offsets[1:])]
+
+    def __getitem__(self, index):
+        if not 0 <= index < self._record_count:
+            raise IndexError("record index out of range")
+        offset, = OFFSET.unpack_from(self._map, self._record_index + 8 * index)
+        shape_id = RECORD_PREFIX.unpack_from(self._map, offset)[1]
+        layout, keys, string_positions, json_positions, constants = self._shapes[shape_id]
+        values = list(layout.unpack_from(self._map, offset + RECORD_PREFIX.size))
+        strings = self._strings
+        for position in string_positions:
+            text = strings[values[position]]
+            values[position] = text if text is not None else self._string(values[position])
+        for position in json_positions:
+            values[position] = json.loads(values[position])
+        for position, value in constants:
+            values.insert(position, value)
+        return dict(zip(keys, values))
+
+    def __iter__(self):
+        """Decodes records one at a time in file order and unmaps the file once they have all been read."""
+        self._load_strings()
+        strings = self._strings
+        shapes = self._shapes
+        position = HEADER.size
+        for _ in range(self._record_count):
+            length, shape_id = RECORD_PREFIX.unpack_from(self._map, position)
+            layout, keys, string_positions, json_positions, constants = shapes[shape_id]
+            values = list(layout.unpack_from(self._map, position + RECORD_PREFIX.size))
+            for value_position in string_positions:
+                values[value_position] = strings[values[value_position]]
+            for value_position in json_positions:
+                values[value_position] = json.loads(values[value_position])
+            for constant_position, value in constants:
+                values.insert(constant_position, value)
+            yield dict(zip(keys, values))
+            position += 4 + length
+        self.close()
@@ -0,0 +1,94 @@
+# ==========================================
+# Project: Library Management System
+# Module: utils/bulk_io.py
+# Purpose: Streaming CSV / JSON-lines Import and Export
+# ==========================================
+
+import csv
+import itertools
+import json
+import os
+import sys
+
+FORMATS = ('csv', 'jsonl')
+
+
+def detect_format(file_path, file_format=None):
+    """Returns 'csv' or 'jsonl', from file_format or else the file extension."""
+    if file_format:
+        if file_format not in FORMATS:
+            raise ValueError(f"Unknown file format: {file_format}")
+        return file_format
+    extension = os.path.splitext(file_path)[1].lower()
+    if extension == '.csv':
+        return 'csv'
+    if extension in ('.jsonl', '.ndjson'):
+        return 'jsonl'
+    raise ValueError(f"Cannot tell the format of {file_path}; use csv or jsonl")
+
+
+def read_records(file_path, file_format=None):
+    """Yields one dict per row without reading the whole file.
+
+    CSV files need a header row naming the fields. A JSON-lines row that
+    cannot be parsed is yielded as None so the caller can report it.
+    """
+    file_format = detect_format(file_path, file_format)
+    with open(file_path, 'r', newline='', encoding='utf-8') as f:
+        if file_format == 'csv':
+            for row in csv.DictReader(f):
+                yield row
+            return
+        for line in f:
+            if not line.strip():
+                continue
+            try:
+                record = json.loads(line)
+            except ValueError:
+                record = None
+            yield record if isinstance(record, dict) else None
+
+
+def batched(iterable, size):
+    """Yields lists of up to size items from iterable."""
+    iterator = iter(iterable)
+    while True:
+        batch = list(itertools.islice(iterator, size))
+        if not batch:
+            return
+        yield batch
+
+
+def _csv_value(value):
+    if value is None:
+        return ''
+    if isinstance(value, (list, dict)):
+        return json.dumps(value)
+    return value
+
+
+def write_records(records, file_path, file_format=None, fields=None):
+    """Streams record dicts to a CSV or JSON-lines file ('-' for standard output).
+
+    CSV files get a header row from fields; keys outside fields are
+    dropped and lists are written as JSON text. Returns the record count.
+    """
+    if file_path == '-':
+        return _write_stream(records, sys.stdout, file_format or 'jsonl', fields)
+    with open(file_path, 'w', newline='', encoding='utf-8') as f:
+        return _write_stream(records, f, detect_format(file_path, file_format), fields)
+
+
+def _write_stream(records, stream, file_format, fields):
+    count = 0
+    if file_format == 'csv':
+        writer = csv.DictWriter(stream, fieldnames=fields, extrasaction='ignore')
+        writer.writeheader()
+        for record in records:
+            writer.writerow({key: _csv_value(value) for key, value in record.items()})
+            count += 1
+        return count
+    for record in records:
+        stream.write(json.dumps(record, separators=(',', ':')) + "\n")
+        count += 1
+    return count
@@ -1,161 +1,692 @@
-import json
-import os
-import sys
-
-# Add parent directory to path for imports
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
-
-from models.person import Admin, Librarian, Member
-from models.book import Book
-from models.transaction import Transaction
-
-
-class Database:
-    def __init__(self, data_folder="library_data"):
-        self._data_folder = data_folder
-        self._users_file = os.path.join(data_folder, "users.json")
-        self._books_file = os.path.join(data_folder, "books.json")
-        self._transactions_file = os.path.join(data_folder, "transactions.json")
-        self.ensure_data_folder()
-    
-    def ensure_data_folder(self):
-        if not os.path.exists(self._data_folder):
-            os.makedirs(self._data_folder)
-
-            print(f"Created data folder: {self._data_folder}")
-    def save_users(self, users):
-        try:
-            with open(self._users_file, 'w') as f:
-                json.dump([user.to_dict() for user in users], f, indent=4)
-            print(f"Saved {len(users)} users to {self._users_file}")
-            return True
-        except Exception as e:
-            print(f"Error saving users: {e}")
-            return False
-    
-    def load_users(self):
-        try:
-            if os.path.exists(self._users_file):
-                with open(self._users_file, 'r') as f:
-                    data = json.load(f)
-                    users = []
-                    for user_data in data:
-                        if user_data['role'] == 'admin':
-                            user = Admin(
-                                user_data['person_id'],
-                                user_data['name'],
-                                user_data['email'],
-                                user_data['phone'],
-                                user_data['admin_level']
-                            )
-                        elif user_data['role'] == 'librarian':
-                            user = Librarian(
-                                user_data['person_id'],
-                                user_data['name'],
-                                user_data['email'],
-                                user_data['phone'],
-                                user_data['employee_id'],
-                                user_data['shift']
-                            )
-                        elif user_data['role'] == 'member':
-                            user = Member(
-                                user_data['person_id'],
-                                user_data['name'],
-                                user_data['email'],
-                                user_data['phone'],
-                                user_data['membership_date']
-                            )
-                            user._borrowed_books = user_data.get('borrowed_books', [])
-                            user._fine_amount = user_data.get('fine_amount', 0.0)
-                        else:
-                            continue
-                        user.set_is_active(user_data.get('is_active', True))
-                        users.append(user)
-                    print(f"Loaded {len(users)} users from {self._users_file}")
-                    return users
-            else:
-                print(f"No users file found at {self._users_file}")
-            return []
-        except Exception as e:
-            print(f"Error loading users: {e}")
-            import traceback
-            traceback.print_exc()
-            return []
-    def save_books(self, books):
-        try:
-            with open(self._books_file, 'w') as f:
-                json.dump([book.to_dict() for book in books], f, indent=4)
-            print(f"Saved {len(books)} books to {self._books_file}")
-            return True
-        except Exception as e:
-            print(f"Error saving books: {e}")
-            return False
-    
-    def load_books(self):
-        try:
-            if os.path.exists(self._books_file):
-                with open(self._books_file, 'r') as f:
-                    data = json.load(f)
-                    books = []
-                    for book_data in data:
-                        book = Book(
-                            book_data['book_id'],
-                            book_data['title'],
-                            book_data['author'],
-                            book_data['isbn'],
-                            book_data['category'],
-                            book_data['publication_year']
-                        )
-                        book.set_is_available(book_data.get('is_available', True))
-                        book.set_borrower_id(book_data.get('borrower_id'))
-                        book._total_borrows = book_data.get('total_borrows', 0)
-                        books.append(book)
-                    print(f"Loaded {len(books)} books from {self._books_file}")
-                    return books
-            else:
-                print(f"No books file found at {self._books_file}")
-            return []
-        except Exception as e:
-            print(f"Error loading books: {e}")
-            import traceback
-            traceback.print_exc()
-            return []
-    def save_transactions(self, transactions):
-        try:
-            with open(self._transactions_file, 'w') as f:
-                json.dump([trans.to_dict() for trans in transactions], f, indent=4)
-            print(f"Saved {len(transactions)} transactions to {self._transactions_file}")
-            return True
-        except Exception as e:
-            print(f"Error saving transactions: {e}")
-            return False
-    
-    def load_transactions(self):
-        try:
-            if os.path.exists(self._transactions_file):
-                with open(self._transactions_file, 'r') as f:
-                    data = json.load(f)
-                    transactions = []
-                    for trans_data in data:
-                        trans = Transaction(
-                            trans_data['transaction_id'],
-                            trans_data['book_id'],
-                            trans_data['member_id'],
-                            trans_data['transaction_type'],
-                            trans_data['transaction_date']
-                        )
-                        trans.set_due_date(trans_data.get('due_date'))
-                        trans.set_return_date(trans_data.get('return_date'))
-                        trans.set_fine_amount(trans_data.get('fine_amount', 0.0))
-                        transactions.append(trans)
-                    print(f"Loaded {len(transactions)} transactions from {self._transactions_file}")
-                    return transactions
-            else:
-                print(f"No transactions file found at {self._transactions_file}")
-            return []
-        except Exception as e:
-            print(f"Error loading transactions: {e}")
-            import traceback
-            traceback.print_exc()
-            return []
-
+import itertools
+import json
+import os
+import sys
+from contextlib import contextmanager
+
+# Add parent directory to path for imports
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from models.person import Admin, Librarian, Member
+from models.book import Book
+from models.transaction import Transaction
+from utils.sqlite_backend import SQLiteBackend
+from utils.transaction_archive import TransactionArchive
+from utils.snapshot_store import SnapshotStore
+from utils.sequences import SequenceStore
+from utils.binary_snapshot import BinarySnapshotReader, encode_records
+
+
+class Database:
+    # Primary key of each collection, used when replaying journal records
+    RECORD_KEYS = {
+        'books': 'book_id',
+        'users': 'person_id',
+        'transactions': 'transaction_id'
+    }
+
+    # Field order of each collection, shared by the SQLite tables and CSV exports
+    FIELDS = SQLiteBackend.COLUMNS
+
+    # File extension of each snapshot format
+    SNAPSHOT_FORMATS = {
+        'json': '.json',
+        'binary': '.bin'
+    }
+
+    def __init__(self, data_folder="library_data", journal_mode=None, checkpoint_interval=None, storage=None,
+                 lazy_history=None, snapshot_format=None):
+        self._data_folder = data_folder
+        self._journal_file = os.path.join(data_folder, "journal.log")
+        self._settings_file = os.path.join(data_folder, "settings.json")
+        self.ensure_data_folder()
+        self._snapshots = SnapshotStore(data_folder)
+        settings = self.load_settings()
+        self._settings = settings
+        if snapshot_format is None:
+            snapshot_format = settings.get('snapshot_format', 'json')
+        if snapshot_format not in self.SNAPSHOT_FORMATS:
+            print(f"Unknown snapshot format '{snapshot_format}', using json")
+            snapshot_format = 'json'
+        self._snapshot_format = snapshot_format
+        extension = self.SNAPSHOT_FORMATS[snapshot_format]
+        self._users_file = os.path.join(data_folder, "users" + extension)
+        self._books_file = os.path.join(data_folder, "books" + extension)
+        self._transactions_file = os.path.join(data_folder, "transactions" + extension)
+        if journal_mode is None:
+            journal_mode = settings.get('journal_mode', False)
+        if checkpoint_interval is None:
+            checkpoint_interval = settings.get('checkpoint_interval', 500)
+        if storage is None:
+            storage = settings.get('storage', 'json')
+        if lazy_history is None:
+            lazy_history = settings.get('lazy_history', False)
+        self._lazy_history = lazy_history
+        self._backend = None
+        if storage == 'sqlite':          # SQLite commits row by row, so the JSON journal is not used
+            sqlite_file = os.path.join(data_folder, settings.get('sqlite_file', 'library.db'))
+            self._backend = SQLiteBackend(sqlite_file)
+            journal_mode = False
+        self._journal_mode = journal_mode
+        self._checkpoint_interval = checkpoint_interval
+        self._journal_entries = self.count_journal_entries() if journal_mode else 0
+        self._loaded_journal = None          # the parsed journal while loading() is active
+        self._total_bytes_written = 0
+        self._last_write = {'operation': None, 'bytes': 0, 'collections': []}
+        self._sequences = None
+        self._archive = None
+        self._archive_after_days = settings.get('archive_after_days', 365)
+        if not self._backend and settings.get('partition_transactions', False):
+            self._archive = TransactionArchive(
+                os.path.join(data_folder, "transactions"),
+                settings.get('archive_compression', 'gzip')
+            )
+            self._lazy_history = True          # only the hot working set is kept in memory
+            self.migrate_to_partitions()
+        if self._lazy_history and not self._backend and not self._archive and not self._journal_mode:
+            # Without the journal every borrow and return would rewrite the whole stored history
+            print("lazy_history with JSON snapshots needs journal_mode; turning the journal on")
+            self._journal_mode = True
+            self._journal_entries = self.count_journal_entries()
+    
+    def ensure_data_folder(self):
+        if not os.path.exists(self._data_folder):
+            os.makedirs(self._data_folder)
+
+            print(f"Created data folder: {self._data_folder}")
+
+    def load_settings(self):
+        """Reads optional storage settings from settings.json in the data folder."""
+        try:
+            if os.path.exists(self._settings_file):
+                with open(self._settings_file, 'r') as f:
+                    return json.load(f)
+        except Exception as e:
+            print(f"Error loading settings: {e}")
+        return {}
+
+    def get_setting(self, name, default=None):
+        return self._settings.get(name, default)
+
+    def is_journal_mode(self):
+        return self._journal_mode
+
+    def is_lazy_history(self):
+        """In lazy mode only open loans are kept in memory; history is queried on demand."""
+        return self._lazy_history
+
+    def is_partitioned(self):
+        return self._archive is not None
+
+    def migrate_to_partitions(self):
+        """Splits an existing transactions.json into month partitions the first time."""
+        if self._archive.months():
+            return 0
+        data = self.read_snapshot('transactions')
+        records = self.replay_journal('transactions', data or [])
+        if not records:
+            return 0
+        count = self._archive.import_records(records)
+        print(f"Partitioned {count} transactions into {self._archive.get_folder()}")
+        return count
+
+    def compact_transactions(self, max_age_days=None):
+        """Moves closed loans older than max_age_days into compressed archive partitions."""
+        if not self._archive:
+            print("Transaction partitioning is not enabled")
+            return 0
+        if max_age_days is None:
+            max_age_days = self._archive_after_days
+        archived = self._archive.compact(max_age_days)
+        print(f"Archived {archived} closed transactions older than {max_age_days} days")
+        return archived
+
+    def get_storage(self):
+        return 'sqlite' if self._backend else 'json'
+
+    def has_incremental_writes(self):
+        """True when save_changes appends or upserts records instead of rewriting snapshot files."""
+        return self._backend is not None or self._journal_mode
+
+    def get_snapshot_format(self):
+        return self._snapshot_format
+
+    def get_sequences(self):
+        """Persistent id sequences of this data folder, opened on first use."""
+        if self._sequences is None:
+            self._sequences = SequenceStore(self._data_folder, self._settings.get('id_block_size', 100))
+        return self._sequences
+
+    def close(self):
+        if self._sequences:
+            self._sequences.release()
+        if self._backend:
+            self._backend.close()
+
+    def _source_name(self, collection):
+        if self._backend:
+            return self._backend.get_db_file()
+        if collection == 'transactions' and self._archive:
+            return self._archive.get_folder()
+        return self._snapshot_file(collection)
+
+    def _snapshot_file(self, collection):
+        return {
+            'books': self._books_file,
+            'users': self._users_file,
+            'transactions': self._transactions_file
+        }[collection]
+
+    def load_records(self, collection):
+        """Returns the raw record dictionaries of a collection from the active storage."""
+        if self._backend:
+            return self._backend.load_records(collection)
+        if collection == 'transactions' and self._archive:
+            return list(self._archive.iter_records())
+        data = self.read_snapshot(collection)
+        if data is None:
+            print(f"No {collection} file found at {self._source_name(collection)}")
+        return self.replay_journal(collection, data or [])
+
+    def iter_records(self, collection):
+        """Streams the raw record dictionaries of a collection without building model objects.
+
+        SQLite is read page by page, partitions month by month and binary
+        snapshots record by record; JSON snapshots are parsed once.
+        """
+        if self._backend:
+            return self._backend.iter_records(collection)
+        if collection == 'transactions' and self._archive:
+            return self._archive.iter_records()
+        return iter(self.load_records(collection))
+
+    @staticmethod
+    def inclusive_end_date(end_date):
+        """Extends a bare YYYY-MM-DD end date to the end of that day, since transaction dates carry a time."""
+        if end_date and len(end_date) == 10:
+            return end_date + " 23:59:59"
+        return end_date
+
+    def export_records(self, collection, start_date=None, end_date=None, category=None, open_only=False):
+        """Yields the stored records of a collection that pass the export filters.
+
+        category applies to books and to transactions (through their book);
+        the date range and open_only apply to transactions.
+        """
+        category = category.lower() if category else None
+        end_date = self.inclusive_end_date(end_date)
+        if collection == 'books':
+            for record in self.iter_records('books'):
+                if not category or str(record.get('category', '')).lower() == category:
+                    yield record
+            return
+        if collection == 'users':
+            yield from self.iter_records('users')
+            return
+        book_ids = None
+        if category:
+            book_ids = {record['book_id'] for record in self.export_records('books', category=category)}
+        if self._archive:          # skip partitions outside the range, and archives when only open loans are wanted
+            source = self._archive.iter_open_records() if open_only else self._archive.iter_records(start_date, end_date)
+        else:
+            source = self.iter_records('transactions')
+        for record in source:
+            if book_ids is not None and record['book_id'] not in book_ids:
+                continue
+            if self._transaction_matches(record, open_only=open_only, start_date=start_date, end_date=end_date):
+                yield record
+
+    def append_journal(self, operation, puts=(), deletes=()):
+        """Appends one compact journal line describing a single mutation.
+
+        puts is a sequence of (collection, record) pairs and deletes a sequence
+        of (collection, record_id) pairs. The whole mutation is one line, so a
+        line torn by a crash is discarded as a unit on replay.
+        """
+        entry = {'op': operation}
+        if puts:
+            entry['put'] = {}
+            for collection, record in puts:
+                entry['put'].setdefault(collection, []).append(record.to_dict())
+        if deletes:
+            entry['del'] = {}
+            for collection, record_id in deletes:
+                entry['del'].setdefault(collection, []).append(record_id)
+        try:
+            self._write_text(self._journal_file, json.dumps(entry, separators=(',', ':')) + "\n", 'a')
+            self._journal_entries += 1
+            return True
+        except Exception as e:
+            print(f"Error appending to journal: {e}")
+            return False
+
+    def _write_text(self, file_path, text, mode='w'):
+        data = text.encode('utf-8')
+        with open(file_path, mode + 'b') as f:
+            f.write(data)
+        self._count_bytes(len(data))
+        return len(data)
+
+    def _write_snapshot(self, collection, records):
+        """Encodes records in the snapshot format and atomically replaces the collection's file."""
+        if self._snapshot_format == 'binary':
+            data = encode_records(records)
+        else:
+            data = json.dumps(records, indent=4).encode('utf-8')
+        size = self._snapshots.write(collection, self._snapshot_file(collection), data)
+        self._count_bytes(size)
+        return size
+
+    def _existing_snapshot(self, file_path):
+        """Falls back to a snapshot left in another format, so changing snapshot_format keeps the data."""
+        if os.path.exists(file_path):
+            return file_path
+        stem = os.path.splitext(file_path)[0]
+        for extension in self.SNAPSHOT_FORMATS.values():
+            if os.path.exists(stem + extension):
+                return stem + extension
+        return file_path
+
+    def _count_bytes(self, size):
+        self._total_bytes_written += size
+        self._last_write['bytes'] += size
+
+    def verify_snapshots(self):
+        """Selects the newest snapshot generation whose files all pass their checksums."""
+        if self._backend:
+            return None
+        paths = {'books': self._books_file, 'users': self._users_file}
+        if not self._archive:
+            paths['transactions'] = self._transactions_file
+        return self._snapshots.verify({name: self._existing_snapshot(path) for name, path in paths.items()})
+
+    def _start_write(self, operation, collections):
+        self._last_write = {'operation': operation, 'bytes': 0, 'collections': list(collections)}
+
+    def get_write_stats(self):
+        """Returns the bytes written by the last save operation and since startup."""
+        return {
+            'operation': self._last_write['operation'],
+            'bytes': self._last_write['bytes'],
+            'collections': list(self._last_write['collections']),
+            'total_bytes': self._total_bytes_written
+        }
+
+    def save_changes(self, operation, dirty, get_collections):
+        """Persists only what changed.
+
+        dirty maps each collection name to {record id: record}, where a record
+        of None means it was deleted. In journal mode the dirty records become
+        one journal line; otherwise only the dirty collections are rewritten.
+        get_collections() returns (books, users, transactions) and is only
+        called when a whole snapshot file has to be rewritten.
+        """
+        collections = [name for name in ('books', 'users', 'transactions') if dirty.get(name)]
+        self._start_write(operation, collections)
+        if self._backend:
+            self._count_bytes(self._backend.save_changes({name: dirty[name] for name in collections}))
+            return True
+        if self._archive and 'transactions' in collections:
+            # Partitions are append-only logs, so transactions never go through the journal.
+            # They are written first; Library repairs books and users from them after a crash.
+            # Transactions are never deleted, so only changed records are appended.
+            records = [trans.to_dict() for trans in dirty['transactions'].values() if trans is not None]
+            self._count_bytes(self._archive.append(records))
+            collections.remove('transactions')
+            if not collections:
+                return True
+        if self._journal_mode:
+            puts = []
+            deletes = []
+            for collection in collections:
+                for record_id, record in dirty[collection].items():
+                    if record is None:
+                        deletes.append((collection, record_id))
+                    else:
+                        puts.append((collection, record))
+            return self.append_journal(operation, puts, deletes)
+        saved = True
+        books, users, transactions = get_collections()
+        self._snapshots.begin_generation()          # the rewritten files form one manifest generation
+        if 'books' in collections:
+            saved = self.save_books(books) and saved
+        if 'users' in collections:
+            saved = self.save_users(users) and saved
+        if 'transactions' in collections:
+            if self._lazy_history:          # memory only holds open loans, so merge into the stored history
+                saved = self.merge_transactions(dirty['transactions']) and saved
+            else:
+                saved = self.save_transactions(transactions) and saved
+        self._snapshots.commit_generation()
+        return saved
+
+    def merge_transactions(self, changes):
+        """Applies {transaction id: transaction or None} to the stored transaction history."""
+        try:
+            by_id = {record['transaction_id']: record for record in self.load_records('transactions')}
+            for transaction_id, trans in changes.items():
+                if trans is None:
+                    by_id.pop(transaction_id, None)
+                else:
+                    by_id[transaction_id] = trans.to_dict()
+            size = self._write_snapshot('transactions', list(by_id.values()))
+            print(f"Saved {len(by_id)} transactions to {self._transactions_file} ({size} bytes)")
+            return True
+        except Exception as e:
+            print(f"Error saving transactions: {e}")
+            return False
+
+    def needs_checkpoint(self):
+        return self._journal_mode and self._journal_entries >= self._checkpoint_interval
+
+    def read_journal(self):
+        entries = []
+        if not os.path.exists(self._journal_file):
+            return entries
+        with open(self._journal_file, 'r') as f:
+            for line_number, line in enumerate(f, 1):
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    entries.append(json.loads(line))
+                except ValueError:
+                    print(f"Skipping damaged journal line {line_number} in {self._journal_file}")
+        return entries
+
+    def count_journal_entries(self):
+        if not os.path.exists(self._journal_file):
+            return 0
+        with open(self._journal_file, 'r') as f:
+            return sum(1 for line in f if line.strip())
+
+    @contextmanager
+    def loading(self):
+        """Parses the journal once for a full load, so every collection replays the same entries."""
+        self._loaded_journal = self.read_journal() if self._journal_mode else []
+        try:
+            yield
+        finally:
+            self._loaded_journal = None
+
+    def replay_journal(self, collection, records):
+        """Applies the journal tail for one collection on top of snapshot records."""
+        if not self._journal_mode:
+            return records
+        key = self.RECORD_KEYS[collection]
+        by_id = {record[key]: record for record in records}
+        entries = self._loaded_journal if self._loaded_journal is not None else self.read_journal()
+        for entry in entries:
+            for record in entry.get('put', {}).get(collection, []):
+                by_id[record[key]] = record
+            for record_id in entry.get('del', {}).get(collection, []):
+                by_id.pop(record_id, None)
+        return list(by_id.values())
+
+    def clear_journal(self):
+        try:
+            if os.path.exists(self._journal_file):
+                open(self._journal_file, 'w').close()
+            self._journal_entries = 0
+            return True
+        except Exception as e:
+            print(f"Error clearing journal: {e}")
+            return False
+
+    def checkpoint(self, books, users, transactions):
+        """Writes full snapshots of every collection and truncates the journal."""
+        self._start_write('checkpoint', ['books', 'users', 'transactions'])
+        self._snapshots.begin_generation()
+        saved = self.save_books(books)
+        saved = self.save_users(users) and saved
+        if not self._lazy_history:
+            saved = self.save_transactions(transactions) and saved
+        elif self._journal_mode and not self._archive:            # fold journaled transactions into the history snapshot
+            saved = self.merge_transactions({}) and saved
+        self._snapshots.commit_generation()
+        if saved and self._journal_mode:
+            self.clear_journal()
+        return saved
+
+    def save_users(self, users):
+        try:
+            if self._backend:
+                self._count_bytes(self._backend.replace_collection('users', [user.to_dict() for user in users]))
+                return True
+            size = self._write_snapshot('users', [user.to_dict() for user in users])
+            print(f"Saved {len(users)} users to {self._users_file} ({size} bytes)")
+            return True
+        except Exception as e:
+            print(f"Error saving users: {e}")
+            return False
+    
+    def load_users(self):
+        try:
+            data = self.load_records('users')
+            users = []
+            for user_data in data:
+                user = self.user_from_dict(user_data)
+                if user:
+                    users.append(user)
+            if users:
+                print(f"Loaded {len(users)} users from {self._source_name('users')}")
+            return users
+        except Exception as e:
+            print(f"Error loading users: {e}")
+            import traceback
+            traceback.print_exc()
+            return []
+
+    def read_snapshot(self, collection):
+        """Returns the records of a collection's snapshot file, or None if it does not exist.
+
+        Binary snapshots are returned as a memory-mapped reader that decodes
+        each record only when it is iterated.
+        """
+        file_path, data = self._snapshots.locate(collection, self._existing_snapshot(self._snapshot_file(collection)))
+        if self._snapshots.is_mapped(file_path):
+            return BinarySnapshotReader(file_path) if os.path.exists(file_path) else None
+        return self._snapshots.parse(file_path, data)
+
+    @staticmethod
+    def user_from_dict(user_data):
+        if user_data['role'] == 'admin':
+            user = Admin(
+                user_data['person_id'],
+                user_data['name'],
+                user_data['email'],
+                user_data['phone'],
+                user_data['admin_level']
+            )
+        elif user_data['role'] == 'librarian':
+            user = Librarian(
+                user_data['person_id'],
+                user_data['name'],
+                user_data['email'],
+                user_data['phone'],
+                user_data['employee_id'],
+                user_data['shift']
+            )
+        elif user_data['role'] == 'member':
+            user = Member(
+                user_data['person_id'],
+                user_data['name'],
+                user_data['email'],
+                user_data['phone'],
+                user_data['membership_date']
+            )
+            for book_id in user_data.get('borrowed_books', []):
+                user.add_borrowed_book(book_id)
+            user.add_fine(user_data.get('fine_amount', 0.0))
+            user.set_max_books(user_data.get('max_books', 5))
+        else:
+            return None
+        user.set_is_active(user_data.get('is_active', True))
+        return user
+
+    def save_books(self, books):
+        try:
+            if self._backend:
+                self._count_bytes(self._backend.replace_collection('books', [book.to_dict() for book in books]))
+                return True
+            size = self._write_snapshot('books', [book.to_dict() for book in books])
+            print(f"Saved {len(books)} books to {self._books_file} ({size} bytes)")
+            return True
+        except Exception as e:
+            print(f"Error saving books: {e}")
+            return False
+    
+    def load_books(self):
+        try:
+            data = self.load_records('books')
+            books = [self.book_from_dict(book_data) for book_data in data]
+            if books:
+                print(f"Loaded {len(books)} books from {self._source_name('books')}")
+            return books
+        except Exception as e:
+            print(f"Error loading books: {e}")
+            import traceback
+            traceback.print_exc()
+            return []
+
+    @staticmethod
+    def book_from_dict(book_data):
+        book = Book(
+            book_data['book_id'],
+            book_data['title'],
+            book_data['author'],
+            book_data['isbn'],
+            book_data['category'],
+            book_data['publication_year']
+        )
+        book.set_is_available(book_data.get('is_available', True))
+        book.set_borrower_id(book_data.get('borrower_id'))
+        book.set_total_borrows(book_data.get('total_borrows', 0))
+        return book
+
+    def save_transactions(self, transactions):
+        try:
+            if self._backend:
+                self._count_bytes(self._backend.replace_collection('transactions',
+                                                                  [trans.to_dict() for trans in transactions]))
+                return True
+            size = self._write_snapshot('transactions', [trans.to_dict() for trans in transactions])
+            print(f"Saved {len(transactions)} transactions to {self._transactions_file} ({size} bytes)")
+            return True
+        except Exception as e:
+            print(f"Error saving transactions: {e}")
+            return False
+    
+    def load_transactions(self):
+        try:
+            data = self.load_records('transactions')
+            transactions = [self.transaction_from_dict(trans_data) for trans_data in data]
+            if transactions:
+                print(f"Loaded {len(transactions)} transactions from {self._source_name('transactions')}")
+            return transactions
+        except Exception as e:
+            print(f"Error loading transactions: {e}")
+            import traceback
+            traceback.print_exc()
+            return []
+
+    @staticmethod
+    def _transaction_matches(record, member_id=None, book_id=None, open_only=False,
+                             start_date=None, end_date=None, transaction_type=None):
+        if member_id is not None and record['member_id'] != member_id:
+            return False
+        if book_id is not None and record['book_id'] != book_id:
+            return False
+        if open_only and (record['transaction_type'] != 'borrow' or record.get('return_date') is not None):
+            return False
+        if transaction_type and record['transaction_type'] != transaction_type:
+            return False
+        if start_date and record['transaction_date'] < start_date:
+            return False
+        if end_date and record['transaction_date'] > end_date:
+            return False
+        return True
+
+    def query_transactions(self, member_id=None, book_id=None, open_only=False, start_date=None,
+                           end_date=None, transaction_type=None, offset=0, limit=None):
+        """Loads a filtered page of stored transactions, oldest first.
+
+        Only the matching records are turned into Transaction objects; with the
+        SQLite backend the filter and paging run inside the database.
+        """
+        filters = {
+            'member_id': member_id,
+            'book_id': book_id,
+            'open_only': open_only,
+            'start_date': start_date,
+            'end_date': end_date,
+            'transaction_type': transaction_type
+        }
+        try:
+            if self._backend:
+                records = self._backend.query_transactions(offset=offset, limit=limit, **filters)
+            elif self._archive:
+                if open_only:
+                    source = self._archive.iter_open_records()
+                else:
+                    source = self._archive.iter_records(start_date, end_date)
+                matches = (record for record in source if self._transaction_matches(record, **filters))
+                stop = offset + limit if limit is not None else None
+                records = itertools.islice(matches, offset, stop)
+            else:
+                matches = (record for record in self.load_records('transactions')
+                           if self._transaction_matches(record, **filters))
+                stop = offset + limit if limit is not None else None
+                records = itertools.islice(matches, offset, stop)
+            return [self.transaction_from_dict(record) for record in records]
+        except Exception as e:
+            print(f"Error querying transactions: {e}")
+            return []
+
+    def query_transaction_page(self, member_id=None, book_id=None, before_id=None, limit=20):
+        """Returns (transactions newest first, cursor for the next page or None).
+
+        before_id is the cursor of the previous page: only transactions with
+        a smaller id are returned.
+        """
+        filters = {'member_id': member_id, 'book_id': book_id}
+        try:
+            if self._backend:
+                records = self._backend.query_transaction_page(member_id, book_id, before_id, limit + 1)
+            else:
+                if self._archive:          # newest month first, so early pages read only recent partitions
+                    source = (record for month in reversed(self._archive.months())
+                              for record in reversed(self._archive.read_month(month)))
+                else:
+                    source = reversed(self.load_records('transactions'))
+                matches = (record for record in source
+                           if (before_id is None or record['transaction_id'] < before_id)
+                           and self._transaction_matches(record, **filters))
+                records = list(itertools.islice(matches, limit + 1))
+            page = [self.transaction_from_dict(record) for record in records[:limit]]
+            next_cursor = page[-1].get_transaction_id() if len(records) > limit else None
+            return page, next_cursor
+        except Exception as e:
+            print(f"Error querying transactions: {e}")
+            return [], None
+
+    def get_last_transaction_id(self):
+        if self._backend:
+            return self._backend.get_max_id('transactions')
+        if self._archive:
+            return self._archive.get_max_id()
+        return max((record['transaction_id'] for record in self.load_records('transactions')), default=0)
+
+    @staticmethod
+    def transaction_from_dict(trans_data):
+        trans = Transaction(
+            trans_data['transaction_id'],
+            trans_data['book_id'],
+            trans_data['member_id'],
+            trans_data['transaction_type'],
+            trans_data['transaction_date']
+        )
+        trans.set_due_date(trans_data.get('due_date'))
+        trans.set_return_date(trans_data.get('return_date'))
+        trans.set_fine_amount(trans_data.get('fine_amount', 0.0))
+        return trans
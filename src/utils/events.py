@@ -0,0 +1,135 @@
+# ==========================================
+# Project: Library Management System
+# Module: utils/events.py
+# Purpose: Typed Change Events and the Bus That Delivers Them
+# ==========================================
+
+import itertools
+import queue
+import threading
+from datetime import datetime
+
+
+class Event:
+    """
+    Something that changed in the Library. Subclasses name their payload
+    in FIELDS; the bus stamps every event with a sequence number that
+    only ever grows, so a subscriber can tell whether it missed one.
+    """
+
+    FIELDS = ()
+
+    def __init__(self, **values):
+        if set(values) != set(self.FIELDS):
+            raise TypeError(f"{type(self).__name__} needs exactly {', '.join(self.FIELDS)}")
+        for name, value in values.items():
+            setattr(self, name, value)
+        self.sequence = None
+        self.timestamp = None
+
+    def get_type(self):
+        return type(self).__name__
+
+    def to_dict(self):
+        data = {'type': self.get_type(), 'sequence': self.sequence, 'timestamp': self.timestamp}
+        data.update((name, getattr(self, name)) for name in self.FIELDS)
+        return data
+
+    def __repr__(self):
+        payload = ", ".join(f"{name}={getattr(self, name)!r}" for name in self.FIELDS)
+        return f"{self.get_type()}(#{self.sequence}, {payload})"
+
+
+class BookAdded(Event):
+    FIELDS = ('book_id',)
+
+
+class BookUpdated(Event):
+    FIELDS = ('book_id',)
+
+
+class BookRemoved(Event):
+    FIELDS = ('book_id',)
+
+
+class UserAdded(Event):
+    FIELDS = ('user_id',)
+
+
+class UserRemoved(Event):
+    FIELDS = ('user_id',)
+
+
+class Borrowed(Event):
+    FIELDS = ('transaction_id', 'book_id', 'member_id', 'due_date')
+
+
+class Returned(Event):
+    FIELDS = ('transaction_id', 'borrow_transaction_id', 'book_id', 'member_id', 'fine_amount')
+
+
+class FinePaid(Event):
+    FIELDS = ('member_id', 'amount', 'remaining')
+
+
+class EventBus:
+    """
+    Delivers published events to subscribers, in publication order.
+
+    A handler subscribed with subscribe() is called synchronously on the
+    publishing thread, so it must be quick and must not block. A queue
+    from subscribe_queue() suits slow consumers or other threads (e.g. a
+    Tk window polling with after()). A failing handler is reported and
+    skipped; it never undoes the change that was published.
+    """
+
+    def __init__(self, first_sequence=1):
+        self._lock = threading.RLock()
+        self._sequence = itertools.count(first_sequence)
+        self._last_sequence = first_sequence - 1
+        self._subscribers = {}          # token -> (handler, event types or None for all)
+        self._tokens = itertools.count(1)
+
+    def subscribe(self, handler, event_types=None):
+        """Calls handler(event) for every event (or only the given Event subclasses); returns a token."""
+        with self._lock:
+            token = next(self._tokens)
+            self._subscribers[token] = (handler, tuple(event_types) if event_types else None)
+            return token
+
+    def subscribe_queue(self, event_types=None, maxsize=0):
+        """Returns (token, queue.Queue) that receives the events instead of a handler.
+
+        A bounded queue that fills up drops new events; the gap shows in the sequence numbers.
+        """
+        events = queue.Queue(maxsize)
+
+        def enqueue(event):
+            try:
+                events.put_nowait(event)
+            except queue.Full:
+                pass
+
+        return self.subscribe(enqueue, event_types), events
+
+    def unsubscribe(self, token):
+        with self._lock:
+            self._subscribers.pop(token, None)
+
+    def get_last_sequence(self):
+        return self._last_sequence
+
+    def publish(self, event):
+        """Stamps the event with the next sequence number and delivers it; returns the event."""
+        with self._lock:
+            event.sequence = next(self._sequence)
+            event.timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+            self._last_sequence = event.sequence
+            for handler, event_types in list(self._subscribers.values()):
+                if event_types and not isinstance(event, event_types):
+                    continue
+                try:
+                    handler(event)
+                except Exception as e:
+                    print(f"Error in {event.get_type()} subscriber: {e}")
+        return event
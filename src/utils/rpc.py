@@ -0,0 +1,250 @@
+# ==========================================
+# Project: Library Management System
+# Module: utils/rpc.py
+# Purpose: Local JSON-RPC Service Sharing One Library Between Desks
+# ==========================================
+
+import asyncio
+import inspect
+import json
+import os
+import socket
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from controllers.library import Library
+from models.book import Book
+from models.person import Person
+from models.transaction import Transaction
+from utils.database import Database
+
+DEFAULT_ADDRESS = "127.0.0.1:8765"
+
+# Library methods a desk may call; anything that touches server-side files
+# or shuts the server down is left out
+EXPOSED_METHODS = (
+    'add_book', 'remove_book', 'update_book', 'get_all_books', 'get_book_by_id',
+    'add_admin', 'add_librarian', 'add_member', 'remove_user', 'get_all_users',
+    'get_user_by_id', 'get_all_members',
+    'borrow_book', 'borrow_books', 'return_book', 'return_books', 'pay_member_fine',
+    'get_member_borrowed_books', 'get_open_loan', 'get_open_loans',
+    'search_books_by_title', 'search_books_by_author', 'search_books_ranked', 'search_books_best',
+    'fuzzy_search_books',
+    'autocomplete', 'search_books_by_isbn', 'search_books_by_category', 'get_available_books', 'get_borrowed_books',
+    'search_users_by_name', 'get_members_with_fines',
+    'generate_most_borrowed_report', 'generate_active_members_report',
+    'generate_overdue_report', 'generate_fine_revenue_report', 'generate_category_report',
+    'query_transactions', 'get_transaction_page', 'get_transaction_by_id',
+    'get_all_transactions', 'get_member_transactions', 'check_invariants', 'flush'
+)
+
+# JSON-RPC 2.0 error codes
+PARSE_ERROR = -32700
+INVALID_REQUEST = -32600
+METHOD_NOT_FOUND = -32601
+INVALID_PARAMS = -32602
+INTERNAL_ERROR = -32603
+
+
+class RemoteError(Exception):
+    """Raised by LibraryClient when the server answers a call with an error."""
+
+    def __init__(self, code, message):
+        super().__init__(message)
+        self.code = code
+
+
+def parse_address(address):
+    """Returns ('tcp', (host, port)) for "host:port", or ('unix', path) for a socket path."""
+    host, _, port = address.rpartition(':')
+    if host and port.isdigit() and os.sep not in address:
+        return 'tcp', (host.strip('[]'), int(port))
+    return 'unix', address
+
+
+def encode_value(value):
+    """Turns a Library return value into JSON-ready data; models travel as tagged dicts."""
+    if isinstance(value, Book):
+        return {'__book__': value.to_dict()}
+    if isinstance(value, Person):
+        return {'__user__': value.to_dict()}
+    if isinstance(value, Transaction):
+        return {'__transaction__': value.to_dict()}
+    if isinstance(value, (list, tuple)):
+        return [encode_value(item) for item in value]
+    if isinstance(value, dict):
+        return {str(key): encode_value(item) for key, item in value.items()}
+    return value
+
+
+def decode_value(value):
+    """Rebuilds the model objects of a value made by encode_value."""
+    if isinstance(value, list):
+        return [decode_value(item) for item in value]
+    if isinstance(value, dict):
+        if '__book__' in value:
+            return Database.book_from_dict(value['__book__'])
+        if '__user__' in value:
+            return Database.user_from_dict(value['__user__'])
+        if '__transaction__' in value:
+            return Database.transaction_from_dict(value['__transaction__'])
+        return {key: decode_value(item) for key, item in value.items()}
+    return value
+
+
+class LibraryServer:
+    """
+    Serves one in-memory Library to many clients over TCP or a Unix socket.
+
+    Each line a client sends is a JSON-RPC 2.0 request whose params are
+    the method's keyword arguments; each reply is one JSON line. Calls
+    run on a thread pool, so a slow save never stalls the event loop, and
+    the Library's reader/writer lock keeps concurrent desks consistent.
+    """
+
+    def __init__(self, library, address=DEFAULT_ADDRESS, workers=8):
+        self._library = library
+        self._address = address
+        self._executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="library-rpc")
+        self._server = None
+
+    async def start(self):
+        kind, target = parse_address(self._address)
+        if kind == 'tcp':
+            self._server = await asyncio.start_server(self._handle_client, *target)
+        else:
+            if os.path.exists(target):          # left behind by a server that did not stop cleanly
+                os.remove(target)
+            self._server = await asyncio.start_unix_server(self._handle_client, target)
+        return self._server
+
+    async def serve_forever(self):
+        server = await self.start()
+        print(f"Library server listening on {self._address}")
+        async with server:
+            await server.serve_forever()
+
+    def run(self):
+        """Serves until interrupted, then writes pending changes and closes storage."""
+        try:
+            asyncio.run(self.serve_forever())
+        except KeyboardInterrupt:
+            print("\nStopping library server")
+        finally:
+            self._executor.shutdown(wait=True)
+            self._library.shutdown()
+            kind, target = parse_address(self._address)
+            if kind == 'unix' and os.path.exists(target):
+                os.remove(target)
+
+    async def _handle_client(self, reader, writer):
+        try:
+            while True:
+                line = await reader.readline()
+                if not line:
+                    break
+                response = await self._dispatch(line)
+                writer.write(json.dumps(response, separators=(',', ':')).encode('utf-8') + b"\n")
+                await writer.drain()
+        except (ConnectionError, ValueError):          # client went away, or sent a line over the stream limit
+            pass
+        finally:
+            writer.close()
+
+    async def _dispatch(self, line):
+        try:
+            request = json.loads(line)
+        except ValueError:
+            return self._error(None, PARSE_ERROR, "Parse error")
+        if not isinstance(request, dict) or not isinstance(request.get('method'), str):
+            return self._error(None, INVALID_REQUEST, "Invalid request")
+        request_id = request.get('id')
+        method = request['method']
+        params = request.get('params') or {}
+        if method not in EXPOSED_METHODS:
+            return self._error(request_id, METHOD_NOT_FOUND, f"Method not found: {method}")
+        if not isinstance(params, dict):
+            return self._error(request_id, INVALID_PARAMS, "params must be an object of keyword arguments")
+        call = getattr(self._library, method)
+        try:
+            inspect.signature(call).bind(**params)
+        except TypeError as e:
+            return self._error(request_id, INVALID_PARAMS, str(e))
+        loop = asyncio.get_running_loop()
+        try:
+            result = await loop.run_in_executor(self._executor, lambda: encode_value(call(**params)))
+        except Exception as e:
+            return self._error(request_id, INTERNAL_ERROR, f"{type(e).__name__}: {e}")
+        return {'jsonrpc': "2.0", 'id': request_id, 'result': result}
+
+    @staticmethod
+    def _error(request_id, code, message):
+        return {'jsonrpc': "2.0", 'id': request_id, 'error': {'code': code, 'message': message}}
+
+
+class LibraryClient:
+    """
+    Stands in for a Library by forwarding calls to a LibraryServer.
+
+    Positional arguments are named with Library's own signatures before
+    they are sent, and returned books, users and transactions come back
+    as model objects, so menus and windows work unchanged. Returned
+    objects are copies; all changes go through Library methods.
+    """
+
+    def __init__(self, address=DEFAULT_ADDRESS, timeout=30):
+        kind, target = parse_address(address)
+        if kind == 'tcp':
+            self._socket = socket.create_connection(target, timeout=timeout)
+        else:
+            self._socket = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+            self._socket.settimeout(timeout)
+            self._socket.connect(target)
+        self._stream = self._socket.makefile('rwb')
+        self._lock = threading.Lock()           # one request/reply exchange at a time per connection
+        self._next_id = 1
+        self._address = address
+
+    def get_address(self):
+        return self._address
+
+    def call(self, method, **params):
+        with self._lock:
+            request_id = self._next_id
+            self._next_id += 1
+            request = {'jsonrpc': "2.0", 'id': request_id, 'method': method, 'params': params}
+            self._stream.write(json.dumps(request, separators=(',', ':')).encode('utf-8') + b"\n")
+            self._stream.flush()
+            line = self._stream.readline()
+        if not line:
+            raise ConnectionError(f"Library server at {self._address} closed the connection")
+        response = json.loads(line)
+        if 'error' in response:
+            raise RemoteError(response['error']['code'], response['error']['message'])
+        return decode_value(response['result'])
+
+    def __getattr__(self, name):
+        if name not in EXPOSED_METHODS:
+            raise AttributeError(f"'{type(self).__name__}' has no attribute '{name}'")
+        signature = inspect.signature(getattr(Library, name))
+
+        def remote(*args, **kwargs):
+            arguments = signature.bind(None, *args, **kwargs).arguments
+            arguments.pop('self')
+            return self.call(name, **arguments)
+
+        remote.__name__ = name
+        return remote
+
+    def shutdown(self):
+        """Closes the connection; the server keeps running and owns persistence."""
+        try:
+            self._stream.close()
+        finally:
+            self._socket.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.shutdown()
@@ -0,0 +1,415 @@
+# ==========================================
+# Project: Library Management System
+# Module: utils/search_index.py
+# Purpose: Incremental Inverted Index for Text Search
+# ==========================================
+
+import bisect
+import math
+import re
+import threading
+
+TOKEN_PATTERN = re.compile(r"\w+")
+TOKEN_START = "\x02"        # marks where a token begins and ends, so prefixes and suffixes have trigrams of their own
+TOKEN_END = "\x03"
+BM25_K1 = 1.2               # BM25 parameters: how much a record's length tempers its score,
+BM25_B = 0.75               # and how far that length is compared with the average one
+
+
+def tokenize(text):
+    """Splits lowercased text into its word tokens."""
+    return TOKEN_PATTERN.findall(text.lower())
+
+
+def trigrams(text):
+    """The set of 3-character slices of text."""
+    return {text[i:i + 3] for i in range(len(text) - 2)}
+
+
+def edit_distance(a, b):
+    """Levenshtein distance: the fewest inserted, deleted or replaced characters turning a into b."""
+    return _distance(_char_masks(a), len(a), b)
+
+
+def _char_masks(word):
+    """Bit i of masks[c] is set when word[i] == c: the per-word setup of _distance, done once per query."""
+    masks = {}
+    for position, char in enumerate(word):
+        masks[char] = masks.get(char, 0) | (1 << position)
+    return masks
+
+
+def _distance(masks, length, other):
+    """
+    Levenshtein distance from the word described by masks and length to
+    other, with Myers' bit-parallel algorithm (Hyyro's form): a whole
+    column of the edit-distance table is a pair of bit vectors updated in
+    a few integer operations per character of other, instead of a loop
+    over the word's characters.
+    """
+    if not length:
+        return len(other)
+    full = (1 << length) - 1
+    last = 1 << (length - 1)
+    plus, minus, score = full, 0, length        # vertical +1/-1 steps down the current column
+    for char in other:
+        equal = masks.get(char, 0)
+        vertical = equal | minus
+        horizontal = (((equal & plus) + plus) ^ plus) | equal
+        up = minus | (~(horizontal | plus) & full)
+        down = plus & horizontal
+        if up & last:
+            score += 1
+        elif down & last:
+            score -= 1
+        up = ((up << 1) | 1) & full
+        down = (down << 1) & full
+        plus = down | (~(vertical | up) & full)
+        minus = up & vertical
+    return score
+
+
+def typo_budget(word, max_distance):
+    """
+    How many edits a query word may be off by: none in 1-2 letters, one in
+    3-4, then up to max_distance. Two letters swapped count as two edits,
+    so a second one is allowed early.
+    """
+    return min(max_distance, 0 if len(word) <= 2 else 1 if len(word) <= 4 else 2)
+
+
+class BKTree:
+    """
+    Burkhard-Keller tree over a set of words, for finding the words within
+    an edit distance of a query without measuring the distance to all of
+    them. Each child hangs under its parent at their distance d(parent,
+    child); by the triangle inequality a word within k of the query can
+    only lie under a child whose d is within k of d(parent, query), so
+    whole branches are skipped.
+
+    Words cannot be taken out of the tree; the owner filters out words
+    that are gone and rebuilds the tree once enough of them pile up.
+    """
+
+    def __init__(self):
+        self._root = None           # [word, {distance: child node} or None]
+        self._size = 0
+
+    def __len__(self):
+        return self._size
+
+    def clear(self):
+        self._root = None
+        self._size = 0
+
+    def add(self, word):
+        self._size += 1
+        if self._root is None:
+            self._root = [word, None]
+            return
+        masks, length = _char_masks(word), len(word)
+        node = self._root
+        while True:
+            distance = _distance(masks, length, node[0])
+            if distance == 0:
+                self._size -= 1
+                return
+            if node[1] is None:
+                node[1] = {}
+            child = node[1].get(distance)
+            if child is None:
+                node[1][distance] = [word, None]
+                return
+            node = child
+
+    def search(self, word, max_distance):
+        """Returns (distance, word) pairs for the words within max_distance of word."""
+        found = []
+        masks, length = _char_masks(word), len(word)
+        pending = [self._root] if self._root else []
+        while pending:
+            node = pending.pop()
+            distance = _distance(masks, length, node[0])
+            if distance <= max_distance:
+                found.append((distance, node[0]))
+            if node[1]:
+                for child_distance, child in node[1].items():
+                    if distance - max_distance <= child_distance <= distance + max_distance:
+                        pending.append(child)
+        return found
+
+
+class TokenIndex:
+    """
+    Inverted index over one text field (a title, an author...) that maps
+    each lowercase word token to the ids of the records containing it.
+
+    search() keeps the meaning of the old scan, `query in text.lower()`:
+    words that the query shows whole must be whole tokens of a match,
+    and only the words at its edges may be parts of longer tokens (the
+    first may be a token's end, the last its start). Each query word
+    gives a posting list (or the union of those of the tokens it is part
+    of); the lists are intersected smallest first and the few candidates
+    left are checked against the full query.
+
+    The tokens a fragment is part of are found through a trigram index
+    over the vocabulary (each token padded with start/end marks), not by
+    scanning it. Trigrams of the vocabulary rather than of every text
+    keep the index small: a catalog repeats the same words many times.
+
+    fuzzy_search() forgives typos instead: each query word matches whole
+    tokens within a few edits of it, found through a BK-tree over the
+    vocabulary. The tree is built by the first fuzzy search rather than
+    at load, and kept up to date from then on.
+
+    bm25() scores records against whole-word terms from statistics kept up
+    to date as records come and go: each token's posting count and each
+    record's length in tokens. Record ids are small non-negative integers
+    (the id sequences hand them out), so lengths live in a bytearray
+    indexed by id, one byte per record. A title rarely repeats a word, so
+    a term counts once per record.
+
+    The index does not keep a copy of the texts: get_text(record_id)
+    returns a record's current text, and remove() must be given the text
+    that was indexed, so change a record only after unindexing it.
+    """
+
+    def __init__(self, get_text):
+        self._get_text = get_text
+        self._postings = {}         # token -> set of record ids
+        self._ids = set()           # every indexed record, for queries without a word in them
+        self._grams = {}            # trigram of a padded token -> tokens containing it
+        self._lengths = bytearray()     # record id -> number of tokens in its text (at most 255)
+        self._total_length = 0
+        self._tree = None           # BKTree of every token added since it was built, live or not
+        self._tree_lock = threading.Lock()     # fuzzy searches may run side by side; only one builds the tree
+
+    def __len__(self):
+        return len(self._ids)
+
+    def clear(self):
+        self._postings.clear()
+        self._ids.clear()
+        self._grams.clear()
+        self._lengths = bytearray()
+        self._total_length = 0
+        self._tree = None
+
+    def _set_length(self, record_id, length):
+        if record_id >= len(self._lengths):
+            self._lengths.extend(bytes(record_id + 1 - len(self._lengths)))
+        length = min(length, 255)
+        self._total_length += length - self._lengths[record_id]
+        self._lengths[record_id] = length
+
+    def add(self, record_id, text):
+        tokens = tokenize(text)
+        self._ids.add(record_id)
+        self._set_length(record_id, len(tokens))
+        for token in set(tokens):
+            ids = self._postings.get(token)
+            if ids is None:
+                ids = self._postings[token] = set()
+                for gram in trigrams(TOKEN_START + token + TOKEN_END):
+                    self._grams.setdefault(gram, set()).add(token)
+                if self._tree is not None:
+                    self._tree.add(token)
+            ids.add(record_id)
+
+    def remove(self, record_id, text):
+        if record_id in self._ids:
+            self._ids.discard(record_id)
+            self._set_length(record_id, 0)
+        for token in set(tokenize(text)):
+            ids = self._postings.get(token)
+            if ids is None:
+                continue
+            ids.discard(record_id)
+            if not ids:
+                del self._postings[token]
+                for gram in trigrams(TOKEN_START + token + TOKEN_END):
+                    tokens = self._grams[gram]
+                    tokens.discard(token)
+                    if not tokens:
+                        del self._grams[gram]
+        if self._tree is not None and len(self._tree) > 2 * len(self._postings) + 1000:
+            self._tree = None       # mostly gone words: the next fuzzy search rebuilds it from the live vocabulary
+
+    def _vocabulary_tree(self):
+        with self._tree_lock:
+            if self._tree is None:
+                tree = BKTree()
+                for token in self._postings:
+                    tree.add(token)
+                self._tree = tree
+            return self._tree
+
+    def _tokens_fitting(self, word, whole_start, whole_end):
+        """The vocabulary tokens that start with word (whole_start), end with it (whole_end) or contain it."""
+        fragment = (TOKEN_START if whole_start else "") + word + (TOKEN_END if whole_end else "")
+        grams = trigrams(fragment)
+        if grams:
+            candidates = sorted((self._grams.get(gram, ()) for gram in grams), key=len)
+            if not candidates[0]:
+                return []
+            tokens = candidates[0].intersection(*candidates[1:])
+        else:                       # too short for a trigram, so check the whole vocabulary
+            tokens = self._postings
+        if whole_start:
+            return [token for token in tokens if token.startswith(word)]
+        if whole_end:
+            return [token for token in tokens if token.endswith(word)]
+        return [token for token in tokens if word in token]
+
+    def _matching_ids(self, word, whole_start, whole_end):
+        """The ids of records having a token that fits the query word at its place in the query."""
+        if whole_start and whole_end:
+            return self._postings.get(word, set())
+        tokens = self._tokens_fitting(word, whole_start, whole_end)
+        if not tokens:
+            return set()
+        if len(tokens) == 1:
+            return self._postings[tokens[0]]
+        return set().union(*(self._postings[token] for token in tokens))
+
+    def search(self, query):
+        """Returns the ids of records whose text contains query (ignoring case), in ascending order."""
+        query = query.lower()
+        words = list(TOKEN_PATTERN.finditer(query))
+        if not words:           # only spaces or punctuation: nothing to look up, so check every record
+            return sorted(record_id for record_id in self._ids if query in self._get_text(record_id).lower())
+        postings = [self._matching_ids(word.group(), word.start() > 0, word.end() < len(query)) for word in words]
+        postings.sort(key=len)
+        candidates = postings[0]
+        for ids in postings[1:]:
+            if not candidates:
+                break
+            candidates = candidates & ids         # a new set: the posting lists themselves stay untouched
+        if len(words) == 1 and words[0].group() == query:
+            return sorted(candidates)        # a bare word already matched by the token test above
+        return sorted(record_id for record_id in candidates if query in self._get_text(record_id).lower())
+
+    def bm25(self, terms, record_ids=None, weight=1.0, scores=None):
+        """
+        Adds weight times the BM25 score of each record holding at least one
+        of terms (whole lowercase words), only among record_ids (a set) when
+        given, to scores and returns it. Rare terms weigh more than common
+        ones, and a match in a short text more than one in a long text.
+        """
+        scores = {} if scores is None else scores
+        if not self._ids:
+            return scores
+        count = len(self._ids)
+        average_length = self._total_length / count or 1
+        lengths = self._lengths
+        for term in terms:
+            ids = self._postings.get(term)
+            if not ids:
+                continue
+            idf = math.log(1 + (count - len(ids) + 0.5) / (len(ids) + 0.5))
+            by_length = [weight * idf * (BM25_K1 + 1) / (1 + BM25_K1 * (1 - BM25_B + BM25_B * length / average_length))
+                         for length in range(256)]        # a term counts once, so its score depends on the length alone
+            get = scores.get
+            for record_id in (ids if record_ids is None else ids & record_ids):
+                scores[record_id] = get(record_id, 0.0) + by_length[lengths[record_id]]
+        return scores
+
+    def fuzzy_search(self, query, max_distance=2):
+        """
+        Returns (record_id, distance) pairs for records that have, for every
+        word of query, a token within that word's typo budget; distance is
+        the sum over the words of the closest token's edit distance. Closest
+        records come first, ties in ascending id order.
+        """
+        words = tokenize(query)
+        if not words:
+            return []
+        tree = self._vocabulary_tree()
+        distances = None            # record id -> total distance so far, for records matching every word yet
+        for word in sorted(set(words), key=len, reverse=True):      # long words have the fewest near misses
+            closest = {}
+            for distance, token in sorted(tree.search(word, typo_budget(word, max_distance)), reverse=True):
+                for record_id in self._postings.get(token, ()):         # tokens that are gone have no postings
+                    if distances is None or record_id in distances:
+                        closest[record_id] = distance                   # smaller distances are written last
+            if distances is not None:
+                closest = {record_id: distances[record_id] + distance for record_id, distance in closest.items()}
+            distances = closest
+            if not distances:
+                return []
+        return sorted(distances.items(), key=lambda item: (item[1], item[0]))
+
+
+class CompletionIndex:
+    """
+    The distinct values of one field (titles, authors...) in a sorted
+    array, for search-as-you-type completion: bisect finds where a prefix
+    would go and the completions are the keys that follow it, so a lookup
+    costs O(log n + limit) however large the catalog is.
+
+    Keys are lowercased; each counts the records holding each spelling of
+    it, so a value leaves only with its last record and a completion is
+    always spelled as some record still spells it.
+    Single values are inserted in place; batches are appended and sorted
+    once, which is a linear merge of two sorted runs.
+    """
+
+    def __init__(self):
+        self._keys = []             # sorted lowercased values
+        self._values = {}           # lowercased value -> its spelling if one record holds it, else {spelling: records with it}
+
+    def __len__(self):
+        return len(self._keys)
+
+    def clear(self):
+        self._keys.clear()
+        self._values.clear()
+
+    def add(self, value):
+        self.add_all([value])
+
+    def add_all(self, values):
+        new_keys = []
+        for value in values:
+            key = value.lower()
+            spellings = self._values.get(key)
+            if spellings is None:
+                self._values[key] = value
+                new_keys.append(key)
+                continue
+            if isinstance(spellings, str):
+                spellings = self._values[key] = {spellings: 1}
+            spellings[value] = spellings.get(value, 0) + 1
+        if len(new_keys) <= 8:
+            for key in new_keys:
+                bisect.insort(self._keys, key)
+        else:
+            self._keys.extend(new_keys)
+            self._keys.sort()
+
+    def remove(self, value):
+        key = value.lower()
+        spellings = self._values.get(key)
+        if spellings == value:
+            del self._values[key]
+            del self._keys[bisect.bisect_left(self._keys, key)]
+        elif isinstance(spellings, dict) and value in spellings:
+            spellings[value] -= 1
+            if spellings[value] == 0:
+                del spellings[value]
+            if len(spellings) == 1 and sum(spellings.values()) == 1:
+                self._values[key] = next(iter(spellings))
+
+    def complete(self, prefix, limit=10):
+        """Returns up to limit values starting with prefix (ignoring case), in alphabetical order."""
+        prefix = prefix.lower()
+        completions = []
+        position = bisect.bisect_left(self._keys, prefix)
+        while position < len(self._keys) and len(completions) < limit:
+            key = self._keys[position]
+            if not key.startswith(prefix):
+                break
+            spellings = self._values[key]
+            completions.append(spellings if isinstance(spellings, str) else next(iter(spellings)))
+            position += 1
+        return completions
@@ -0,0 +1,131 @@
+# ==========================================
+# Project: Library Management System
+# Module: utils/sequences.py
+# Purpose: Persistent Id Sequences with Block Allocation
+# ==========================================
+
+import json
+import os
+import threading
+from contextlib import contextmanager
+
+try:
+    import fcntl            # POSIX: lets several processes share the sequence file
+except ImportError:
+    fcntl = None            # Windows: one writing process per data folder
+
+
+class SequenceStore:
+    """
+    Hands out record ids that only ever grow, so an id is never reused,
+    even after the record with the highest id is deleted.
+
+    sequences.json stores, per collection, the highest id reserved so far.
+    Ids are reserved in blocks and handed out from memory, so the file is
+    written once per block rather than once per record. A clean close
+    gives the unused part of the block back; after a crash those ids are
+    simply skipped. Reservations re-read the file under a file lock, so
+    several processes can allocate from the same folder.
+    """
+
+    def __init__(self, data_folder, block_size=100):
+        self._file = os.path.join(data_folder, "sequences.json")
+        self._lock_file = os.path.join(data_folder, "sequences.lock")
+        self._block_size = max(int(block_size), 1)
+        self._lock = threading.Lock()
+        self._next = {}             # collection -> next id to hand out
+        self._reserved = {}         # collection -> last id of the reserved block
+        for name, reserved in self._read().items():
+            self._next[name] = reserved + 1
+            self._reserved[name] = reserved
+
+    def _read(self):
+        try:
+            if os.path.exists(self._file):
+                with open(self._file, 'r') as f:
+                    return json.load(f)
+        except ValueError as e:
+            print(f"Ignoring damaged sequence file {self._file}: {e}")
+        return {}
+
+    def _write(self, stored):
+        temp_path = self._file + ".tmp"
+        with open(temp_path, 'w') as f:
+            json.dump(stored, f, indent=4)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(temp_path, self._file)
+
+    @contextmanager
+    def _file_locked(self):
+        if fcntl is None:
+            yield
+            return
+        with open(self._lock_file, 'a') as lock:
+            fcntl.flock(lock.fileno(), fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(lock.fileno(), fcntl.LOCK_UN)
+
+    def has(self, name):
+        return name in self._next
+
+    def seed(self, name, last_used_id):
+        """Starts a sequence after last_used_id when it is not stored yet (first run on existing data)."""
+        with self._lock, self._file_locked():
+            stored = self._read()
+            reserved = max(stored.get(name, 0), last_used_id)
+            if stored.get(name) != reserved:
+                stored[name] = reserved
+                self._write(stored)
+            self._next[name] = max(self._next.get(name, 1), reserved + 1)
+            self._reserved[name] = max(self._reserved.get(name, 0), reserved)
+
+    def skip_past(self, name, last_used_id):
+        """Makes sure the next id is above last_used_id (e.g. records were restored from an older backup)."""
+        with self._lock:
+            if self._next.get(name, 1) <= last_used_id:
+                self._next[name] = last_used_id + 1
+
+    def peek(self, name):
+        """The id the next allocation will most likely start at."""
+        return self._next.get(name, 1)
+
+    def next_id(self, name):
+        return self.allocate(name, 1)
+
+    def allocate(self, name, count=1):
+        """Reserves count consecutive ids and returns the first one."""
+        with self._lock:
+            first = self._next.get(name, 1)
+            if first + count - 1 > self._reserved.get(name, 0):
+                first = self._reserve(name, count)
+            self._next[name] = first + count
+            return first
+
+    def _reserve(self, name, count):
+        with self._file_locked():
+            stored = self._read()
+            start = self._next.get(name, 1)
+            if stored.get(name, 0) > self._reserved.get(name, 0):       # another process reserved past our block
+                start = max(start, stored[name] + 1)
+            reserved = start + max(count, self._block_size) - 1
+            stored[name] = reserved
+            self._write(stored)
+        self._reserved[name] = reserved
+        return start
+
+    def release(self):
+        """Gives back the unused tail of each block, unless another process has reserved after it."""
+        with self._lock, self._file_locked():
+            stored = self._read()
+            changed = False
+            for name, reserved in self._reserved.items():
+                used = self._next[name] - 1
+                if stored.get(name) == reserved and used < reserved:
+                    stored[name] = used
+                    self._reserved[name] = used
+                    changed = True
+            if changed:
+                self._write(stored)
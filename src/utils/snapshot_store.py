@@ -0,0 +1,246 @@
+# ==========================================
+# Project: Library Management System
+# Module: utils/snapshot_store.py
+# Purpose: Crash-Safe Snapshot Files with Generation Manifest
+# ==========================================
+
+import hashlib
+import json
+import os
+
+
+class SnapshotStore:
+    """
+    Writes snapshot files atomically (temp file, fsync, rename) and keeps
+    the previous version of each file as <name>.prev. A manifest records
+    the SHA-256 of every file in the current and previous generation, so
+    a set of snapshots is only accepted when all of its files match one
+    generation. JSON files are hashed and parsed from the same bytes, so
+    verification never reads a file twice; memory-mapped files are hashed
+    in chunks and only their verified path is kept.
+    """
+
+    MAPPED_EXTENSIONS = ('.bin',)          # decoded lazily by their reader, so never cached in memory
+    CHUNK_SIZE = 1024 * 1024
+
+    def __init__(self, data_folder):
+        self._data_folder = data_folder
+        self._manifest_file = os.path.join(data_folder, "manifest.json")
+        self._manifest = self._read_manifest()
+        self._pending = {}
+        self._depth = 0
+        self._verified = {}
+        self._paths = {}
+        self._read_only = False
+
+    def is_read_only(self):
+        """True when no consistent generation could be loaded; writing would destroy the evidence."""
+        return self._read_only
+
+    def get_generation(self):
+        return self._manifest.get('generation', 0) if self._manifest else 0
+
+    def _read_manifest(self):
+        try:
+            if os.path.exists(self._manifest_file):
+                with open(self._manifest_file, 'r') as f:
+                    return json.load(f)
+        except ValueError as e:
+            print(f"Ignoring damaged manifest {self._manifest_file}: {e}")
+        return None
+
+    @staticmethod
+    def _describe(data):
+        return {'sha256': hashlib.sha256(data).hexdigest(), 'size': len(data)}
+
+    @classmethod
+    def _describe_file(cls, path):
+        digest = hashlib.sha256()
+        size = 0
+        with open(path, 'rb') as f:
+            for chunk in iter(lambda: f.read(cls.CHUNK_SIZE), b''):
+                digest.update(chunk)
+                size += len(chunk)
+        return {'sha256': digest.hexdigest(), 'size': size}
+
+    @staticmethod
+    def _matches(description, expected):
+        return description['sha256'] == expected['sha256'] and description['size'] == expected['size']
+
+    def _file_path(self, path, expected):
+        """The manifest names the file it hashed, which may differ from path after a format change."""
+        if expected and 'file' in expected:
+            return os.path.join(self._data_folder, expected['file'])
+        return path
+
+    def is_mapped(self, path):
+        """True for formats read through mmap, including their .prev copies."""
+        if path.endswith(".prev"):
+            path = path[:-len(".prev")]
+        return path.endswith(self.MAPPED_EXTENSIONS)
+
+    def _fsync_folder(self):
+        if not hasattr(os, 'O_DIRECTORY'):          # directories cannot be opened on Windows
+            return
+        fd = os.open(self._data_folder, os.O_RDONLY | os.O_DIRECTORY)
+        try:
+            os.fsync(fd)
+        finally:
+            os.close(fd)
+
+    def _atomic_write(self, path, data):
+        temp_path = path + ".tmp"
+        with open(temp_path, 'wb') as f:
+            f.write(data)
+            f.flush()
+            os.fsync(f.fileno())
+        if os.path.exists(path):
+            os.replace(path, path + ".prev")
+        os.replace(temp_path, path)
+        self._fsync_folder()
+
+    def begin_generation(self):
+        """Groups the following writes into a single manifest generation."""
+        self._depth += 1
+
+    def commit_generation(self):
+        self._depth -= 1
+        if self._depth > 0 or not self._pending:
+            return
+        files = dict(self._manifest['files']) if self._manifest else {}
+        for collection, path in self._paths.items():
+            if collection not in files and collection not in self._pending and os.path.exists(path):
+                files[collection] = self._describe_file(path)          # adopt files written before manifests existed
+                files[collection]['file'] = os.path.basename(path)
+        files.update(self._pending)
+        manifest = {'generation': self.get_generation() + 1, 'files': files}
+        if self._manifest:
+            manifest['previous'] = {
+                'generation': self._manifest['generation'],
+                'files': self._manifest['files']
+            }
+        data = json.dumps(manifest, indent=4).encode('utf-8')
+        temp_path = self._manifest_file + ".tmp"
+        with open(temp_path, 'wb') as f:
+            f.write(data)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(temp_path, self._manifest_file)       # the rename is the commit point
+        self._fsync_folder()
+        self._manifest = manifest
+        self._pending = {}
+
+    def write(self, collection, path, data):
+        """Atomically replaces one snapshot file; returns the number of bytes written."""
+        if self._read_only:
+            raise IOError("storage is read-only because no consistent snapshot generation was found")
+        self._atomic_write(path, data)
+        self._pending[collection] = self._describe(data)
+        self._pending[collection]['file'] = os.path.basename(path)
+        if self._depth == 0:
+            self.begin_generation()
+            self.commit_generation()
+        return len(data)
+
+    @staticmethod
+    def _read_bytes(path):
+        if not os.path.exists(path):
+            return None
+        with open(path, 'rb') as f:
+            return f.read()
+
+    def _read_matching(self, path, expected):
+        """Returns (path, bytes) for whichever of the file and its .prev copy matches the expected hash.
+
+        Memory-mapped files are hashed in chunks and returned with bytes of None.
+        """
+        path = self._file_path(path, expected)
+        for candidate in (path, path + ".prev"):
+            if not os.path.exists(candidate):
+                continue
+            if self.is_mapped(candidate):
+                if self._matches(self._describe_file(candidate), expected):
+                    return candidate, None
+                continue
+            data = self._read_bytes(candidate)
+            if self._matches(self._describe(data), expected):
+                return candidate, data
+        return None
+
+    def _select(self, generation, paths):
+        chosen = {}
+        for collection, path in paths.items():
+            expected = generation['files'].get(collection)
+            if expected is None:              # never written since manifests were introduced
+                chosen[collection] = (path, None if self.is_mapped(path) else self._read_bytes(path))
+                continue
+            found = self._read_matching(path, expected)
+            if found is None:
+                return None
+            chosen[collection] = found
+        return chosen
+
+    def verify(self, paths):
+        """Picks the newest generation whose files all verify and caches their paths and bytes.
+
+        paths maps collection names to snapshot file paths. Returns the
+        generation number that was selected, or None for unmanaged files.
+        """
+        self._verified = {}
+        self._paths = dict(paths)
+        if not self._manifest:
+            return None
+        for generation in (self._manifest, self._manifest.get('previous')):
+            if not generation:
+                continue
+            chosen = self._select(generation, paths)
+            if chosen is not None:
+                if generation is not self._manifest:
+                    print(f"Snapshot generation {self._manifest['generation']} is damaged; "
+                          f"recovered generation {generation['generation']}")
+                self._verified = chosen
+                return generation['generation']
+        print("ERROR: no snapshot generation verified; storage is read-only until the data is repaired")
+        self._read_only = True
+        return None
+
+    def locate(self, collection, path):
+        """Returns (path, bytes) of the snapshot file to load for a collection.
+
+        The path is the verified copy when one exists; bytes is None when the
+        file was not cached (memory-mapped formats, or a file that failed
+        verification and is read as-is so its error surfaces).
+        """
+        if collection in self._verified:
+            return self._verified.pop(collection)
+        expected = self._manifest['files'].get(collection) if self._manifest else None
+        if expected:
+            found = self._read_matching(path, expected)
+            if found is not None:
+                return found
+        return self._file_path(path, expected), None
+
+    def read(self, collection, path):
+        """Returns the parsed records of a JSON snapshot file, or None if it does not exist."""
+        return self.parse(*self.locate(collection, path))
+
+    def parse(self, path, data=None):
+        """Parses a located JSON snapshot, falling back to its .prev copy if it is torn."""
+        if data is None:
+            data = self._read_bytes(path)
+        if data is None:
+            return None
+        try:
+            return json.loads(data)
+        except ValueError:
+            # A file torn by a crash outside any verified generation: try the previous copy
+            previous = self._read_bytes(path + ".prev")
+            if previous is not None:
+                try:
+                    records = json.loads(previous)
+                    print(f"{path} is damaged; loaded {path}.prev instead")
+                    return records
+                except ValueError:
+                    pass
+            self._read_only = True
+            raise
@@ -0,0 +1,287 @@
+# ==========================================
+# Project: Library Management System
+# Module: utils/sqlite_backend.py
+# Purpose: SQLite Storage Backend for the Database Facade
+# ==========================================
+
+import json
+import sqlite3
+import threading
+
+
+class SQLiteBackend:
+    """
+    Stores books, users and transactions in real SQLite tables.
+    Records travel in and out as the same dictionaries produced by the
+    models' to_dict(), so Database can swap it in for the JSON files.
+    """
+
+    # Column layout of every table; the first column is the primary key
+    COLUMNS = {
+        'books': [
+            'book_id', 'title', 'author', 'isbn', 'category', 'publication_year',
+            'is_available', 'borrower_id', 'total_borrows'
+        ],
+        'users': [
+            'person_id', 'role', 'name', 'email', 'phone', 'is_active',
+            'admin_level', 'permissions', 'employee_id', 'shift', 'books_issued',
+            'membership_date', 'borrowed_books', 'fine_amount', 'max_books'
+        ],
+        'transactions': [
+            'transaction_id', 'book_id', 'member_id', 'transaction_type',
+            'transaction_date', 'due_date', 'return_date', 'fine_amount',
+            'borrow_period', 'borrow_transaction_id'
+        ]
+    }
+
+    # Columns holding lists, stored as JSON text
+    JSON_COLUMNS = {'permissions', 'borrowed_books'}
+
+    # Columns holding booleans, stored as 0/1
+    BOOLEAN_COLUMNS = {'is_available', 'is_active'}
+
+    SCHEMA = """
+        CREATE TABLE IF NOT EXISTS books (
+            book_id INTEGER PRIMARY KEY,
+            title TEXT NOT NULL,
+            author TEXT NOT NULL,
+            isbn TEXT,
+            category TEXT,
+            publication_year TEXT,
+            is_available INTEGER NOT NULL DEFAULT 1,
+            borrower_id INTEGER,
+            total_borrows INTEGER NOT NULL DEFAULT 0
+        );
+        CREATE INDEX IF NOT EXISTS idx_books_isbn ON books (isbn);
+
+        CREATE TABLE IF NOT EXISTS users (
+            person_id INTEGER PRIMARY KEY,
+            role TEXT NOT NULL,
+            name TEXT NOT NULL,
+            email TEXT,
+            phone TEXT,
+            is_active INTEGER NOT NULL DEFAULT 1,
+            admin_level TEXT,
+            permissions TEXT,
+            employee_id TEXT,
+            shift TEXT,
+            books_issued INTEGER,
+            membership_date TEXT,
+            borrowed_books TEXT,
+            fine_amount REAL,
+            max_books INTEGER
+        );
+
+        CREATE TABLE IF NOT EXISTS transactions (
+            transaction_id INTEGER PRIMARY KEY,
+            book_id INTEGER NOT NULL,
+            member_id INTEGER NOT NULL,
+            transaction_type TEXT NOT NULL,
+            transaction_date TEXT NOT NULL,
+            due_date TEXT,
+            return_date TEXT,
+            fine_amount REAL NOT NULL DEFAULT 0,
+            borrow_period INTEGER,
+            borrow_transaction_id INTEGER
+        );
+        CREATE INDEX IF NOT EXISTS idx_transactions_book ON transactions (book_id);
+        CREATE INDEX IF NOT EXISTS idx_transactions_member ON transactions (member_id);
+        CREATE INDEX IF NOT EXISTS idx_transactions_open_loans
+            ON transactions (book_id, member_id) WHERE return_date IS NULL;
+    """
+
+    def __init__(self, db_file):
+        self._db_file = db_file
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(db_file, check_same_thread=False)
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        self._connection.execute("PRAGMA synchronous=NORMAL")
+        self._connection.executescript(self.SCHEMA)
+
+    def get_db_file(self):
+        return self._db_file
+
+    def close(self):
+        with self._lock:
+            self._connection.close()
+
+    def _to_row(self, collection, record):
+        row = []
+        for column in self.COLUMNS[collection]:
+            value = record.get(column)
+            if column in self.JSON_COLUMNS and value is not None:
+                value = json.dumps(value)
+            elif column in self.BOOLEAN_COLUMNS and value is not None:
+                value = 1 if value else 0
+            row.append(value)
+        return row
+
+    @staticmethod
+    def _row_size(row):
+        """Bytes of the column values bound for one row, for the write statistics."""
+        return sum(len(str(value).encode('utf-8')) for value in row if value is not None)
+
+    def _from_row(self, collection, row):
+        record = {}
+        for column, value in zip(self.COLUMNS[collection], row):
+            if value is None:          # column does not apply to this record (e.g. role-specific)
+                continue
+            if column in self.JSON_COLUMNS:
+                value = json.loads(value)
+            elif column in self.BOOLEAN_COLUMNS:
+                value = bool(value)
+            record[column] = value
+        return record
+
+    def _upsert_sql(self, collection):
+        columns = self.COLUMNS[collection]
+        key = columns[0]
+        updates = ", ".join(f"{column} = excluded.{column}" for column in columns[1:])
+        return (f"INSERT INTO {collection} ({', '.join(columns)}) "
+                f"VALUES ({', '.join('?' for _ in columns)}) "
+                f"ON CONFLICT({key}) DO UPDATE SET {updates}")
+
+    def load_records(self, collection):
+        """Returns every record of a collection as a list of dictionaries."""
+        key = self.COLUMNS[collection][0]
+        with self._lock:
+            cursor = self._connection.execute(
+                f"SELECT {', '.join(self.COLUMNS[collection])} FROM {collection} ORDER BY {key}"
+            )
+            return [self._from_row(collection, row) for row in cursor]
+
+    def iter_records(self, collection, page_size=1000):
+        """Yields every record of a collection in key order, fetching one page at a time.
+
+        Pages are read by key ranges, so the lock is never held between pages.
+        """
+        key = self.COLUMNS[collection][0]
+        sql = (f"SELECT {', '.join(self.COLUMNS[collection])} FROM {collection} "
+               f"WHERE {key} > ? ORDER BY {key} LIMIT ?")
+        last_key = -1
+        while True:
+            with self._lock:
+                rows = self._connection.execute(sql, (last_key, page_size)).fetchall()
+            for row in rows:
+                yield self._from_row(collection, row)
+            if len(rows) < page_size:
+                return
+            last_key = rows[-1][0]
+
+    def get_max_id(self, collection):
+        key = self.COLUMNS[collection][0]
+        with self._lock:
+            row = self._connection.execute(f"SELECT MAX({key}) FROM {collection}").fetchone()
+        return row[0] or 0
+
+    def query_transactions(self, member_id=None, book_id=None, open_only=False, start_date=None,
+                           end_date=None, transaction_type=None, offset=0, limit=None):
+        """Returns matching transaction records, oldest first, using the table indexes."""
+        clauses = []
+        params = []
+        if member_id is not None:
+            clauses.append("member_id = ?")
+            params.append(member_id)
+        if book_id is not None:
+            clauses.append("book_id = ?")
+            params.append(book_id)
+        if open_only:
+            clauses.append("return_date IS NULL AND transaction_type = 'borrow'")
+        if transaction_type:
+            clauses.append("transaction_type = ?")
+            params.append(transaction_type)
+        if start_date:
+            clauses.append("transaction_date >= ?")
+            params.append(start_date)
+        if end_date:
+            clauses.append("transaction_date <= ?")
+            params.append(end_date)
+        sql = f"SELECT {', '.join(self.COLUMNS['transactions'])} FROM transactions"
+        if clauses:
+            sql += " WHERE " + " AND ".join(clauses)
+        sql += " ORDER BY transaction_id LIMIT ? OFFSET ?"
+        params.extend([limit if limit is not None else -1, offset])
+        with self._lock:
+            cursor = self._connection.execute(sql, params)
+            return [self._from_row('transactions', row) for row in cursor]
+
+    def query_transaction_page(self, member_id=None, book_id=None, before_id=None, limit=20):
+        """Returns up to limit transaction records with an id below before_id, newest first."""
+        clauses = []
+        params = []
+        if member_id is not None:
+            clauses.append("member_id = ?")
+            params.append(member_id)
+        if book_id is not None:
+            clauses.append("book_id = ?")
+            params.append(book_id)
+        if before_id is not None:
+            clauses.append("transaction_id < ?")
+            params.append(before_id)
+        sql = f"SELECT {', '.join(self.COLUMNS['transactions'])} FROM transactions"
+        if clauses:
+            sql += " WHERE " + " AND ".join(clauses)
+        sql += " ORDER BY transaction_id DESC LIMIT ?"
+        params.append(limit)
+        with self._lock:
+            cursor = self._connection.execute(sql, params)
+            return [self._from_row('transactions', row) for row in cursor]
+
+    def save_changes(self, dirty):
+        """Applies dirty records as single-row UPSERTs/DELETEs in one transaction.
+
+        dirty maps each collection name to {record id: model object}, where
+        None marks a deleted record. Returns the bytes of the values sent.
+        """
+        size = 0
+        with self._lock, self._connection:
+            for collection, records in dirty.items():
+                if not records:
+                    continue
+                key = self.COLUMNS[collection][0]
+                upsert = self._upsert_sql(collection)
+                for record_id, record in records.items():
+                    if record is None:
+                        self._connection.execute(f"DELETE FROM {collection} WHERE {key} = ?", (record_id,))
+                        size += self._row_size([record_id])
+                    else:
+                        row = self._to_row(collection, record.to_dict())
+                        self._connection.execute(upsert, row)
+                        size += self._row_size(row)
+        return size
+
+    def replace_collection(self, collection, records):
+        """Replaces the whole table with the given record dictionaries in one transaction.
+
+        Returns the bytes of the values sent.
+        """
+        columns = self.COLUMNS[collection]
+        size = 0
+
+        def rows():
+            nonlocal size
+            for record in records:
+                row = self._to_row(collection, record)
+                size += self._row_size(row)
+                yield row
+
+        with self._lock, self._connection:
+            self._connection.execute(f"DELETE FROM {collection}")
+            self._connection.executemany(
+                f"INSERT INTO {collection} ({', '.join(columns)}) VALUES ({', '.join('?' for _ in columns)})",
+                rows()
+            )
+        return size
+
+    def import_records(self, collection, records):
+        """Replaces a table with a stream of record dictionaries; returns how many were imported."""
+        count = 0
+
+        def counted():
+            nonlocal count
+            for record in records:
+                count += 1
+                yield record
+
+        self.replace_collection(collection, counted())
+        return count
@@ -0,0 +1,242 @@
+# ==========================================
+# Project: Library Management System
+# Module: utils/transaction_archive.py
+# Purpose: Month-Partitioned Transaction Storage with Compressed Archive
+# ==========================================
+
+import gzip
+import json
+import lzma
+import os
+import threading
+from contextlib import contextmanager
+from datetime import datetime, timedelta
+
+try:
+    import fcntl            # POSIX: appends and compaction from different processes take turns
+except ImportError:
+    fcntl = None            # Windows: one writing process per data folder
+
+
+class TransactionArchive:
+    """
+    Stores transactions as one JSON-lines file per month, named after the
+    transaction date (transactions/2026-10.jsonl). A changed transaction is
+    appended to its month again and the last line wins, so writes never
+    rewrite history. Compaction moves closed loans of old months into
+    compressed archive partitions (transactions/archive/2025-01.jsonl.gz).
+    Appends and compaction hold a file lock, so a compaction never
+    replaces a month file while a running library appends to it.
+    """
+
+    COMPRESSORS = {
+        'gzip': ('.jsonl.gz', gzip.open),
+        'lzma': ('.jsonl.xz', lzma.open)
+    }
+
+    def __init__(self, folder, compression='gzip'):
+        self._folder = folder
+        self._archive_folder = os.path.join(folder, "archive")
+        self._compression = compression if compression in self.COMPRESSORS else 'gzip'
+        self._lock_file = os.path.join(folder, "partitions.lock")
+        self._lock = threading.Lock()
+        os.makedirs(self._archive_folder, exist_ok=True)
+
+    @contextmanager
+    def _file_locked(self):
+        with self._lock:
+            if fcntl is None:
+                yield
+                return
+            with open(self._lock_file, 'a') as lock:
+                fcntl.flock(lock.fileno(), fcntl.LOCK_EX)
+                try:
+                    yield
+                finally:
+                    fcntl.flock(lock.fileno(), fcntl.LOCK_UN)
+
+    @staticmethod
+    def _fsync_folder(folder):
+        if not hasattr(os, 'O_DIRECTORY'):          # directories cannot be opened on Windows
+            return
+        fd = os.open(folder, os.O_RDONLY | os.O_DIRECTORY)
+        try:
+            os.fsync(fd)
+        finally:
+            os.close(fd)
+
+    def get_folder(self):
+        return self._folder
+
+    @staticmethod
+    def month_of(record):
+        return record['transaction_date'][:7]
+
+    def _hot_path(self, month):
+        return os.path.join(self._folder, f"{month}.jsonl")
+
+    def _archive_paths(self, month):
+        return [os.path.join(self._archive_folder, month + extension)
+                for extension, _ in self.COMPRESSORS.values()]
+
+    def _open_archive(self, path, mode):
+        for extension, opener in self.COMPRESSORS.values():
+            if path.endswith(extension):
+                return opener(path, mode)
+        raise ValueError(f"Unknown archive format: {path}")
+
+    def hot_months(self):
+        return sorted(name[:-len(".jsonl")] for name in os.listdir(self._folder) if name.endswith(".jsonl"))
+
+    def archived_months(self):
+        months = set()
+        for name in os.listdir(self._archive_folder):
+            for extension in (extension for extension, _ in self.COMPRESSORS.values()):
+                if name.endswith(extension):
+                    months.add(name[:-len(extension)])
+        return sorted(months)
+
+    def months(self):
+        return sorted(set(self.hot_months()) | set(self.archived_months()))
+
+    @staticmethod
+    def _read_lines(f, by_id):
+        for line in f:
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                record = json.loads(line)
+            except ValueError:
+                continue          # torn last line after a crash
+            by_id[record['transaction_id']] = record
+
+    def read_month(self, month, include_hot=True, include_archive=True):
+        """Returns the latest version of every transaction in a month, in id order."""
+        by_id = {}
+        if include_archive:
+            for path in self._archive_paths(month):
+                if os.path.exists(path):
+                    with self._open_archive(path, 'rt') as f:
+                        self._read_lines(f, by_id)
+        hot_path = self._hot_path(month)
+        if include_hot and os.path.exists(hot_path):
+            with open(hot_path, 'r') as f:
+                self._read_lines(f, by_id)
+        return [by_id[transaction_id] for transaction_id in sorted(by_id)]
+
+    def iter_records(self, start_date=None, end_date=None):
+        """Streams transactions month by month, skipping partitions outside the date range."""
+        start_month = start_date[:7] if start_date else None
+        end_month = end_date[:7] if end_date else None
+        for month in self.months():
+            if start_month and month < start_month:
+                continue
+            if end_month and month > end_month:
+                continue
+            for record in self.read_month(month):
+                yield record
+
+    def iter_open_records(self):
+        """Yields open loans. Archives only ever hold closed loans, so they are skipped."""
+        for month in self.hot_months():
+            for record in self.read_month(month, include_archive=False):
+                if record['transaction_type'] == 'borrow' and record.get('return_date') is None:
+                    yield record
+
+    def get_max_id(self):
+        """Ids grow with time, so the newest month holds the highest id."""
+        months = self.months()
+        if not months:
+            return 0
+        records = self.read_month(months[-1])
+        return records[-1]['transaction_id'] if records else 0
+
+    def append(self, records):
+        """Appends new or changed transaction records to their month partitions.
+
+        Returns the number of bytes written.
+        """
+        lines_by_month = {}
+        for record in records:
+            line = json.dumps(record, separators=(',', ':')) + "\n"
+            lines_by_month.setdefault(self.month_of(record), []).append(line)
+        written = 0
+        with self._file_locked():
+            for month, lines in lines_by_month.items():
+                data = "".join(lines).encode('utf-8')
+                with open(self._hot_path(month), 'ab') as f:
+                    f.write(data)
+                written += len(data)
+        return written
+
+    def import_records(self, records):
+        """Splits a full list of transaction records into month partitions."""
+        by_month = {}
+        for record in records:
+            by_month.setdefault(self.month_of(record), []).append(record)
+        with self._file_locked():
+            for month, month_records in by_month.items():
+                self._write_hot(month, month_records)
+        return len(records)
+
+    def _write_hot(self, month, records):        # called with the file lock held
+        path = self._hot_path(month)
+        if not records:
+            if os.path.exists(path):
+                os.remove(path)
+            return
+        with open(path + ".tmp", 'w') as f:
+            for record in records:
+                f.write(json.dumps(record, separators=(',', ':')) + "\n")
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(path + ".tmp", path)
+        self._fsync_folder(self._folder)
+
+    def _write_archive(self, month, records):
+        extension, opener = self.COMPRESSORS[self._compression]
+        path = os.path.join(self._archive_folder, month + extension)
+        with open(path + ".tmp", 'wb') as raw:
+            with opener(raw, 'wt') as f:
+                for record in records:
+                    f.write(json.dumps(record, separators=(',', ':')) + "\n")
+            raw.flush()
+            os.fsync(raw.fileno())              # the archive must be on disk before the hot copy is dropped
+        os.replace(path + ".tmp", path)
+        self._fsync_folder(self._archive_folder)
+        for other_path in self._archive_paths(month):          # drop the month's archive in the other format
+            if other_path != path and os.path.exists(other_path):
+                os.remove(other_path)
+
+    def compact(self, max_age_days=365, today=None):
+        """Archives closed loans older than max_age_days and dedupes the hot partitions.
+
+        Returns the number of transactions moved into compressed archives.
+        """
+        today = today or datetime.now()
+        cutoff_month = (today - timedelta(days=max_age_days)).strftime("%Y-%m")
+        archived = 0
+        for month in self.hot_months():
+            with self._file_locked():          # a month is read and rewritten with appends held off
+                archived += self._compact_month(month, month < cutoff_month)
+        return archived
+
+    def _compact_month(self, month, archive_closed):
+        records = self.read_month(month, include_archive=False)
+        if not archive_closed:
+            self._write_hot(month, records)
+            return 0
+        closed = []
+        still_open = []
+        for record in records:
+            if record['transaction_type'] == 'borrow' and record.get('return_date') is None:
+                still_open.append(record)
+            else:
+                closed.append(record)
+        if closed:
+            merged = {r['transaction_id']: r for r in self.read_month(month, include_hot=False)}
+            merged.update((r['transaction_id'], r) for r in closed)
+            self._write_archive(month, [merged[i] for i in sorted(merged)])
+        self._write_hot(month, still_open)
+        return len(closed)
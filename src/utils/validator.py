@@ -1,64 +1,157 @@
-# ==========================================
-# Project: Library Management System
-# Module: utils/validator.py
-# Purpose: Data Validation & Integrity Checks
-# Role: Member 4 - Logic Specialist
-# ==========================================
-
-from datetime import datetime
-import re # سنستخدمه للتحقق من الإيميل بشكل أدق
-
-class Validator:
-    """
-    Provides static utility methods to validate various system inputs.
-    Ensures data integrity before processing or storage.
-    """
-
-    @staticmethod
-    def validate_email(email: str) -> bool:
-        """Validates email format using basic pattern matching."""
-        if not email:
-            return False
-        # لمسة احترافية: التحقق من وجود @ و . مع التأكد من ترتيبهم
-        return '@' in email and '.' in email.split('@')[-1]
-
-    @staticmethod
-    def validate_phone(phone: str) -> bool:
-        """Sanitizes and validates phone numbers (min 10 digits)."""
-        # Cleaning the input from common formatting characters
-        cleaned = phone.replace('-', '').replace(' ', '').replace('(', '').replace(')', '')
-        return len(cleaned) >= 10 and cleaned.isdigit()
-
-    @staticmethod
-    def validate_isbn(isbn: str) -> bool:
-        """Validates ISBN-10 or ISBN-13 formats."""
-        cleaned = isbn.replace('-', '').replace(' ', '')
-        # Check for standard ISBN lengths
-        if len(cleaned) in [10, 13] and cleaned.isdigit():
-            return True
-        return False
-
-    @staticmethod
-    def validate_year(year: str) -> bool:
-        """Validates that the publication year is realistic."""
-        try:
-            year_int = int(year)
-            current_year = datetime.now().year
-            # Logical range: from the first printed book to the current year
-            return 1000 <= year_int <= current_year
-        except (ValueError, TypeError):
-            return False
-
-    @staticmethod
-    def validate_date(date_string: str) -> bool:
-        """Validates date format (YYYY-MM-DD)."""
-        try:
-            datetime.strptime(date_string, "%Y-%m-%d")
-            return True
-        except (ValueError, TypeError):
-            return False
-
-    @staticmethod
-    def validate_non_empty(value: str) -> bool:
-        """Ensures the input is not just whitespace."""
-        return bool(value and value.strip())
+# ==========================================
+# Project: Library Management System
+# Module: utils/validator.py
+# Purpose: Data Validation & Integrity Checks
+# Role: Member 4 - Logic Specialist
+# ==========================================
+
+from datetime import datetime
+import re # سنستخدمه للتحقق من الإيميل بشكل أدق
+
+class Validator:
+    """
+    Provides static utility methods to validate various system inputs.
+    Ensures data integrity before processing or storage.
+    """
+
+    @staticmethod
+    def validate_email(email: str) -> bool:
+        """Validates email format using basic pattern matching."""
+        if not email:
+            return False
+        # لمسة احترافية: التحقق من وجود @ و . مع التأكد من ترتيبهم
+        return '@' in email and '.' in email.split('@')[-1]
+
+    @staticmethod
+    def validate_phone(phone: str) -> bool:
+        """Sanitizes and validates phone numbers (min 10 digits)."""
+        # Cleaning the input from common formatting characters
+        cleaned = phone.replace('-', '').replace(' ', '').replace('(', '').replace(')', '')
+        return len(cleaned) >= 10 and cleaned.isdigit()
+
+    @staticmethod
+    def validate_isbn(isbn: str) -> bool:
+        """Validates ISBN-10 or ISBN-13 formats."""
+        cleaned = isbn.replace('-', '').replace(' ', '')
+        # Check for standard ISBN lengths
+        if len(cleaned) in [10, 13] and cleaned.isdigit():
+            return True
+        return False
+
+    @staticmethod
+    def normalize_isbn(isbn: str) -> str:
+        """Returns the ISBN-13 form of an ISBN, so the same book always has one lookup key.
+
+        Hyphens and spaces are stripped and ISBN-10s are converted to
+        ISBN-13 (978 prefix, recomputed check digit). Anything that is not
+        an ISBN is returned stripped, so it can still be matched exactly.
+        """
+        cleaned = str(isbn).replace('-', '').replace(' ', '').upper()
+        if len(cleaned) == 10 and cleaned[:9].isdigit() and (cleaned[9].isdigit() or cleaned[9] == 'X'):
+            body = "978" + cleaned[:9]
+            total = sum(int(digit) * (3 if position % 2 else 1) for position, digit in enumerate(body))
+            return body + str((10 - total % 10) % 10)
+        return cleaned
+
+    @staticmethod
+    def validate_year(year: str) -> bool:
+        """Validates that the publication year is realistic."""
+        try:
+            year_int = int(year)
+            current_year = datetime.now().year
+            # Logical range: from the first printed book to the current year
+            return 1000 <= year_int <= current_year
+        except (ValueError, TypeError):
+            return False
+
+    @staticmethod
+    def validate_date(date_string: str) -> bool:
+        """Validates date format (YYYY-MM-DD)."""
+        try:
+            datetime.strptime(date_string, "%Y-%m-%d")
+            return True
+        except (ValueError, TypeError):
+            return False
+
+    @staticmethod
+    def validate_non_empty(value: str) -> bool:
+        """Ensures the input is not just whitespace."""
+        return bool(value and value.strip())
+
+    @staticmethod
+    def parse_id_list(text: str) -> list:
+        """Parses ids separated by commas or spaces (e.g. "3, 7 12"); raises ValueError on bad input."""
+        ids = [int(part) for part in re.split(r"[,\s]+", text.strip()) if part]
+        if not ids:
+            raise ValueError("No IDs given")
+        return ids
+
+    @staticmethod
+    def get_book_error(title, author, isbn, publication_year):
+        """Returns the first problem with a book's fields, or None if they are valid."""
+        if not Validator.validate_non_empty(title):
+            return "Title cannot be empty"
+        if not Validator.validate_non_empty(author):
+            return "Author cannot be empty"
+        if not Validator.validate_isbn(isbn):
+            return "Invalid ISBN format"
+        if not Validator.validate_year(publication_year):
+            return "Invalid publication year"
+        return None
+
+    @staticmethod
+    def get_contact_error(email, phone):
+        """Returns the first problem with a user's contact details, or None if they are valid."""
+        if not Validator.validate_email(email):
+            return "Invalid email format"
+        if not Validator.validate_phone(phone):
+            return "Invalid phone format"
+        return None
+
+    @staticmethod
+    def validate_book_rows(rows):
+        """Validates a batch of book rows; returns ([(row number, fields)], [(row number, error)]).
+
+        rows is a list of (row number, dict with title/author/isbn/category/publication_year).
+        """
+        valid = []
+        errors = []
+        for row_number, row in rows:
+            if row is None:
+                errors.append((row_number, "Could not parse row"))
+                continue
+            fields = {name: str(row.get(name) or '').strip()
+                      for name in ('title', 'author', 'isbn', 'category', 'publication_year')}
+            error = Validator.get_book_error(fields['title'], fields['author'], fields['isbn'],
+                                             fields['publication_year'])
+            if error:
+                errors.append((row_number, error))
+            else:
+                valid.append((row_number, fields))
+        return valid, errors
+
+    @staticmethod
+    def validate_member_rows(rows):
+        """Validates a batch of member rows; returns ([(row number, fields)], [(row number, error)]).
+
+        rows is a list of (row number, dict with name/email/phone and optional membership_date).
+        """
+        valid = []
+        errors = []
+        for row_number, row in rows:
+            if row is None:
+                errors.append((row_number, "Could not parse row"))
+                continue
+            fields = {name: str(row.get(name) or '').strip()
+                      for name in ('name', 'email', 'phone', 'membership_date')}
+            if not Validator.validate_non_empty(fields['name']):
+                error = "Name cannot be empty"
+            elif fields['membership_date'] and not Validator.validate_date(fields['membership_date']):
+                error = "Invalid membership date"
+            else:
+                error = Validator.get_contact_error(fields['email'], fields['phone'])
+            if error:
+                errors.append((row_number, error))
+            else:
+                valid.append((row_number, fields))
+        return valid, errors
@@ -1,3 +1,8 @@
+from utils.validator import Validator
+
+RESULTS_SHOWN = 20      # title/author searches list this many of the best matches
+
+
 def print_separator():
     print("\n" + "="*60 + "\n")
 
@@ -40,8 +45,8 @@ def display_user_menu():
 
 def display_transaction_menu():
     print("\n===== TRANSACTIONS =====")
-    print("1. Borrow Book")
-    print("2. Return Book")
+    print("1. Borrow Book(s)")
+    print("2. Return Book(s)")
     print("3. Pay Fine")
     print("4. View Member's Borrowed Books")
     print("5. View All Transactions")
@@ -285,23 +290,23 @@ def handle_transactions(library):
         choice = input("Enter your choice: ").strip()
         
         if choice == "1":
-            print("\n--- Borrow Book ---")
+            print("\n--- Borrow Books ---")
             try:
-                book_id = int(input("Enter book ID: ").strip())
+                book_ids = Validator.parse_id_list(input("Enter book ID(s), comma separated: "))
                 member_id = int(input("Enter member ID: ").strip())
                 period = input("Enter borrow period in days (default 14): ").strip()
                 borrow_period = int(period) if period else 14
-                success, message = library.borrow_book(book_id, member_id, borrow_period)
+                success, message = library.borrow_books(member_id, book_ids, borrow_period)
                 print(message)
             except ValueError:
                 print("Invalid input")
         
         elif choice == "2":
-            print("\n--- Return Book ---")
+            print("\n--- Return Books ---")
             try:
-                book_id = int(input("Enter book ID: ").strip())
+                book_ids = Validator.parse_id_list(input("Enter book ID(s), comma separated: "))
                 member_id = int(input("Enter member ID: ").strip())
-                success, message = library.return_book(book_id, member_id)
+                success, message = library.return_books(book_ids, member_id)
                 print(message)
             except ValueError:
                 print("Invalid input")
@@ -349,6 +354,26 @@ def handle_transactions(library):
             print("Invalid choice")
 
 
+def find_best_books(library, text, field):
+    # Title/author searches: the RESULTS_SHOWN best matches and how many there were in all
+    books, total, exact = library.search_books_best(text, field, limit=RESULTS_SHOWN)
+    if books and not exact:
+        print("\nNo exact matches. Closest matches:")
+    return books, total
+
+
+def print_best_books(books, total):
+    if books:
+        for book in books:
+            print_separator()
+            print(book.display_info())
+        print_separator()
+        if total > len(books):
+            print(f"Showing the {len(books)} best of {total} matches")
+    else:
+        print("No books found")
+
+
 def handle_search(library):
     while True:
         display_search_menu()
@@ -357,26 +382,12 @@ def handle_search(library):
         if choice == "1":
             print("\n--- Search by Title ---")
             title = input("Enter title: ").strip()
-            books = library.search_books_by_title(title)
-            if books:
-                for book in books:
-                    print_separator()
-                    print(book.display_info())
-                print_separator()
-            else:
-                print("No books found")
+            print_best_books(*find_best_books(library, title, "title"))
         
         elif choice == "2":
             print("\n--- Search by Author ---")
             author = input("Enter author: ").strip()
-            books = library.search_books_by_author(author)
-            if books:
-                for book in books:
-                    print_separator()
-                    print(book.display_info())
-                print_separator()
-            else:
-                print("No books found")
+            print_best_books(*find_best_books(library, author, "author"))
         
         elif choice == "3":
             print("\n--- Search by ISBN ---")
@@ -467,6 +478,25 @@ def handle_reports(library):
             print("Invalid choice")
 
 
+def show_transaction_history(library, member_id, page_size=10):
+    """Prints a member's transactions newest first, one page at a time."""
+    print("\n--- My Recent Activity ---")
+    cursor = None
+    while True:
+        transactions, cursor = library.get_transaction_page(member_id=member_id, cursor=cursor, limit=page_size)
+        if not transactions:
+            print("No activity yet")
+            return
+        for trans in transactions:
+            book = library.get_book_by_id(trans.get_book_id())
+            title = book.get_title() if book else f"Book {trans.get_book_id()}"
+            print(f"{trans.get_transaction_date()}  {trans.get_transaction_type().capitalize():<7} {title}")
+        if cursor is None:
+            return
+        if input("\nShow older activity? (y/n): ").strip().lower() != "y":
+            return
+
+
 def handle_member_portal(library, auth_system):
     credentials = auth_system.load_credentials()
     username = auth_system.get_current_user()
@@ -492,17 +522,15 @@ def handle_member_portal(library, auth_system):
                 for book in books:
                     print_separator()
                     print(book.display_info())
-                    transactions = library.get_member_transactions(member_id)
-                    for trans in transactions:
-                        if (trans.get_book_id() == book.get_book_id() and 
-                            trans.get_transaction_type() == "borrow" and 
-                            trans.get_return_date() is None):
-                            print(f"\nDue Date: {trans.get_due_date()}")
-                            if trans.is_overdue():
-                                print(f"⚠️ OVERDUE by {trans.get_days_overdue()} days!")
+                    trans = library.get_open_loan(book.get_book_id(), member_id)
+                    if trans:
+                        print(f"\nDue Date: {trans.get_due_date()}")
+                        if trans.is_overdue():
+                            print(f"⚠️ OVERDUE by {trans.get_days_overdue()} days!")
                 print_separator()
             else:
                 print("You have no borrowed books")
+            show_transaction_history(library, member_id)
             input("\nPress Enter to continue...")
         
         elif choice == "3":
@@ -544,14 +572,12 @@ def handle_member_search(library):
         if choice == "1":
             print("\n--- Search by Title ---")
             title = input("Enter title: ").strip()
-            books = library.search_books_by_title(title)
-            display_book_results(books)
+            display_book_results(*find_best_books(library, title, "title"))
         
         elif choice == "2":
             print("\n--- Search by Author ---")
             author = input("Enter author: ").strip()
-            books = library.search_books_by_author(author)
-            display_book_results(books)
+            display_book_results(*find_best_books(library, author, "author"))
         
         elif choice == "3":
             print("\n--- Search by Category ---")
@@ -571,9 +597,12 @@ def handle_member_search(library):
             print("Invalid choice")
 
 
-def display_book_results(books):
+def display_book_results(books, total=None):
     if books:
-        print(f"\nFound {len(books)} book(s):\n")
+        if total is not None and total > len(books):
+            print(f"\nFound {total} book(s), showing the {len(books)} best matches:\n")
+        else:
+            print(f"\nFound {len(books)} book(s):\n")
         for book in books:
             print_separator()
             print(f"Book ID: {book.get_book_id()}")